@@ -0,0 +1,192 @@
+"""Shared fixtures and the JSON baseline regression check for the settings benchmarks."""
+
+import json
+import platform
+import timeit
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from cjm_fasthtml_settings.core.cache import config_cache, config_index
+from cjm_fasthtml_settings.core.config import get_app_config_schema
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Fastest round (seconds) of each benchmark in this run by ID, and the regressions found against the baseline
+_timings_key = pytest.StashKey[Dict[str, float]]()
+_regressions_key = pytest.StashKey[list]()
+_calibration_key = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("settings benchmarks")
+    group.addoption("--baseline", default=None,
+                    help="Compare against the baseline timings in this JSON file (no comparison without it)")
+    group.addoption("--save-baseline", action="store_true",
+                    help="Write this run's timings to the baseline file (default: benchmarks/baseline.json) instead of comparing")
+    group.addoption("--regression-threshold", type=float, default=0.5,
+                    help="Fail when a benchmark is this fraction slower than its baseline (default: 0.5)")
+
+
+def _calibrate() -> float:  # Seconds for a fixed pure-Python workload
+    """Time a fixed dict and JSON workload to measure how fast this machine currently runs Python."""
+    data = {f"key_{i}": i for i in range(200)}
+    
+    def workload():
+        for _ in range(20):
+            json.loads(json.dumps({**data, "extra": True}))
+    
+    return min(timeit.repeat(workload, number=5, repeat=7))
+
+
+def _baseline_path(config) -> Path:  # Baseline file to compare with or save to
+    """Return the `--baseline` file, or the default location when only saving."""
+    baseline = config.getoption("baseline")
+    return Path(baseline) if baseline is not None else BASELINE_PATH
+
+
+def pytest_configure(config):
+    baseline = config.getoption("baseline")
+    if baseline is not None and not config.getoption("save_baseline") and not Path(baseline).exists():
+        raise pytest.UsageError(f"Baseline file not found: {baseline} (record one with --save-baseline)")
+    config.stash[_timings_key] = {}
+    config.stash[_regressions_key] = []
+    # Measured at the start and end of the run; the faster one is used
+    config.stash[_calibration_key] = [_calibrate()]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item):
+    """Record the fastest round of each benchmark before its fixture is torn down."""
+    benchmark = getattr(item, "funcargs", {}).get("benchmark")
+    # `stats` stays None when the benchmark didn't run (e.g. with --benchmark-disable)
+    if benchmark is not None and benchmark.stats is not None:
+        # The fastest round is the least affected by scheduling and GC noise, so it is what baselines compare
+        # Keyed relative to this directory so baselines match whether pytest runs here or from the repo root
+        name = f"{item.path.relative_to(Path(__file__).parent).as_posix()}::{item.name}"
+        item.config.stash[_timings_key][name] = benchmark.stats.stats.min
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Save the timings as the new baseline, or fail the run if any benchmark regressed."""
+    config = session.config
+    timings = config.stash[_timings_key]
+    if not timings:
+        return
+    # Without --baseline only saving runs; timings are machine-specific, so comparing is opt-in
+    if config.getoption("baseline") is None and not config.getoption("save_baseline"):
+        return
+    path = _baseline_path(config)
+    config.stash[_calibration_key].append(_calibrate())
+    calibration = min(config.stash[_calibration_key])
+    
+    if config.getoption("save_baseline"):
+        baseline = {}
+        if path.exists():
+            # Entries not re-run by this session are rescaled to its calibration
+            saved = json.loads(path.read_text())
+            scale = calibration / saved["calibration"]
+            baseline = {name: seconds * scale for name, seconds in saved["benchmarks"].items()}
+        path.write_text(json.dumps({
+            "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                        "processor": platform.machine()},
+            "calibration": calibration,
+            "benchmarks": dict(sorted({**baseline, **timings}.items()))
+        }, indent=2) + "\n")
+        return
+    
+    saved = json.loads(path.read_text())
+    baseline = saved["benchmarks"]
+    # Timings are scaled to the machine speed the baseline was recorded at
+    scale = saved["calibration"] / calibration
+    threshold = config.getoption("regression_threshold")
+    regressions = config.stash[_regressions_key]
+    for name, fastest in sorted(timings.items()):
+        fastest *= scale
+        expected = baseline.get(name)
+        if expected is not None and fastest > expected * (1 + threshold):
+            regressions.append((name, expected, fastest))
+    if regressions:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if config.getoption("save_baseline") and config.stash[_timings_key]:
+        terminalreporter.write_line(f"Saved {len(config.stash[_timings_key])} baseline timings to {_baseline_path(config)}")
+    regressions = config.stash[_regressions_key]
+    if not regressions:
+        return
+    threshold = config.getoption("regression_threshold")
+    terminalreporter.section(f"benchmark regressions (more than {threshold:.0%} slower than baseline, "
+                             f"scaled to the baseline machine speed)", red=True)
+    for name, expected, fastest in regressions:
+        terminalreporter.write_line(
+            f"{name}: {fastest * 1e6:.2f}us vs baseline {expected * 1e6:.2f}us ({fastest / expected - 1:+.0%})"
+        )
+
+
+def make_schema(
+    name: str,  # Schema name
+    field_count: int  # Number of properties
+) -> Dict[str, Any]:  # Schema with a mix of field kinds
+    """Build a schema whose properties cycle through the string, integer, number, boolean and array kinds."""
+    kinds = [
+        {"type": "string", "default": "value"},
+        {"type": "integer", "default": 1, "minimum": 0},
+        {"type": "number", "default": 0.5},
+        {"type": "boolean", "default": False},
+        {"type": "array", "items": {"type": "string"}, "default": []},
+    ]
+    return {
+        "name": name,
+        "title": name.title(),
+        "type": "object",
+        "properties": {
+            f"field_{i}": {"title": f"Field {i}", **kinds[i % len(kinds)]} for i in range(field_count)
+        },
+    }
+
+
+def make_form_data(
+    schema: Dict[str, Any]  # Schema to submit a form for
+) -> Dict[str, str]:  # Form data as a browser would submit it
+    """Build raw form data with a string value for every non-boolean field and every other checkbox ticked."""
+    form_data = {}
+    for i, (name, prop) in enumerate(schema["properties"].items()):
+        prop_type = prop.get("type")
+        if prop_type == "boolean":
+            if i % 2:
+                form_data[name] = "on"
+        elif prop_type == "integer":
+            form_data[name] = str(i)
+        elif prop_type == "number":
+            form_data[name] = f"{i}.5"
+        elif prop_type == "array":
+            form_data[name] = "['a', 'b']"
+        else:
+            form_data[name] = f"text {i}"
+    return form_data
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    """Start every benchmark without configurations cached by earlier ones."""
+    config_cache.invalidate()
+    config_index.invalidate()
+    yield
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def app_schema():
+    return get_app_config_schema(app_title="Benchmark App")
+
+
+@pytest.fixture(scope="session")
+def large_schema():
+    return make_schema("large", 500)
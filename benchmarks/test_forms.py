@@ -0,0 +1,36 @@
+"""Benchmarks for form data conversion and settings form rendering."""
+
+import pytest
+from fasthtml.common import to_xml
+
+from cjm_fasthtml_settings.components import forms
+from cjm_fasthtml_settings.components.forms import FormFragmentCache, create_settings_form
+from cjm_fasthtml_settings.core.utils import convert_form_data_to_config, get_config_with_defaults
+
+from conftest import make_form_data
+
+
+@pytest.fixture(params=["small", "500_fields"])
+def form_schema(request, app_schema, large_schema):
+    return app_schema if request.param == "small" else large_schema
+
+
+def test_convert_form_data_to_config(benchmark, form_schema):
+    form_data = make_form_data(form_schema)
+    config = benchmark(convert_form_data_to_config, form_data, form_schema)
+    assert len(config) == len(form_schema["properties"])
+
+
+@pytest.fixture(params=["uncached", "cached"])
+def form_cache(request, monkeypatch):
+    monkeypatch.setattr(forms, "_form_cache", None if request.param == "uncached" else FormFragmentCache(256))
+    return request.param
+
+
+def test_create_settings_form(benchmark, form_cache, form_schema, config_dir):
+    values = get_config_with_defaults(form_schema["name"], form_schema, config_dir)
+    
+    def render():
+        return to_xml(create_settings_form(form_schema, values, "/settings/save", "/settings/reset"))
+    
+    assert "<form" in benchmark(render)
@@ -0,0 +1,24 @@
+"""Benchmarks for building the settings MasterDetail from registered schemas."""
+
+import pytest
+
+from cjm_fasthtml_settings.components.master_detail_adapter import create_settings_master_detail
+
+from conftest import make_schema
+
+
+@pytest.fixture(scope="module", params=[10, 1_000, 10_000], ids=["10_items", "1k_items", "10k_items"])
+def schemas(request):
+    return {f"schema_{i}": make_schema(f"schema_{i}", 5) for i in range(request.param)}
+
+
+def test_create_settings_master_detail(benchmark, schemas, config_dir):
+    master_detail = benchmark(
+        create_settings_master_detail,
+        schemas,
+        config_dir,
+        lambda schema_id: f"/settings/save?id={schema_id}",
+        lambda schema_id: f"/settings/reset?id={schema_id}",
+        default_schema="schema_0"
+    )
+    assert master_detail is not None
@@ -0,0 +1,28 @@
+"""Benchmarks for resolving schema IDs with the settings registry."""
+
+import pytest
+
+from cjm_fasthtml_settings.core.schema_group import SchemaGroup
+from cjm_fasthtml_settings.core.schemas import SettingsRegistry
+
+from conftest import make_schema
+
+
+@pytest.fixture(scope="module")
+def populated_registry():
+    registry = SettingsRegistry()
+    for i in range(100):
+        registry.register(make_schema(f"schema_{i}", 10))
+    for i in range(20):
+        registry.register(SchemaGroup(
+            name=f"group_{i}",
+            title=f"Group {i}",
+            schemas={f"item_{j}": make_schema(f"item_{j}", 10) for j in range(10)}
+        ))
+    return registry
+
+
+@pytest.mark.parametrize("schema_id", ["schema_50", "group_10_item_5"], ids=["direct", "grouped"])
+def test_resolve_schema(benchmark, populated_registry, schema_id):
+    schema, error = benchmark(populated_registry.resolve_schema, schema_id)
+    assert schema is not None and error is None
@@ -0,0 +1,49 @@
+"""Benchmarks for loading and saving configurations with the default file backend."""
+
+import pytest
+
+from cjm_fasthtml_settings.core.cache import config_cache
+from cjm_fasthtml_settings.core.utils import get_config_with_defaults, load_config, save_config
+
+CONFIG = {"app_title": "Benchmark App", "server_port": 9000, "debug_mode": True, "session_timeout_minutes": 15}
+
+
+def test_load_config_cold(benchmark, config_dir):
+    save_config("general", CONFIG, config_dir)
+    
+    def drop_cached():
+        config_cache.invalidate()
+    
+    # Every round reads and parses the file
+    result = benchmark.pedantic(load_config, args=("general", config_dir),
+                                setup=drop_cached, rounds=500, warmup_rounds=10)
+    assert result == CONFIG
+
+
+def test_load_config_warm(benchmark, config_dir):
+    save_config("general", CONFIG, config_dir)
+    load_config("general", config_dir)
+    assert benchmark(load_config, "general", config_dir) == CONFIG
+
+
+def test_save_config_cold(benchmark, config_dir):
+    config_file = config_dir / "general.json"
+    
+    def remove_config():
+        config_file.unlink(missing_ok=True)
+        config_cache.invalidate()
+    
+    # Every round creates the file
+    assert benchmark.pedantic(save_config, args=("general", CONFIG, config_dir),
+                              setup=remove_config, rounds=200, warmup_rounds=5)
+
+
+def test_save_config_warm(benchmark, config_dir):
+    save_config("general", CONFIG, config_dir)
+    assert benchmark(save_config, "general", CONFIG, config_dir)
+
+
+def test_get_config_with_defaults(benchmark, config_dir, app_schema):
+    save_config("general", CONFIG, config_dir)
+    result = benchmark(get_config_with_defaults, "general", app_schema, config_dir)
+    assert result["server_port"] == 9000 and result["reload_on_change"] is False
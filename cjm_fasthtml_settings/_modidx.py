@@ -5,24 +5,274 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://cj-mills.github.io',
                 'git_url': 'https://github.com/cj-mills/cjm-fasthtml-settings',
                 'lib_path': 'cjm_fasthtml_settings'},
-  'syms': { 'cjm_fasthtml_settings.components.forms': { 'cjm_fasthtml_settings.components.forms.create_settings_form': ( 'components/forms.html#create_settings_form',
+  'syms': { 'cjm_fasthtml_settings.components.forms': { 'cjm_fasthtml_settings.components.forms.FormFragmentCache': ( 'components/forms.html#formfragmentcache',
+                                                                                                                      'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.FormFragmentCache.__init__': ( 'components/forms.html#formfragmentcache.__init__',
+                                                                                                                               'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.FormFragmentCache.clear': ( 'components/forms.html#formfragmentcache.clear',
+                                                                                                                            'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.FormFragmentCache.get': ( 'components/forms.html#formfragmentcache.get',
+                                                                                                                          'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.FormFragmentCache.put': ( 'components/forms.html#formfragmentcache.put',
+                                                                                                                          'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.FormFragmentCache.stats': ( 'components/forms.html#formfragmentcache.stats',
+                                                                                                                            'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms._build_settings_form': ( 'components/forms.html#_build_settings_form',
+                                                                                                                         'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms._enable_field_patching': ( 'components/forms.html#_enable_field_patching',
+                                                                                                                           'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms._field_patch_attrs': ( 'components/forms.html#_field_patch_attrs',
+                                                                                                                       'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms._find_field_input': ( 'components/forms.html#_find_field_input',
+                                                                                                                      'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms._form_cache_key': ( 'components/forms.html#_form_cache_key',
+                                                                                                                    'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms._hash_values': ( 'components/forms.html#_hash_values',
+                                                                                                                 'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.configure_form_cache': ( 'components/forms.html#configure_form_cache',
+                                                                                                                         'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.create_settings_field': ( 'components/forms.html#create_settings_field',
+                                                                                                                          'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.create_settings_form': ( 'components/forms.html#create_settings_form',
                                                                                                                          'cjm_fasthtml_settings/components/forms.py'),
                                                         'cjm_fasthtml_settings.components.forms.create_settings_form_container': ( 'components/forms.html#create_settings_form_container',
-                                                                                                                                   'cjm_fasthtml_settings/components/forms.py')},
-            'cjm_fasthtml_settings.components.master_detail_adapter': { 'cjm_fasthtml_settings.components.master_detail_adapter.create_settings_data_loader': ( 'components/master_detail_adapter.html#create_settings_data_loader',
+                                                                                                                                   'cjm_fasthtml_settings/components/forms.py'),
+                                                        'cjm_fasthtml_settings.components.forms.get_form_cache': ( 'components/forms.html#get_form_cache',
+                                                                                                                   'cjm_fasthtml_settings/components/forms.py')},
+            'cjm_fasthtml_settings.components.master_detail_adapter': { 'cjm_fasthtml_settings.components.master_detail_adapter.LazyDetailItemGroup': ( 'components/master_detail_adapter.html#lazydetailitemgroup',
+                                                                                                                                                        'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail': ( 'components/master_detail_adapter.html#lazygroupmasterdetail',
+                                                                                                                                                          'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail.__init__': ( 'components/master_detail_adapter.html#lazygroupmasterdetail.__init__',
+                                                                                                                                                                   'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._find_master_menu': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._find_master_menu',
+                                                                                                                                                                            'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._group_has_item': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._group_has_item',
+                                                                                                                                                                          'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._load_group': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._load_group',
+                                                                                                                                                                      'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._render_entry_content': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._render_entry_content',
+                                                                                                                                                                                'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._render_group_details': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._render_group_details',
+                                                                                                                                                                                'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._render_group_summary': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._render_group_summary',
+                                                                                                                                                                                'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._render_item': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._render_item',
+                                                                                                                                                                       'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._render_lazy_group': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._render_lazy_group',
+                                                                                                                                                                             'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail._render_menu_entries': ( 'components/master_detail_adapter.html#lazygroupmasterdetail._render_menu_entries',
+                                                                                                                                                                               'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail.get_item': ( 'components/master_detail_adapter.html#lazygroupmasterdetail.get_item',
+                                                                                                                                                                   'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail.render_full_interface': ( 'components/master_detail_adapter.html#lazygroupmasterdetail.render_full_interface',
+                                                                                                                                                                                'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail.render_group_items': ( 'components/master_detail_adapter.html#lazygroupmasterdetail.render_group_items',
+                                                                                                                                                                             'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.LazyGroupMasterDetail.render_master': ( 'components/master_detail_adapter.html#lazygroupmasterdetail.render_master',
+                                                                                                                                                                        'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter._registered_schema': ( 'components/master_detail_adapter.html#_registered_schema',
+                                                                                                                                                       'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.create_settings_data_loader': ( 'components/master_detail_adapter.html#create_settings_data_loader',
                                                                                                                                                                 'cjm_fasthtml_settings/components/master_detail_adapter.py'),
                                                                         'cjm_fasthtml_settings.components.master_detail_adapter.create_settings_detail_renderer': ( 'components/master_detail_adapter.html#create_settings_detail_renderer',
                                                                                                                                                                     'cjm_fasthtml_settings/components/master_detail_adapter.py'),
                                                                         'cjm_fasthtml_settings.components.master_detail_adapter.create_settings_master_detail': ( 'components/master_detail_adapter.html#create_settings_master_detail',
                                                                                                                                                                   'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.get_configured_plugin_ids': ( 'components/master_detail_adapter.html#get_configured_plugin_ids',
+                                                                                                                                                              'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.get_plugin_registry_state': ( 'components/master_detail_adapter.html#get_plugin_registry_state',
+                                                                                                                                                              'cjm_fasthtml_settings/components/master_detail_adapter.py'),
+                                                                        'cjm_fasthtml_settings.components.master_detail_adapter.is_plugin_configured': ( 'components/master_detail_adapter.html#is_plugin_configured',
+                                                                                                                                                         'cjm_fasthtml_settings/components/master_detail_adapter.py'),
                                                                         'cjm_fasthtml_settings.components.master_detail_adapter.is_schema_configured': ( 'components/master_detail_adapter.html#is_schema_configured',
                                                                                                                                                          'cjm_fasthtml_settings/components/master_detail_adapter.py')},
+            'cjm_fasthtml_settings.core.accessors': { 'cjm_fasthtml_settings.core.accessors._generate_settings_class': ( 'core/accessors.html#_generate_settings_class',
+                                                                                                                         'cjm_fasthtml_settings/core/accessors.py'),
+                                                      'cjm_fasthtml_settings.core.accessors._generate_settings_class_source': ( 'core/accessors.html#_generate_settings_class_source',
+                                                                                                                                'cjm_fasthtml_settings/core/accessors.py'),
+                                                      'cjm_fasthtml_settings.core.accessors._get_annotation_source': ( 'core/accessors.html#_get_annotation_source',
+                                                                                                                       'cjm_fasthtml_settings/core/accessors.py'),
+                                                      'cjm_fasthtml_settings.core.accessors._get_settings_class_name': ( 'core/accessors.html#_get_settings_class_name',
+                                                                                                                         'cjm_fasthtml_settings/core/accessors.py'),
+                                                      'cjm_fasthtml_settings.core.accessors.get_settings': ( 'core/accessors.html#get_settings',
+                                                                                                             'cjm_fasthtml_settings/core/accessors.py'),
+                                                      'cjm_fasthtml_settings.core.accessors.get_settings_class': ( 'core/accessors.html#get_settings_class',
+                                                                                                                   'cjm_fasthtml_settings/core/accessors.py')},
+            'cjm_fasthtml_settings.core.cache': { 'cjm_fasthtml_settings.core.cache.ConfigCache': ( 'core/cache.html#configcache',
+                                                                                                    'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.__init__': ( 'core/cache.html#configcache.__init__',
+                                                                                                             'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache._key': ( 'core/cache.html#configcache._key',
+                                                                                                         'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.epoch': ( 'core/cache.html#configcache.epoch',
+                                                                                                          'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.get': ( 'core/cache.html#configcache.get',
+                                                                                                        'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.get_watched': ( 'core/cache.html#configcache.get_watched',
+                                                                                                                'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.invalidate': ( 'core/cache.html#configcache.invalidate',
+                                                                                                               'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.is_watched': ( 'core/cache.html#configcache.is_watched',
+                                                                                                               'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.put': ( 'core/cache.html#configcache.put',
+                                                                                                        'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.reset_stats': ( 'core/cache.html#configcache.reset_stats',
+                                                                                                                'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.stats': ( 'core/cache.html#configcache.stats',
+                                                                                                          'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.unwatch': ( 'core/cache.html#configcache.unwatch',
+                                                                                                            'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigCache.watch': ( 'core/cache.html#configcache.watch',
+                                                                                                          'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex': ( 'core/cache.html#configdirindex',
+                                                                                                       'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.__init__': ( 'core/cache.html#configdirindex.__init__',
+                                                                                                                'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex._scan': ( 'core/cache.html#configdirindex._scan',
+                                                                                                             'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.add': ( 'core/cache.html#configdirindex.add',
+                                                                                                           'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.add_many': ( 'core/cache.html#configdirindex.add_many',
+                                                                                                                'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.get_configured_ids': ( 'core/cache.html#configdirindex.get_configured_ids',
+                                                                                                                          'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.invalidate': ( 'core/cache.html#configdirindex.invalidate',
+                                                                                                                  'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.is_configured': ( 'core/cache.html#configdirindex.is_configured',
+                                                                                                                     'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.is_watched': ( 'core/cache.html#configdirindex.is_watched',
+                                                                                                                  'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.unwatch': ( 'core/cache.html#configdirindex.unwatch',
+                                                                                                               'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.ConfigDirIndex.watch': ( 'core/cache.html#configdirindex.watch',
+                                                                                                             'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.get_dir_key': ( 'core/cache.html#get_dir_key',
+                                                                                                    'cjm_fasthtml_settings/core/cache.py'),
+                                                  'cjm_fasthtml_settings.core.cache.get_file_signature': ( 'core/cache.html#get_file_signature',
+                                                                                                           'cjm_fasthtml_settings/core/cache.py')},
+            'cjm_fasthtml_settings.core.compiled_schema': { 'cjm_fasthtml_settings.core.compiled_schema.CompiledSchema': ( 'core/compiled_schema.html#compiledschema',
+                                                                                                                           'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.CompiledSchema._mutable_defaults': ( 'core/compiled_schema.html#compiledschema._mutable_defaults',
+                                                                                                                                             'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.CompiledSchema.default_values': ( 'core/compiled_schema.html#compiledschema.default_values',
+                                                                                                                                          'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.CompiledSchema.field_kinds': ( 'core/compiled_schema.html#compiledschema.field_kinds',
+                                                                                                                                       'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.CompiledSchema.fingerprint': ( 'core/compiled_schema.html#compiledschema.fingerprint',
+                                                                                                                                       'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.CompiledSchema.numeric_fields': ( 'core/compiled_schema.html#compiledschema.numeric_fields',
+                                                                                                                                          'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.FrozenSchema': ( 'core/compiled_schema.html#frozenschema',
+                                                                                                                         'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.FrozenSchema.__getitem__': ( 'core/compiled_schema.html#frozenschema.__getitem__',
+                                                                                                                                     'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.FrozenSchema.__init__': ( 'core/compiled_schema.html#frozenschema.__init__',
+                                                                                                                                  'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.FrozenSchema.__iter__': ( 'core/compiled_schema.html#frozenschema.__iter__',
+                                                                                                                                  'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.FrozenSchema.__len__': ( 'core/compiled_schema.html#frozenschema.__len__',
+                                                                                                                                 'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.FrozenSchema.__repr__': ( 'core/compiled_schema.html#frozenschema.__repr__',
+                                                                                                                                  'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.FrozenSchema.compiled': ( 'core/compiled_schema.html#frozenschema.compiled',
+                                                                                                                                  'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.FrozenSchema.copy': ( 'core/compiled_schema.html#frozenschema.copy',
+                                                                                                                              'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema._FrozenList': ( 'core/compiled_schema.html#_frozenlist',
+                                                                                                                        'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema._FrozenList.__copy__': ( 'core/compiled_schema.html#_frozenlist.__copy__',
+                                                                                                                                 'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema._FrozenList.__deepcopy__': ( 'core/compiled_schema.html#_frozenlist.__deepcopy__',
+                                                                                                                                     'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema._FrozenList.__reduce__': ( 'core/compiled_schema.html#_frozenlist.__reduce__',
+                                                                                                                                   'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema._FrozenList._read_only': ( 'core/compiled_schema.html#_frozenlist._read_only',
+                                                                                                                                   'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema._build_compiled_schema': ( 'core/compiled_schema.html#_build_compiled_schema',
+                                                                                                                                   'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema._fingerprint_default': ( 'core/compiled_schema.html#_fingerprint_default',
+                                                                                                                                 'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema._get_field_kind': ( 'core/compiled_schema.html#_get_field_kind',
+                                                                                                                            'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.compile_schema': ( 'core/compiled_schema.html#compile_schema',
+                                                                                                                           'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.freeze_schema': ( 'core/compiled_schema.html#freeze_schema',
+                                                                                                                          'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.freeze_value': ( 'core/compiled_schema.html#freeze_value',
+                                                                                                                         'cjm_fasthtml_settings/core/compiled_schema.py'),
+                                                            'cjm_fasthtml_settings.core.compiled_schema.thaw_value': ( 'core/compiled_schema.html#thaw_value',
+                                                                                                                       'cjm_fasthtml_settings/core/compiled_schema.py')},
             'cjm_fasthtml_settings.core.config': { 'cjm_fasthtml_settings.core.config.get_app_config_schema': ( 'core/config.html#get_app_config_schema',
                                                                                                                 'cjm_fasthtml_settings/core/config.py')},
+            'cjm_fasthtml_settings.core.events': { 'cjm_fasthtml_settings.core.events.ConfigSubscription': ( 'core/events.html#configsubscription',
+                                                                                                             'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions': ( 'core/events.html#configsubscriptions',
+                                                                                                              'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions.__init__': ( 'core/events.html#configsubscriptions.__init__',
+                                                                                                                       'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions._deliver': ( 'core/events.html#configsubscriptions._deliver',
+                                                                                                                       'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions._key': ( 'core/events.html#configsubscriptions._key',
+                                                                                                                   'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions.handle_file_change': ( 'core/events.html#configsubscriptions.handle_file_change',
+                                                                                                                                 'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions.has_subscribers': ( 'core/events.html#configsubscriptions.has_subscribers',
+                                                                                                                              'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions.ordered': ( 'core/events.html#configsubscriptions.ordered',
+                                                                                                                      'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions.publish': ( 'core/events.html#configsubscriptions.publish',
+                                                                                                                      'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions.stats': ( 'core/events.html#configsubscriptions.stats',
+                                                                                                                    'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions.subscribe': ( 'core/events.html#configsubscriptions.subscribe',
+                                                                                                                        'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigSubscriptions.unsubscribe': ( 'core/events.html#configsubscriptions.unsubscribe',
+                                                                                                                          'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.ConfigUpdate': ( 'core/events.html#configupdate',
+                                                                                                       'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events._changed_fields': ( 'core/events.html#_changed_fields',
+                                                                                                          'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.subscribe_config': ( 'core/events.html#subscribe_config',
+                                                                                                           'cjm_fasthtml_settings/core/events.py'),
+                                                   'cjm_fasthtml_settings.core.events.unsubscribe_config': ( 'core/events.html#unsubscribe_config',
+                                                                                                             'cjm_fasthtml_settings/core/events.py')},
             'cjm_fasthtml_settings.core.html_ids': { 'cjm_fasthtml_settings.core.html_ids.SettingsHtmlIds': ( 'core/html_ids.html#settingshtmlids',
                                                                                                               'cjm_fasthtml_settings/core/html_ids.py'),
+                                                     'cjm_fasthtml_settings.core.html_ids.SettingsHtmlIds.field': ( 'core/html_ids.html#settingshtmlids.field',
+                                                                                                                    'cjm_fasthtml_settings/core/html_ids.py'),
                                                      'cjm_fasthtml_settings.core.html_ids.SettingsHtmlIds.menu_item': ( 'core/html_ids.html#settingshtmlids.menu_item',
                                                                                                                         'cjm_fasthtml_settings/core/html_ids.py')},
+            'cjm_fasthtml_settings.core.resolver': { 'cjm_fasthtml_settings.core.resolver.ConfigResolver': ( 'core/resolver.html#configresolver',
+                                                                                                             'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver.__init__': ( 'core/resolver.html#configresolver.__init__',
+                                                                                                                      'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver._get_environment_layer': ( 'core/resolver.html#configresolver._get_environment_layer',
+                                                                                                                                    'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver._get_snapshot': ( 'core/resolver.html#configresolver._get_snapshot',
+                                                                                                                           'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver._report_invalid_variable': ( 'core/resolver.html#configresolver._report_invalid_variable',
+                                                                                                                                      'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver.clear_overrides': ( 'core/resolver.html#configresolver.clear_overrides',
+                                                                                                                             'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver.environment_variable': ( 'core/resolver.html#configresolver.environment_variable',
+                                                                                                                                  'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver.explain': ( 'core/resolver.html#configresolver.explain',
+                                                                                                                     'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver.reload_environment': ( 'core/resolver.html#configresolver.reload_environment',
+                                                                                                                                'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver.resolve': ( 'core/resolver.html#configresolver.resolve',
+                                                                                                                     'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver.set_overrides': ( 'core/resolver.html#configresolver.set_overrides',
+                                                                                                                           'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.ConfigResolver.stats': ( 'core/resolver.html#configresolver.stats',
+                                                                                                                   'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver._get_environment_name': ( 'core/resolver.html#_get_environment_name',
+                                                                                                                    'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.explain_config': ( 'core/resolver.html#explain_config',
+                                                                                                             'cjm_fasthtml_settings/core/resolver.py'),
+                                                     'cjm_fasthtml_settings.core.resolver.resolve_config': ( 'core/resolver.html#resolve_config',
+                                                                                                             'cjm_fasthtml_settings/core/resolver.py')},
             'cjm_fasthtml_settings.core.schema_group': { 'cjm_fasthtml_settings.core.schema_group.SchemaGroup': ( 'core/schema_group.html#schemagroup',
                                                                                                                   'cjm_fasthtml_settings/core/schema_group.py'),
                                                          'cjm_fasthtml_settings.core.schema_group.SchemaGroup.get_configured_schemas': ( 'core/schema_group.html#schemagroup.get_configured_schemas',
@@ -37,27 +287,313 @@ d = { 'settings': { 'branch': 'main',
                                                                                                              'cjm_fasthtml_settings/core/schemas.py'),
                                                     'cjm_fasthtml_settings.core.schemas.SettingsRegistry.__init__': ( 'core/schemas.html#settingsregistry.__init__',
                                                                                                                       'cjm_fasthtml_settings/core/schemas.py'),
+                                                    'cjm_fasthtml_settings.core.schemas.SettingsRegistry._index_entry': ( 'core/schemas.html#settingsregistry._index_entry',
+                                                                                                                          'cjm_fasthtml_settings/core/schemas.py'),
+                                                    'cjm_fasthtml_settings.core.schemas.SettingsRegistry._resolve_error': ( 'core/schemas.html#settingsregistry._resolve_error',
+                                                                                                                            'cjm_fasthtml_settings/core/schemas.py'),
+                                                    'cjm_fasthtml_settings.core.schemas.SettingsRegistry._update_index': ( 'core/schemas.html#settingsregistry._update_index',
+                                                                                                                           'cjm_fasthtml_settings/core/schemas.py'),
+                                                    'cjm_fasthtml_settings.core.schemas.SettingsRegistry.clear': ( 'core/schemas.html#settingsregistry.clear',
+                                                                                                                   'cjm_fasthtml_settings/core/schemas.py'),
                                                     'cjm_fasthtml_settings.core.schemas.SettingsRegistry.get': ( 'core/schemas.html#settingsregistry.get',
                                                                                                                  'cjm_fasthtml_settings/core/schemas.py'),
                                                     'cjm_fasthtml_settings.core.schemas.SettingsRegistry.get_all': ( 'core/schemas.html#settingsregistry.get_all',
                                                                                                                      'cjm_fasthtml_settings/core/schemas.py'),
+                                                    'cjm_fasthtml_settings.core.schemas.SettingsRegistry.get_registered_schema': ( 'core/schemas.html#settingsregistry.get_registered_schema',
+                                                                                                                                   'cjm_fasthtml_settings/core/schemas.py'),
+                                                    'cjm_fasthtml_settings.core.schemas.SettingsRegistry.list_schema_ids': ( 'core/schemas.html#settingsregistry.list_schema_ids',
+                                                                                                                             'cjm_fasthtml_settings/core/schemas.py'),
                                                     'cjm_fasthtml_settings.core.schemas.SettingsRegistry.list_schemas': ( 'core/schemas.html#settingsregistry.list_schemas',
                                                                                                                           'cjm_fasthtml_settings/core/schemas.py'),
                                                     'cjm_fasthtml_settings.core.schemas.SettingsRegistry.register': ( 'core/schemas.html#settingsregistry.register',
                                                                                                                       'cjm_fasthtml_settings/core/schemas.py'),
                                                     'cjm_fasthtml_settings.core.schemas.SettingsRegistry.resolve_schema': ( 'core/schemas.html#settingsregistry.resolve_schema',
                                                                                                                             'cjm_fasthtml_settings/core/schemas.py')},
-            'cjm_fasthtml_settings.core.utils': { 'cjm_fasthtml_settings.core.utils.convert_form_data_to_config': ( 'core/utils.html#convert_form_data_to_config',
+            'cjm_fasthtml_settings.core.search': { 'cjm_fasthtml_settings.core.search.SearchHit': ( 'core/search.html#searchhit',
+                                                                                                    'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex': ( 'core/search.html#settingssearchindex',
+                                                                                                              'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex.__init__': ( 'core/search.html#settingssearchindex.__init__',
+                                                                                                                       'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex._expand_prefix': ( 'core/search.html#settingssearchindex._expand_prefix',
+                                                                                                                             'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex._remove_locked': ( 'core/search.html#settingssearchindex._remove_locked',
+                                                                                                                             'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex._weigh_terms': ( 'core/search.html#settingssearchindex._weigh_terms',
+                                                                                                                           'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex.add_schema': ( 'core/search.html#settingssearchindex.add_schema',
+                                                                                                                         'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex.clear': ( 'core/search.html#settingssearchindex.clear',
+                                                                                                                    'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex.is_indexed': ( 'core/search.html#settingssearchindex.is_indexed',
+                                                                                                                         'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex.remove_schema': ( 'core/search.html#settingssearchindex.remove_schema',
+                                                                                                                            'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex.search': ( 'core/search.html#settingssearchindex.search',
+                                                                                                                     'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.SettingsSearchIndex.sync_plugins': ( 'core/search.html#settingssearchindex.sync_plugins',
+                                                                                                                           'cjm_fasthtml_settings/core/search.py'),
+                                                   'cjm_fasthtml_settings.core.search.tokenize': ( 'core/search.html#tokenize',
+                                                                                                   'cjm_fasthtml_settings/core/search.py')},
+            'cjm_fasthtml_settings.core.storage': { 'cjm_fasthtml_settings.core.storage.FileStorageBackend': ( 'core/storage.html#filestoragebackend',
+                                                                                                               'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.__init__': ( 'core/storage.html#filestoragebackend.__init__',
+                                                                                                                        'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend._config_file': ( 'core/storage.html#filestoragebackend._config_file',
+                                                                                                                            'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend._locked': ( 'core/storage.html#filestoragebackend._locked',
+                                                                                                                       'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend._signature_revision': ( 'core/storage.html#filestoragebackend._signature_revision',
+                                                                                                                                   'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend._sync_directory': ( 'core/storage.html#filestoragebackend._sync_directory',
+                                                                                                                               'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend._write_config': ( 'core/storage.html#filestoragebackend._write_config',
+                                                                                                                             'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend._write_file': ( 'core/storage.html#filestoragebackend._write_file',
+                                                                                                                           'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend._write_temp': ( 'core/storage.html#filestoragebackend._write_temp',
+                                                                                                                           'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.get_configured_ids': ( 'core/storage.html#filestoragebackend.get_configured_ids',
+                                                                                                                                  'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.get_revision': ( 'core/storage.html#filestoragebackend.get_revision',
+                                                                                                                            'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.get_version': ( 'core/storage.html#filestoragebackend.get_version',
+                                                                                                                           'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.load': ( 'core/storage.html#filestoragebackend.load',
+                                                                                                                    'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.load_many': ( 'core/storage.html#filestoragebackend.load_many',
+                                                                                                                         'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.save': ( 'core/storage.html#filestoragebackend.save',
+                                                                                                                    'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.save_if_revision': ( 'core/storage.html#filestoragebackend.save_if_revision',
+                                                                                                                                'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.FileStorageBackend.save_many': ( 'core/storage.html#filestoragebackend.save_many',
+                                                                                                                         'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend': ( 'core/storage.html#sqlitestoragebackend',
+                                                                                                                 'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.__init__': ( 'core/storage.html#sqlitestoragebackend.__init__',
+                                                                                                                          'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend._connect': ( 'core/storage.html#sqlitestoragebackend._connect',
+                                                                                                                          'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend._get_db_path': ( 'core/storage.html#sqlitestoragebackend._get_db_path',
+                                                                                                                              'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend._raise_error': ( 'core/storage.html#sqlitestoragebackend._raise_error',
+                                                                                                                              'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.get_configured_ids': ( 'core/storage.html#sqlitestoragebackend.get_configured_ids',
+                                                                                                                                    'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.get_revision': ( 'core/storage.html#sqlitestoragebackend.get_revision',
+                                                                                                                              'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.get_version': ( 'core/storage.html#sqlitestoragebackend.get_version',
+                                                                                                                             'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.load': ( 'core/storage.html#sqlitestoragebackend.load',
+                                                                                                                      'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.load_many': ( 'core/storage.html#sqlitestoragebackend.load_many',
+                                                                                                                           'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.save': ( 'core/storage.html#sqlitestoragebackend.save',
+                                                                                                                      'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.save_if_revision': ( 'core/storage.html#sqlitestoragebackend.save_if_revision',
+                                                                                                                                  'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.SQLiteStorageBackend.save_many': ( 'core/storage.html#sqlitestoragebackend.save_many',
+                                                                                                                           'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.StorageBackendProtocol': ( 'core/storage.html#storagebackendprotocol',
+                                                                                                                   'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.StorageBackendProtocol.get_configured_ids': ( 'core/storage.html#storagebackendprotocol.get_configured_ids',
+                                                                                                                                      'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.StorageBackendProtocol.load': ( 'core/storage.html#storagebackendprotocol.load',
+                                                                                                                        'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.StorageBackendProtocol.load_many': ( 'core/storage.html#storagebackendprotocol.load_many',
+                                                                                                                             'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.StorageBackendProtocol.save': ( 'core/storage.html#storagebackendprotocol.save',
+                                                                                                                        'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage._copy_config': ( 'core/storage.html#_copy_config',
+                                                                                                         'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.get_storage_backend': ( 'core/storage.html#get_storage_backend',
+                                                                                                                'cjm_fasthtml_settings/core/storage.py'),
+                                                    'cjm_fasthtml_settings.core.storage.set_storage_backend': ( 'core/storage.html#set_storage_backend',
+                                                                                                                'cjm_fasthtml_settings/core/storage.py')},
+            'cjm_fasthtml_settings.core.utils': { 'cjm_fasthtml_settings.core.utils.WriteBehindQueue': ( 'core/utils.html#writebehindqueue',
+                                                                                                         'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue.__init__': ( 'core/utils.html#writebehindqueue.__init__',
+                                                                                                                  'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue._key': ( 'core/utils.html#writebehindqueue._key',
+                                                                                                              'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue._run': ( 'core/utils.html#writebehindqueue._run',
+                                                                                                              'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue.close': ( 'core/utils.html#writebehindqueue.close',
+                                                                                                               'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue.flush': ( 'core/utils.html#writebehindqueue.flush',
+                                                                                                               'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue.get': ( 'core/utils.html#writebehindqueue.get',
+                                                                                                             'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue.get_version': ( 'core/utils.html#writebehindqueue.get_version',
+                                                                                                                     'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue.put': ( 'core/utils.html#writebehindqueue.put',
+                                                                                                             'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.WriteBehindQueue.stats': ( 'core/utils.html#writebehindqueue.stats',
+                                                                                                               'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._close_write_behind': ( 'core/utils.html#_close_write_behind',
+                                                                                                            'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._coerce_field_value': ( 'core/utils.html#_coerce_field_value',
+                                                                                                            'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._convert_array_value': ( 'core/utils.html#_convert_array_value',
+                                                                                                             'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._flush_pending_save': ( 'core/utils.html#_flush_pending_save',
+                                                                                                            'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._generate_converter_source': ( 'core/utils.html#_generate_converter_source',
+                                                                                                                   'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._get_field_update_lock': ( 'core/utils.html#_get_field_update_lock',
+                                                                                                               'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._queue_configs': ( 'core/utils.html#_queue_configs',
+                                                                                                       'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._save_and_publish': ( 'core/utils.html#_save_and_publish',
+                                                                                                          'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._validate_field_value': ( 'core/utils.html#_validate_field_value',
+                                                                                                              'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils._write_configs': ( 'core/utils.html#_write_configs',
+                                                                                                       'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.aget_config_revision': ( 'core/utils.html#aget_config_revision',
+                                                                                                             'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.aload_config': ( 'core/utils.html#aload_config',
+                                                                                                     'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.amerge_config_field': ( 'core/utils.html#amerge_config_field',
+                                                                                                            'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.asave_config': ( 'core/utils.html#asave_config',
+                                                                                                     'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.asave_config_if_revision': ( 'core/utils.html#asave_config_if_revision',
+                                                                                                                 'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.asave_configs': ( 'core/utils.html#asave_configs',
+                                                                                                      'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.aupdate_config_field': ( 'core/utils.html#aupdate_config_field',
+                                                                                                             'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.bulk_save_configs': ( 'core/utils.html#bulk_save_configs',
+                                                                                                          'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.configure_storage_executor': ( 'core/utils.html#configure_storage_executor',
+                                                                                                                   'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.configure_write_behind': ( 'core/utils.html#configure_write_behind',
+                                                                                                               'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.convert_config_data': ( 'core/utils.html#convert_config_data',
+                                                                                                            'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.convert_form_data_to_config': ( 'core/utils.html#convert_form_data_to_config',
                                                                                                                     'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.convert_form_field': ( 'core/utils.html#convert_form_field',
+                                                                                                           'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.flush_config_writes': ( 'core/utils.html#flush_config_writes',
+                                                                                                            'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.get_config_revision': ( 'core/utils.html#get_config_revision',
+                                                                                                            'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.get_config_version': ( 'core/utils.html#get_config_version',
+                                                                                                           'cjm_fasthtml_settings/core/utils.py'),
                                                   'cjm_fasthtml_settings.core.utils.get_config_with_defaults': ( 'core/utils.html#get_config_with_defaults',
                                                                                                                  'cjm_fasthtml_settings/core/utils.py'),
                                                   'cjm_fasthtml_settings.core.utils.get_default_values_from_schema': ( 'core/utils.html#get_default_values_from_schema',
                                                                                                                        'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.get_form_converter': ( 'core/utils.html#get_form_converter',
+                                                                                                           'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.get_storage_executor': ( 'core/utils.html#get_storage_executor',
+                                                                                                             'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.get_write_behind_queue': ( 'core/utils.html#get_write_behind_queue',
+                                                                                                               'cjm_fasthtml_settings/core/utils.py'),
                                                   'cjm_fasthtml_settings.core.utils.load_config': ( 'core/utils.html#load_config',
                                                                                                     'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.load_configs': ( 'core/utils.html#load_configs',
+                                                                                                     'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.merge_config_field': ( 'core/utils.html#merge_config_field',
+                                                                                                           'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.prepare_configs': ( 'core/utils.html#prepare_configs',
+                                                                                                        'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.run_storage_io': ( 'core/utils.html#run_storage_io',
+                                                                                                       'cjm_fasthtml_settings/core/utils.py'),
                                                   'cjm_fasthtml_settings.core.utils.save_config': ( 'core/utils.html#save_config',
-                                                                                                    'cjm_fasthtml_settings/core/utils.py')},
-            'cjm_fasthtml_settings.plugins': { 'cjm_fasthtml_settings.plugins.PluginRegistryProtocol': ( 'plugins.html#pluginregistryprotocol',
+                                                                                                    'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.save_config_if_revision': ( 'core/utils.html#save_config_if_revision',
+                                                                                                                'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.save_configs': ( 'core/utils.html#save_configs',
+                                                                                                     'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.update_config_field': ( 'core/utils.html#update_config_field',
+                                                                                                            'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.validate_config_data': ( 'core/utils.html#validate_config_data',
+                                                                                                             'cjm_fasthtml_settings/core/utils.py'),
+                                                  'cjm_fasthtml_settings.core.utils.validate_config_field': ( 'core/utils.html#validate_config_field',
+                                                                                                              'cjm_fasthtml_settings/core/utils.py')},
+            'cjm_fasthtml_settings.core.watcher': { 'cjm_fasthtml_settings.core.watcher.ConfigChange': ( 'core/watcher.html#configchange',
+                                                                                                         'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher': ( 'core/watcher.html#configwatcher',
+                                                                                                          'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher.__init__': ( 'core/watcher.html#configwatcher.__init__',
+                                                                                                                   'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher._close_inotify': ( 'core/watcher.html#configwatcher._close_inotify',
+                                                                                                                         'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher._handle_inotify_events': ( 'core/watcher.html#configwatcher._handle_inotify_events',
+                                                                                                                                 'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher._poll_once': ( 'core/watcher.html#configwatcher._poll_once',
+                                                                                                                     'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher._publish': ( 'core/watcher.html#configwatcher._publish',
+                                                                                                                   'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher._run': ( 'core/watcher.html#configwatcher._run',
+                                                                                                               'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher._run_inotify': ( 'core/watcher.html#configwatcher._run_inotify',
+                                                                                                                       'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher._scan': ( 'core/watcher.html#configwatcher._scan',
+                                                                                                                'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher.running': ( 'core/watcher.html#configwatcher.running',
+                                                                                                                  'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher.start': ( 'core/watcher.html#configwatcher.start',
+                                                                                                                'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher.stats': ( 'core/watcher.html#configwatcher.stats',
+                                                                                                                'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher.stop': ( 'core/watcher.html#configwatcher.stop',
+                                                                                                               'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher.subscribe': ( 'core/watcher.html#configwatcher.subscribe',
+                                                                                                                    'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.ConfigWatcher.unsubscribe': ( 'core/watcher.html#configwatcher.unsubscribe',
+                                                                                                                      'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher._inotify_open': ( 'core/watcher.html#_inotify_open',
+                                                                                                          'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher._load_inotify': ( 'core/watcher.html#_load_inotify',
+                                                                                                          'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher._parse_inotify_events': ( 'core/watcher.html#_parse_inotify_events',
+                                                                                                                  'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.get_config_watcher': ( 'core/watcher.html#get_config_watcher',
+                                                                                                               'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.start_config_watcher': ( 'core/watcher.html#start_config_watcher',
+                                                                                                                 'cjm_fasthtml_settings/core/watcher.py'),
+                                                    'cjm_fasthtml_settings.core.watcher.stop_config_watcher': ( 'core/watcher.html#stop_config_watcher',
+                                                                                                                'cjm_fasthtml_settings/core/watcher.py')},
+            'cjm_fasthtml_settings.plugins': { 'cjm_fasthtml_settings.plugins.CachedPluginRegistry': ( 'plugins.html#cachedpluginregistry',
+                                                                                                       'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.__getattr__': ( 'plugins.html#cachedpluginregistry.__getattr__',
+                                                                                                                   'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.__init__': ( 'plugins.html#cachedpluginregistry.__init__',
+                                                                                                                'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry._cached': ( 'plugins.html#cachedpluginregistry._cached',
+                                                                                                               'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry._check_source_version': ( 'plugins.html#cachedpluginregistry._check_source_version',
+                                                                                                                             'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry._clear': ( 'plugins.html#cachedpluginregistry._clear',
+                                                                                                              'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.get_categories_with_plugins': ( 'plugins.html#cachedpluginregistry.get_categories_with_plugins',
+                                                                                                                                   'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.get_category_display_name': ( 'plugins.html#cachedpluginregistry.get_category_display_name',
+                                                                                                                                 'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.get_configured_plugin_ids': ( 'plugins.html#cachedpluginregistry.get_configured_plugin_ids',
+                                                                                                                                 'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.get_plugin': ( 'plugins.html#cachedpluginregistry.get_plugin',
+                                                                                                                  'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.get_plugins_by_category': ( 'plugins.html#cachedpluginregistry.get_plugins_by_category',
+                                                                                                                               'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.load_plugin_config': ( 'plugins.html#cachedpluginregistry.load_plugin_config',
+                                                                                                                          'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.refresh': ( 'plugins.html#cachedpluginregistry.refresh',
+                                                                                                               'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.save_plugin_config': ( 'plugins.html#cachedpluginregistry.save_plugin_config',
+                                                                                                                          'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.CachedPluginRegistry.stats': ( 'plugins.html#cachedpluginregistry.stats',
+                                                                                                             'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.ConfiguredPluginsProtocol': ( 'plugins.html#configuredpluginsprotocol',
+                                                                                                            'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.ConfiguredPluginsProtocol.get_configured_plugin_ids': ( 'plugins.html#configuredpluginsprotocol.get_configured_plugin_ids',
+                                                                                                                                      'cjm_fasthtml_settings/plugins.py'),
+                                               'cjm_fasthtml_settings.plugins.PluginRegistryProtocol': ( 'plugins.html#pluginregistryprotocol',
                                                                                                          'cjm_fasthtml_settings/plugins.py'),
                                                'cjm_fasthtml_settings.plugins.PluginRegistryProtocol.get_categories_with_plugins': ( 'plugins.html#pluginregistryprotocol.get_categories_with_plugins',
                                                                                                                                      'cjm_fasthtml_settings/plugins.py'),
@@ -71,10 +607,56 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                             'cjm_fasthtml_settings/plugins.py')},
             'cjm_fasthtml_settings.routes': { 'cjm_fasthtml_settings.routes.RoutesConfig': ( 'routes.html#routesconfig',
                                                                                              'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._api_error': ( 'routes.html#_api_error',
+                                                                                           'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._etag_headers': ( 'routes.html#_etag_headers',
+                                                                                              'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._etag_matches': ( 'routes.html#_etag_matches',
+                                                                                              'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._field_alert_oob': ( 'routes.html#_field_alert_oob',
+                                                                                                 'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._get_configured_ids_version': ( 'routes.html#_get_configured_ids_version',
+                                                                                                            'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._get_field_patch_url': ( 'routes.html#_get_field_patch_url',
+                                                                                                     'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._get_master_detail': ( 'routes.html#_get_master_detail',
+                                                                                                   'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._get_master_detail_key': ( 'routes.html#_get_master_detail_key',
+                                                                                                       'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._get_view_etag': ( 'routes.html#_get_view_etag',
+                                                                                               'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._load_saved_configs': ( 'routes.html#_load_saved_configs',
+                                                                                                    'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._make_etag': ( 'routes.html#_make_etag',
+                                                                                           'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._not_modified': ( 'routes.html#_not_modified',
+                                                                                              'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._parse_revision': ( 'routes.html#_parse_revision',
+                                                                                                'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._render_search_results': ( 'routes.html#_render_search_results',
+                                                                                                       'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._resolve_api_target': ( 'routes.html#_resolve_api_target',
+                                                                                                    'cjm_fasthtml_settings/routes.py'),
                                               'cjm_fasthtml_settings.routes._resolve_schema': ( 'routes.html#_resolve_schema',
                                                                                                 'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._revision_headers': ( 'routes.html#_revision_headers',
+                                                                                                  'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._save_plugin_config': ( 'routes.html#_save_plugin_config',
+                                                                                                    'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes._sync_config_watcher': ( 'routes.html#_sync_config_watcher',
+                                                                                                     'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes.api_get_config': ( 'routes.html#api_get_config',
+                                                                                               'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes.api_get_configs': ( 'routes.html#api_get_configs',
+                                                                                                'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes.api_put_config': ( 'routes.html#api_put_config',
+                                                                                               'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes.api_save_configs': ( 'routes.html#api_save_configs',
+                                                                                                 'cjm_fasthtml_settings/routes.py'),
                                               'cjm_fasthtml_settings.routes.configure_settings': ( 'routes.html#configure_settings',
                                                                                                    'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes.group_items': ( 'routes.html#group_items',
+                                                                                            'cjm_fasthtml_settings/routes.py'),
                                               'cjm_fasthtml_settings.routes.index': ( 'routes.html#index',
                                                                                       'cjm_fasthtml_settings/routes.py'),
                                               'cjm_fasthtml_settings.routes.plugin_reset': ( 'routes.html#plugin_reset',
@@ -83,5 +665,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                             'cjm_fasthtml_settings/routes.py'),
                                               'cjm_fasthtml_settings.routes.reset': ( 'routes.html#reset',
                                                                                       'cjm_fasthtml_settings/routes.py'),
-                                              'cjm_fasthtml_settings.routes.save': ( 'routes.html#save',
-                                                                                     'cjm_fasthtml_settings/routes.py')}}}
+                                              'cjm_fasthtml_settings.routes.save': ('routes.html#save', 'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes.save_field': ( 'routes.html#save_field',
+                                                                                           'cjm_fasthtml_settings/routes.py'),
+                                              'cjm_fasthtml_settings.routes.search': ( 'routes.html#search',
+                                                                                       'cjm_fasthtml_settings/routes.py')}}}
@@ -3,10 +3,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/components/forms.ipynb.
 
 # %% auto 0
-__all__ = ['create_settings_form', 'create_settings_form_container']
+__all__ = ['REVISION_FIELD', 'FormFragmentCache', 'configure_form_cache', 'get_form_cache', 'create_settings_field',
+           'create_settings_form', 'create_settings_form_container']
 
 # %% ../../nbs/components/forms.ipynb 3
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from fasthtml.common import *
@@ -17,23 +21,183 @@ from cjm_fasthtml_daisyui.utilities.semantic_colors import border_dui
 from cjm_fasthtml_tailwind.utilities.spacing import m
 from cjm_fasthtml_tailwind.core.base import combine_classes
 
+from cjm_fasthtml_jsonschema.components.fields import create_field
+from cjm_fasthtml_jsonschema.core.parser import SchemaParser
 from cjm_fasthtml_jsonschema.generators.form import generate_form_ui
+from ..core.compiled_schema import compile_schema
 from ..core.html_ids import SettingsHtmlIds as HtmlIds
 
 # %% ../../nbs/components/forms.ipynb 6
-def create_settings_form(
+class FormFragmentCache:
+    """Bounded LRU cache of rendered settings form bodies."""
+    
+    def __init__(
+        self,
+        maxsize: int = 128  # Maximum number of cached form fragments
+    ):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(
+        self,
+        key: tuple  # Key from `_form_cache_key`
+    ) -> Optional[tuple]:  # Cached (tag, attributes, rendered body), or None on a miss
+        """Return the cached fragment for a form, if present."""
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fragment
+            self.misses += 1
+            return None
+    
+    def put(
+        self,
+        key: tuple,  # Key from `_form_cache_key`
+        fragment: tuple  # (tag, attributes, rendered body) of the form
+    ):
+        """Store a rendered form fragment, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached fragments."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(
+        self
+    ) -> Dict[str, Any]:  # Hit/miss counters and current size
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+_form_cache: Optional[FormFragmentCache] = None
+
+def configure_form_cache(
+    maxsize: Optional[int] = 128  # Maximum number of cached forms (None or 0 disables caching)
+) -> Optional[FormFragmentCache]:  # The active cache, or None when disabled
+    """Enable, resize or disable the rendered form cache."""
+    global _form_cache
+    _form_cache = FormFragmentCache(maxsize) if maxsize else None
+    return _form_cache
+
+def get_form_cache() -> Optional[FormFragmentCache]:  # The active cache, or None when disabled
+    """Get the rendered form cache, if enabled."""
+    return _form_cache
+
+def _hash_values(
+    values: Optional[Dict[str, Any]]  # Current values for the form fields
+) -> Optional[str]:  # Canonical hash of the values, or None if they can't be serialized
+    """Hash form values independently of key order."""
+    try:
+        payload = json.dumps(values, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+def _form_cache_key(
     schema: Dict[str, Any],  # JSON schema for the form
-    values: Dict[str, Any],  # Current values for the form fields
+    values: Optional[Dict[str, Any]],  # Current values for the form fields
     post_url: str,  # URL for form submission
     reset_url: str,  # URL for resetting form to defaults
-    target_id: str = None  # HTML ID of target container (defaults to SETTINGS_CONTENT)
-) -> FT:  # Form element with settings and action buttons
-    """Create a settings form with action buttons."""
+    target_id: str,  # HTML ID of target container
+    field_patch_url: Optional[str] = None,  # URL for single-field saves, if enabled
+    revision: Optional[int] = None  # Revision of the saved configuration, if tracked
+) -> Optional[tuple]:  # Cache key, or None if the form can't be cached
+    """Build the fragment cache key for a form."""
+    values_hash = _hash_values(values)
+    if values_hash is None:
+        return None
+    return (compile_schema(schema).fingerprint, values_hash, post_url, reset_url, target_id, field_patch_url, revision)
 
-    # Use provided target_id or default to SETTINGS_CONTENT
-    if target_id is None:
-        target_id = HtmlIds.SETTINGS_CONTENT
+# %% ../../nbs/components/forms.ipynb 9
+def _field_patch_attrs(
+    field_name: str,  # Property name of the field
+    field_patch_url: str  # URL accepting single-field PATCH requests
+) -> Dict[str, str]:  # HTMX attributes for the field input
+    """Build the attributes that make an input save itself on change."""
+    return {
+        "hx_patch": field_patch_url,
+        "hx_vals": json.dumps({"field": field_name}),
+        "hx_params": f"field,{field_name}",
+        "hx_trigger": "change",
+        "hx_target": "this",
+        "hx_swap": "outerHTML"
+    }
+
+def _enable_field_patching(
+    node: Any,  # FT tree (or child) to walk
+    field_patch_url: str  # URL accepting single-field PATCH requests
+) -> Any:  # The same node, with field inputs wired for single-field saves
+    """Add single-field save attributes to every field input in a tree."""
+    if not isinstance(node, FT):
+        return node
+    field_name = node.attrs.get("name")
+    if field_name and str(node.attrs.get("id", "")) == HtmlIds.field(field_name):
+        node(**_field_patch_attrs(field_name, field_patch_url))
+    for child in node.children:
+        _enable_field_patching(child, field_patch_url)
+    return node
+
+def _find_field_input(
+    node: Any,  # FT tree (or child) to search
+    element_id: str  # HTML ID of the field input
+) -> Optional[FT]:  # The field input, or None if not found
+    """Find a field input by ID in a rendered field."""
+    if not isinstance(node, FT):
+        return None
+    if node.attrs.get("id") == element_id:
+        return node
+    for child in node.children:
+        found = _find_field_input(child, element_id)
+        if found is not None:
+            return found
+    return None
+
+def create_settings_field(
+    schema: Dict[str, Any],  # JSON schema the field belongs to
+    field_name: str,  # Property name of the field
+    value: Any,  # Current value of the field
+    field_patch_url: str  # URL accepting single-field PATCH requests
+) -> Optional[FT]:  # Field input wired for single-field saves, or None if unknown
+    """Render a single field input, e.g. as the response to a field-level save."""
+    prop = SchemaParser(schema).get_property(field_name)
+    if prop is None:
+        return None
+    field_input = _find_field_input(create_field(prop, value), HtmlIds.field(field_name))
+    if field_input is None:
+        return None
+    return field_input(**_field_patch_attrs(field_name, field_patch_url))
+
+# %% ../../nbs/components/forms.ipynb 12
+# Reserved name of the hidden form field carrying the revision a form was rendered from
+REVISION_FIELD = "__settings_revision__"
 
+def _build_settings_form(
+    schema: Dict[str, Any],  # JSON schema for the form
+    values: Dict[str, Any],  # Current values for the form fields
+    post_url: str,  # URL for form submission
+    reset_url: str,  # URL for resetting form to defaults
+    target_id: str,  # HTML ID of target container
+    field_patch_url: Optional[str] = None,  # URL for single-field saves (None to disable)
+    revision: Optional[int] = None  # Revision the form is rendered from (None to skip the conflict check)
+) -> FT:  # Form element with settings and action buttons
+    """Build the settings form FT tree."""
     # Build button attributes for Save button
     save_button_attrs = {
         "type": "submit",
@@ -57,15 +221,28 @@ def create_settings_form(
     if "onclick_reset" in schema:
         reset_button_attrs["onclick"] = schema["onclick_reset"]
 
+    form_ui = generate_form_ui(
+        schema=schema,
+        values=values,
+        show_title=True,
+        show_description=True,
+        compact=False,
+        card_wrapper=True
+    )
+    if field_patch_url:
+        _enable_field_patching(form_ui, field_patch_url)
+
+    # Submitted with the form so stale saves can be rejected
+    revision_input = Input(
+        type="hidden",
+        name=REVISION_FIELD,
+        value=str(revision),
+        id=HtmlIds.CONFIG_REVISION
+    ) if revision is not None else None
+
     return Form(
-        generate_form_ui(
-            schema=schema,
-            values=values,
-            show_title=True,
-            show_description=True,
-            compact=False,
-            card_wrapper=True
-        ),
+        form_ui,
+        revision_input,
 
         # Form actions
         Div(
@@ -90,7 +267,40 @@ def create_settings_form(
         hx_swap="innerHTML"
     )
 
-# %% ../../nbs/components/forms.ipynb 10
+
+def create_settings_form(
+    schema: Dict[str, Any],  # JSON schema for the form
+    values: Dict[str, Any],  # Current values for the form fields
+    post_url: str,  # URL for form submission
+    reset_url: str,  # URL for resetting form to defaults
+    target_id: str = None,  # HTML ID of target container (defaults to SETTINGS_CONTENT)
+    field_patch_url: Optional[str] = None,  # URL for single-field saves (None to disable)
+    revision: Optional[int] = None  # Revision the form is rendered from (None to skip the conflict check)
+) -> FT:  # Form element with settings and action buttons
+    """Create a settings form with action buttons."""
+
+    # Use provided target_id or default to SETTINGS_CONTENT
+    if target_id is None:
+        target_id = HtmlIds.SETTINGS_CONTENT
+
+    cache = _form_cache
+    if cache is None:
+        return _build_settings_form(schema, values, post_url, reset_url, target_id, field_patch_url, revision)
+
+    key = _form_cache_key(schema, values, post_url, reset_url, target_id, field_patch_url, revision)
+    if key is None:
+        return _build_settings_form(schema, values, post_url, reset_url, target_id, field_patch_url, revision)
+
+    cached = cache.get(key)
+    if cached is None:
+        form = _build_settings_form(schema, values, post_url, reset_url, target_id, field_patch_url, revision)
+        # Only the form body is pre-rendered; the <form> element itself stays an FT callers can inspect and extend
+        cached = (form.tag, dict(form.attrs), "".join(to_xml(child, indent=False) for child in form.children))
+        cache.put(key, cached)
+    tag, attrs, body = cached
+    return FT(tag, (NotStr(body),), dict(attrs))
+
+# %% ../../nbs/components/forms.ipynb 22
 def create_settings_form_container(
     schema: Dict[str, Any],  # JSON schema for the form
     values: Dict[str, Any],  # Current values for the form fields
@@ -98,7 +308,9 @@ def create_settings_form_container(
     reset_url: str,  # URL for resetting form to defaults
     alert_message: Optional[Any] = None,  # Optional alert element to display
     use_alert_container: bool = False,  # If True, add empty alert-container div
-    target_id: str = None  # HTML ID of target container (defaults to SETTINGS_CONTENT)
+    target_id: str = None,  # HTML ID of target container (defaults to SETTINGS_CONTENT)
+    field_patch_url: Optional[str] = None,  # URL for single-field saves (None to disable)
+    revision: Optional[int] = None  # Revision the form is rendered from (None to skip the conflict check)
 ) -> FT:  # Div containing the alert (if any) and the settings form
     """Create a container with optional alert and settings form."""
     children = []
@@ -116,7 +328,9 @@ def create_settings_form_container(
             values=values,
             post_url=post_url,
             reset_url=reset_url,
-            target_id=target_id
+            target_id=target_id,
+            field_patch_url=field_patch_url,
+            revision=revision
         )
     )
 
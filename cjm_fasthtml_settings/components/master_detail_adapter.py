@@ -3,20 +3,38 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/components/master_detail_adapter.ipynb.
 
 # %% auto 0
-__all__ = ['create_settings_detail_renderer', 'create_settings_data_loader', 'is_schema_configured',
+__all__ = ['create_settings_detail_renderer', 'create_settings_data_loader', 'is_schema_configured', 'get_configured_plugin_ids',
+           'is_plugin_configured', 'get_plugin_registry_state', 'LazyDetailItemGroup', 'LazyGroupMasterDetail',
            'create_settings_master_detail']
 
 # %% ../../nbs/components/master_detail_adapter.ipynb 3
-from typing import Dict, List, Union, Optional, Any
+import dataclasses
+import logging
+from typing import Dict, List, Union, Optional, Any, Callable
 from pathlib import Path
 from fasthtml.common import *
 
 from cjm_fasthtml_interactions.patterns.master_detail import MasterDetail, DetailItem, DetailItemGroup
 from cjm_fasthtml_interactions.core.context import InteractionContext
-from cjm_fasthtml_daisyui.components.data_display.badge import badge_colors
+from cjm_fasthtml_interactions.core.html_ids import InteractionHtmlIds
+from cjm_fasthtml_daisyui.components.data_display.badge import badge, badge_colors, badge_sizes
+from cjm_fasthtml_daisyui.components.feedback.loading import loading, loading_styles, loading_sizes
+from cjm_fasthtml_daisyui.components.navigation.menu import menu, menu_title, menu_modifiers
+from cjm_fasthtml_daisyui.utilities.semantic_colors import bg_dui
+from cjm_fasthtml_daisyui.utilities.border_radius import border_radius
+from cjm_fasthtml_tailwind.utilities.flexbox_and_grid import flex_display, shrink, items, justify, gap
+from cjm_fasthtml_tailwind.utilities.spacing import p, m
+from cjm_fasthtml_tailwind.utilities.sizing import w, h
+from cjm_fasthtml_tailwind.utilities.typography import font_weight
+from cjm_fasthtml_tailwind.utilities.layout import position, overflow
+from cjm_fasthtml_tailwind.utilities.transitions_and_animation import transition, duration
+from cjm_fasthtml_tailwind.core.base import combine_classes
 
+from ..core.schemas import registry
+from ..core.storage import get_storage_backend
 from cjm_fasthtml_settings.core.utils import (
     load_config,
+    get_config_revision,
     get_default_values_from_schema,
 )
 from .forms import create_settings_form_container
@@ -25,7 +43,9 @@ from .forms import create_settings_form_container
 def create_settings_detail_renderer(
     config_dir: Path,  # Configuration directory
     save_route_fn: callable,  # Function that returns save route URL for schema_id
-    reset_route_fn: callable  # Function that returns reset route URL for schema_id
+    reset_route_fn: callable,  # Function that returns reset route URL for schema_id
+    field_patch_route_fn: Optional[callable] = None,  # Function that returns the single-field save URL for schema_id
+    track_revisions: bool = True  # Embed the saved revision so stale saves can be rejected
 ) -> callable:  # Render function for detail view
     """Create a render function for settings detail view.
     
@@ -39,6 +59,9 @@ def create_settings_detail_renderer(
         schema = ctx.get_data("schema", {})
         schema_id = ctx.get_data("schema_id", "")
         
+        # Read the revision first: a save in between then causes a conflict rather than a lost update
+        revision = get_config_revision(schema_id, config_dir) if track_revisions else None
+        
         # Load existing config or use defaults
         saved_config = load_config(schema_id, config_dir)
         default_values = get_default_values_from_schema(schema)
@@ -50,7 +73,9 @@ def create_settings_detail_renderer(
             post_url=save_route_fn(schema_id),
             reset_url=reset_route_fn(schema_id),
             use_alert_container=True,
-            target_id=InteractionHtmlIds.MASTER_DETAIL_DETAIL  # Target the master-detail detail area
+            target_id=InteractionHtmlIds.MASTER_DETAIL_DETAIL,  # Target the master-detail detail area
+            field_patch_url=field_patch_route_fn(schema_id) if field_patch_route_fn else None,
+            revision=revision
         )
     
     return render_settings_detail
@@ -70,16 +95,293 @@ def create_settings_data_loader(
     
     return load_schema_data
 
+def _registered_schema(
+    schema_id: str,  # Schema identifier
+    schema: Dict  # Schema dict from the `schemas` passed to the adapter
+) -> Any:  # The registry's compiled copy when it was registered from `schema`, otherwise `schema` itself
+    """Prefer the registry's frozen schema so renders don't compile the dict again."""
+    registered = registry.get_registered_schema(schema_id, schema)
+    return registered if registered is not None else schema
+
 # %% ../../nbs/components/master_detail_adapter.ipynb 9
 def is_schema_configured(
     schema_id: str,  # Schema identifier
     config_dir: Path  # Configuration directory
 ) -> bool:  # True if config file exists
     """Check if a schema has been configured."""
-    config_file = config_dir / f"{schema_id}.json"
-    return config_file.exists()
+    return schema_id in get_storage_backend().get_configured_ids(config_dir)
 
 # %% ../../nbs/components/master_detail_adapter.ipynb 11
+_logger = logging.getLogger(__name__)
+
+def get_configured_plugin_ids(
+    plugin_registry: Any  # Plugin registry (must implement PluginRegistryProtocol)
+) -> Optional[frozenset]:  # Configured plugin IDs, or None if the registry has no bulk probe
+    """Get all configured plugin IDs in one call when the registry supports it."""
+    get_ids = getattr(plugin_registry, "get_configured_plugin_ids", None)
+    if get_ids is None:
+        return None
+    try:
+        return frozenset(get_ids())
+    except Exception as e:
+        _logger.warning("Error getting configured plugin IDs, falling back to per-plugin checks: %s", e)
+        return None
+
+def is_plugin_configured(
+    plugin_registry: Any,  # Plugin registry (must implement PluginRegistryProtocol)
+    plugin_id: str,  # Plugin unique ID
+    configured_plugin_ids: Optional[frozenset] = None  # Result of `get_configured_plugin_ids` (if available)
+) -> bool:  # True if the plugin has a saved configuration
+    """Check if a plugin has been configured."""
+    if configured_plugin_ids is not None:
+        return plugin_id in configured_plugin_ids
+    try:
+        return bool(plugin_registry.load_plugin_config(plugin_id))
+    except Exception:
+        return False
+
+def get_plugin_registry_state(
+    plugin_registry: Any  # Plugin registry (None when plugins are disabled)
+) -> Any:  # Hashable value that changes when the registered plugins change
+    """Get a value identifying the plugins a registry currently provides."""
+    if plugin_registry is None:
+        return None
+    version = getattr(plugin_registry, "version", None)
+    if version is not None:
+        return version
+    # Registries without a version counter are fingerprinted by their plugin IDs per category
+    return tuple(
+        (category, tuple(sorted(plugin.get_unique_id() for plugin in plugin_registry.get_plugins_by_category(category))))
+        for category in sorted(plugin_registry.get_categories_with_plugins())
+    )
+
+# %% ../../nbs/components/master_detail_adapter.ipynb 15
+@dataclasses.dataclass
+class LazyDetailItemGroup(DetailItemGroup):
+    """DetailItemGroup whose items are built the first time they are needed."""
+    item_ids: tuple = ()  # IDs of the items `load_items` returns, known without building them
+    load_items: Optional[Callable[[], List[DetailItem]]] = None  # Builds the items (None once loaded)
+
+class LazyGroupMasterDetail(MasterDetail):
+    """MasterDetail whose collapsed groups load their items on first expansion."""
+    
+    def __init__(
+        self,
+        *args,
+        group_items_route_fn: Callable[[str], str],  # Function that returns the items route URL for a group ID
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.group_items_route_fn = group_items_route_fn
+        self.group_index = {item.id: item for item in self.items if isinstance(item, DetailItemGroup)}
+        # Item ID -> group that builds it, for items of groups that haven't been loaded yet
+        self.deferred_index = {
+            item_id: group
+            for group in self.group_index.values() if isinstance(group, LazyDetailItemGroup) and group.load_items
+            for item_id in group.item_ids
+        }
+        default_item = kwargs.get("default_item")
+        if default_item in self.deferred_index or (self.default_item is None and self.deferred_index):
+            self.default_item = default_item if default_item in self.deferred_index else next(iter(self.deferred_index))
+    
+    def _load_group(
+        self,
+        group: DetailItemGroup  # Group whose items are needed
+    ) -> DetailItemGroup:  # The same group with its items built
+        """Build a deferred group's items and add them to the item index."""
+        load_items = getattr(group, "load_items", None)
+        if load_items is not None:
+            loaded = list(load_items())
+            for item in loaded:
+                self.item_index.setdefault(item.id, item)
+            group.items = loaded
+            group.load_items = None
+        return group
+    
+    def get_item(
+        self,
+        item_id: str  # Item identifier
+    ) -> Optional[DetailItem]:  # DetailItem or None
+        """Get item by ID, building its group first if it was deferred."""
+        item = self.item_index.get(item_id)
+        if item is None and item_id in self.deferred_index:
+            self._load_group(self.deferred_index[item_id])
+            item = self.item_index.get(item_id)
+        return item
+    
+    def _render_entry_content(
+        self,
+        label: str,  # Text of the entry
+        icon: Any,  # Optional icon element
+        badge_text: Optional[str],  # Optional badge text
+        badge_color: Optional[str],  # Badge color class
+        label_cls: str  # Classes for the label
+    ) -> FT:  # Row with icon, label and badge
+        """Render the contents of a sidebar link or group header."""
+        content = [icon] if icon else []
+        content.append(Span(label, cls=label_cls))
+        if badge_text:
+            content.append(Span(
+                badge_text,
+                cls=combine_classes(badge, badge_color or badge_colors.success, badge_sizes.xs, m.l(2))
+            ))
+        return Div(*content, cls=combine_classes(flex_display, items.center, justify.between, w.full, gap(2)))
+    
+    def _render_item(
+        self,
+        item: DetailItem,  # Item to render
+        active_item_id: Optional[str],  # Currently active item ID
+        item_route_func: Callable[[str], str]  # Function to generate item route
+    ) -> FT:  # Sidebar link for the item
+        """Render a single sidebar item."""
+        is_active = item.id == active_item_id
+        url = item_route_func(item.id)
+        return Li(
+            A(
+                self._render_entry_content(
+                    item.label, item.icon, item.badge_text, item.badge_color,
+                    str(font_weight.medium if is_active else "")
+                ),
+                href=url,
+                hx_get=url,
+                hx_target=InteractionHtmlIds.as_selector(self.detail_id),
+                hx_swap="innerHTML",
+                hx_push_url="true",
+                cls=combine_classes(menu_modifiers.active if is_active else "", transition.colors, duration(200))
+            ),
+            id=InteractionHtmlIds.master_item(item.id)
+        )
+    
+    def _render_group_summary(
+        self,
+        group: DetailItemGroup  # Group whose header is rendered
+    ) -> FT:  # Clickable group header
+        """Render a group's header with its title and badge."""
+        return Summary(self._render_entry_content(
+            group.title, group.icon, group.badge_text, group.badge_color, str(font_weight.medium)
+        ))
+    
+    def _render_group_details(
+        self,
+        group: DetailItemGroup,  # Group to render with all of its items
+        active_item_id: Optional[str],  # Currently active item ID
+        item_route_func: Callable[[str], str],  # Function to generate item route
+        is_open: bool  # Whether the group is rendered expanded
+    ) -> FT:  # `Details` element with the group's items
+        """Render a group's header and items."""
+        group = self._load_group(group)
+        return Details(
+            self._render_group_summary(group),
+            Ul(*(self._render_item(item, active_item_id, item_route_func) for item in group.items)),
+            open=is_open
+        )
+    
+    def _render_lazy_group(
+        self,
+        group: DetailItemGroup  # Collapsed group to render
+    ) -> FT:  # Group header that loads its items when opened
+        """Render a collapsed group as a header with a loading placeholder."""
+        return Details(
+            self._render_group_summary(group),
+            Ul(Li(Span(cls=combine_classes(loading, loading_styles.dots, loading_sizes.sm)))),
+            hx_get=self.group_items_route_fn(group.id),
+            hx_trigger="toggle once",
+            hx_target="this",
+            hx_swap="outerHTML"
+        )
+    
+    def _group_has_item(
+        self,
+        group: DetailItemGroup,  # Group to check
+        item_id: Optional[str]  # Item ID to look for
+    ) -> bool:  # True if the item belongs to the group
+        """Check group membership without building deferred items."""
+        if getattr(group, "load_items", None) is not None:
+            return item_id in group.item_ids
+        return any(item.id == item_id for item in group.items)
+    
+    def _render_menu_entries(
+        self,
+        active_item_id: str,  # Currently active item ID
+        item_route_func: Callable[[str], str]  # Function to generate item route
+    ) -> list:  # Sidebar `Li` elements
+        """Render the sidebar entries, deferring the contents of collapsed groups."""
+        menu_items = []
+        if self.master_title:
+            menu_items.append(Li(Span(self.master_title, cls=str(menu_title))))
+        
+        for entry in self.items:
+            if not isinstance(entry, DetailItemGroup):
+                menu_items.append(self._render_item(entry, active_item_id, item_route_func))
+                continue
+            if entry.default_open or self._group_has_item(entry, active_item_id):
+                details = self._render_group_details(entry, active_item_id, item_route_func, is_open=True)
+            else:
+                details = self._render_lazy_group(entry)
+            menu_items.append(Li(details, id=InteractionHtmlIds.master_group(entry.id)))
+        return menu_items
+    
+    def render_master(
+        self,
+        active_item_id: str,  # Currently active item ID
+        item_route_func: Callable[[str], str],  # Function to generate item route
+        include_wrapper: bool = True  # Whether to include outer wrapper div
+    ) -> FT:  # Master list element
+        """Render the sidebar, deferring the contents of collapsed groups."""
+        menu_ul = Ul(
+            *self._render_menu_entries(active_item_id, item_route_func),
+            id=self.master_id,
+            cls=combine_classes(menu, bg_dui.base_200, self.master_width, p(4), h.auto, border_radius.box)
+        )
+        if not include_wrapper:
+            return menu_ul
+        return Div(menu_ul, cls=combine_classes(shrink(0), position.sticky, overflow.y.auto, h.full))
+    
+    def _find_master_menu(
+        self,
+        node: Any  # FT tree (or child) to search
+    ) -> Optional[FT]:  # The master list `Ul`, or None if not found
+        """Find the master list element in a rendered interface."""
+        if not isinstance(node, FT):
+            return None
+        if node.attrs.get("id") == self.master_id:
+            return node
+        for child in node.children:
+            found = self._find_master_menu(child)
+            if found is not None:
+                return found
+        return None
+    
+    def render_full_interface(
+        self,
+        active_item_id: str,  # Currently active item ID
+        item_route_func: Callable[[str], str],  # Function to generate item route
+        request: Any,  # FastHTML request object
+        sess: Any  # FastHTML session object
+    ) -> FT:  # Complete master-detail interface
+        """Render the complete interface with the lazily rendered sidebar."""
+        interface = super().render_full_interface(active_item_id, item_route_func, request, sess)
+        if self.get_item(active_item_id) is None:
+            active_item_id = self.default_item
+        # Keep the drawer layout, but swap in sidebar entries that defer collapsed groups
+        master_menu = self._find_master_menu(interface)
+        if master_menu is not None:
+            master_menu.children = tuple(self._render_menu_entries(active_item_id, item_route_func))
+        return interface
+    
+    def render_group_items(
+        self,
+        group_id: str,  # ID of the group being expanded
+        active_item_id: Optional[str],  # Currently active item ID
+        item_route_func: Callable[[str], str]  # Function to generate item route
+    ) -> Optional[FT]:  # Expanded group contents, or None if the group doesn't exist
+        """Render the expanded `Details` element of a lazily loaded group."""
+        group = self.group_index.get(group_id)
+        if group is None:
+            return None
+        return self._render_group_details(group, active_item_id, item_route_func, is_open=True)
+
+# %% ../../nbs/components/master_detail_adapter.ipynb 17
 def create_settings_master_detail(
     schemas: Dict,  # All registered schemas (from registry.get_all())
     config_dir: Path,  # Configuration directory
@@ -89,7 +391,9 @@ def create_settings_master_detail(
     menu_section_title: str = "Settings",  # Title for master list
     plugin_registry: Optional[Any] = None,  # Optional plugin registry
     plugin_save_route_fn: Optional[callable] = None,  # Function that returns save route URL for plugin_id
-    plugin_reset_route_fn: Optional[callable] = None  # Function that returns reset route URL for plugin_id
+    plugin_reset_route_fn: Optional[callable] = None,  # Function that returns reset route URL for plugin_id
+    group_items_route_fn: Optional[callable] = None,  # If set, collapsed groups load their items from this route
+    field_patch_route_fn: Optional[callable] = None  # If set, schema fields save individually through this route
 ) -> MasterDetail:  # Configured MasterDetail instance
     """Create a MasterDetail instance configured for settings.
     
@@ -99,46 +403,63 @@ def create_settings_master_detail(
     from cjm_fasthtml_settings.core.schema_group import SchemaGroup
     
     # Create the settings detail renderer for regular schemas
-    render_fn = create_settings_detail_renderer(config_dir, save_route_fn, reset_route_fn)
+    render_fn = create_settings_detail_renderer(config_dir, save_route_fn, reset_route_fn, field_patch_route_fn)
     
     # Create a separate renderer for plugins if plugin routes are provided
     plugin_render_fn = None
     if plugin_save_route_fn and plugin_reset_route_fn:
-        plugin_render_fn = create_settings_detail_renderer(config_dir, plugin_save_route_fn, plugin_reset_route_fn)
+        # Plugin configs are saved through the plugin registry, which doesn't track revisions
+        plugin_render_fn = create_settings_detail_renderer(
+            config_dir, plugin_save_route_fn, plugin_reset_route_fn, track_revisions=False
+        )
+    
+    # Fetch the configured IDs once for all "configured" badges
+    configured_ids = get_storage_backend().get_configured_ids(config_dir)
+    
+    def make_group(
+        item_ids: list,  # IDs of the group's items
+        load_items: Callable[[], list],  # Builds the group's DetailItems
+        **group_kwargs
+    ) -> DetailItemGroup:
+        # With lazy groups, collapsed groups build their items only when they are first needed
+        if group_items_route_fn and not group_kwargs.get("default_open", True):
+            return LazyDetailItemGroup(items=[], item_ids=tuple(item_ids), load_items=load_items, **group_kwargs)
+        return DetailItemGroup(items=load_items(), **group_kwargs)
     
     # Convert schemas to DetailItems and DetailItemGroups
     items = []
     
     for schema_entry in schemas.values():
         if isinstance(schema_entry, SchemaGroup):
-            # Handle schema groups
-            group_items = []
-            configured_count = 0
+            # Handle schema groups; generate proper unique_ids using the group's method
+            group_schemas = [
+                (schema_entry.get_unique_id(schema_key), sub_schema)
+                for schema_key, sub_schema in schema_entry.schemas.items()
+            ]
+            configured_count = sum(1 for schema_id, _ in group_schemas if schema_id in configured_ids)
             
-            # Iterate over items to get both key and value
-            for schema_key, sub_schema in schema_entry.schemas.items():
-                # Generate proper unique_id using the group's method
-                schema_id = schema_entry.get_unique_id(schema_key)
-                configured = is_schema_configured(schema_id, config_dir)
-                if configured:
-                    configured_count += 1
-                
-                group_items.append(
-                    DetailItem(
-                        id=schema_id,
-                        label=sub_schema.get("menu_title", sub_schema.get("title", schema_id)),
-                        render=render_fn,
-                        data_loader=create_settings_data_loader(sub_schema, schema_id),
-                        badge_text="configured" if configured else None,
-                        badge_color=badge_colors.success if configured else None
+            def load_group_items(group_schemas=group_schemas):
+                group_items = []
+                for schema_id, sub_schema in group_schemas:
+                    configured = schema_id in configured_ids
+                    group_items.append(
+                        DetailItem(
+                            id=schema_id,
+                            label=sub_schema.get("menu_title", sub_schema.get("title", schema_id)),
+                            render=render_fn,
+                            data_loader=create_settings_data_loader(_registered_schema(schema_id, sub_schema), schema_id),
+                            badge_text="configured" if configured else None,
+                            badge_color=badge_colors.success if configured else None
+                        )
                     )
-                )
+                return group_items
             
             items.append(
-                DetailItemGroup(
+                make_group(
+                    [schema_id for schema_id, _ in group_schemas],
+                    load_group_items,
                     id=schema_entry.name,
                     title=schema_entry.title,
-                    items=group_items,
                     default_open=schema_entry.default_open,
                     badge_text=f"{configured_count} configured" if configured_count > 0 else None,
                     badge_color=badge_colors.success if configured_count > 0 else None
@@ -148,14 +469,14 @@ def create_settings_master_detail(
             # Handle individual schemas
             schema = schema_entry
             schema_id = schema.get("unique_id", schema.get("name"))
-            configured = is_schema_configured(schema_id, config_dir)
+            configured = schema_id in configured_ids
             
             items.append(
                 DetailItem(
                     id=schema_id,
                     label=schema.get("menu_title", schema.get("title", schema_id)),
                     render=render_fn,
-                    data_loader=create_settings_data_loader(schema, schema_id),
+                    data_loader=create_settings_data_loader(_registered_schema(schema_id, schema), schema_id),
                     badge_text="configured" if configured else None,
                     badge_color=badge_colors.success if configured else None
                 )
@@ -163,60 +484,67 @@ def create_settings_master_detail(
     
     # Add plugin items if registry is provided
     if plugin_registry and plugin_render_fn:
+        # Probe all plugin configurations at once when the registry supports it
+        configured_plugin_ids = get_configured_plugin_ids(plugin_registry)
+        
         # Get all categories
         categories_with_plugins = plugin_registry.get_categories_with_plugins()
         
         for category in categories_with_plugins:
-            # Get plugins for this category
-            category_plugins = plugin_registry.get_plugins_by_category(category)
-            plugin_items = []
+            # Get the configurable plugins for this category, using the proper unique_id format (category_name)
+            category_plugins = [
+                (plugin_metadata.get_unique_id(), plugin_metadata)
+                for plugin_metadata in plugin_registry.get_plugins_by_category(category)
+                if plugin_metadata.config_schema
+            ]
+            if not category_plugins:
+                continue
             
-            for plugin_metadata in category_plugins:
-                if plugin_metadata.config_schema:
-                    # Use the proper unique_id format (category_name)
-                    plugin_id = plugin_metadata.get_unique_id()
-                    
-                    # Check if plugin is configured
-                    try:
-                        config_data = plugin_registry.load_plugin_config(plugin_id)
-                        configured = bool(config_data)
-                    except:
-                        configured = False
-                    
-                    plugin_items.append(
-                        DetailItem(
-                            id=plugin_id,
-                            label=plugin_metadata.title,
-                            render=plugin_render_fn,  # Use plugin-specific renderer
-                            data_loader=create_settings_data_loader(
-                                plugin_metadata.config_schema,
-                                plugin_id
-                            ),
-                            badge_text="configured" if configured else None,
-                            badge_color=badge_colors.success if configured else None
-                        )
-                    )
+            # Check which plugins are configured
+            configured_plugins = {
+                plugin_id for plugin_id, _ in category_plugins
+                if is_plugin_configured(plugin_registry, plugin_id, configured_plugin_ids)
+            }
             
-            if plugin_items:
-                configured_count = sum(1 for item in plugin_items if item.badge_text == "configured")
-                display_name = plugin_registry.get_category_display_name(category)
-                
-                items.append(
-                    DetailItemGroup(
-                        id=f"plugins-{category.lower().replace(' ', '-')}",
-                        title=display_name or f"{category.title()} Plugins",
-                        items=plugin_items,
-                        default_open=False,
-                        badge_text=f"{configured_count}/{len(plugin_items)}" if configured_count > 0 else None,
-                        badge_color=badge_colors.info
+            def load_plugin_items(category_plugins=category_plugins, configured_plugins=configured_plugins):
+                return [
+                    DetailItem(
+                        id=plugin_id,
+                        label=plugin_metadata.title,
+                        render=plugin_render_fn,  # Use plugin-specific renderer
+                        data_loader=create_settings_data_loader(
+                            plugin_metadata.config_schema,
+                            plugin_id
+                        ),
+                        badge_text="configured" if plugin_id in configured_plugins else None,
+                        badge_color=badge_colors.success if plugin_id in configured_plugins else None
                     )
+                    for plugin_id, plugin_metadata in category_plugins
+                ]
+            
+            configured_count = len(configured_plugins)
+            display_name = plugin_registry.get_category_display_name(category)
+            
+            items.append(
+                make_group(
+                    [plugin_id for plugin_id, _ in category_plugins],
+                    load_plugin_items,
+                    id=f"plugins-{category.lower().replace(' ', '-')}",
+                    title=display_name or f"{category.title()} Plugins",
+                    default_open=False,
+                    badge_text=f"{configured_count}/{len(category_plugins)}" if configured_count > 0 else None,
+                    badge_color=badge_colors.info
                 )
+            )
     
     # Create and return the MasterDetail instance
-    return MasterDetail(
+    md_kwargs = dict(
         interface_id="settings",
         items=items,
         default_item=default_schema,
         master_title=menu_section_title,
         master_width="w-64"
     )
+    if group_items_route_fn:
+        return LazyGroupMasterDetail(group_items_route_fn=group_items_route_fn, **md_kwargs)
+    return MasterDetail(**md_kwargs)
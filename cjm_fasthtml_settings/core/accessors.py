@@ -0,0 +1,179 @@
+"""Typed, read-only settings classes generated from schemas for fast attribute access on request hot paths"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/accessors.ipynb.
+
+# %% auto 0
+__all__ = ['get_settings_class', 'get_settings']
+
+# %% ../../nbs/core/accessors.ipynb 3
+import keyword
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .compiled_schema import CompiledSchema, compile_schema, freeze_value, thaw_value
+from .utils import get_config_version, load_config
+
+# %% ../../nbs/core/accessors.ipynb 6
+# Python annotation for each JSON Schema type
+_JSON_TYPE_ANNOTATIONS = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "array": "list",
+    "object": "dict",
+}
+
+# Field kinds whose values are never containers, so they are stored without freezing
+_SCALAR_KINDS = frozenset({"boolean", "integer", "number"})
+
+# Attributes of every generated class that properties can't shadow
+_RESERVED_NAMES = frozenset({"from_config", "to_dict"})
+
+# Generated settings classes by schema fingerprint
+_settings_classes: Dict[str, type] = {}
+_settings_classes_lock = threading.Lock()
+
+# (compiled schema, settings class) by id of the compiled schema, oldest first, so repeat lookups skip the fingerprint
+_classes_by_compiled: OrderedDict = OrderedDict()
+_CLASSES_BY_COMPILED_MAXSIZE = 256
+
+def _get_annotation_source(
+    prop_schema: Dict[str, Any]  # Property schema
+) -> str:  # Source of the attribute's type annotation
+    """Translate a property's JSON Schema type into a Python annotation."""
+    prop_type = prop_schema.get("type")
+    types = prop_type if isinstance(prop_type, list) else [prop_type]
+    annotations = [_JSON_TYPE_ANNOTATIONS[t] for t in types if t in _JSON_TYPE_ANNOTATIONS]
+    if len(annotations) != 1:
+        return "Any"
+    return f"Optional[{annotations[0]}]" if "null" in types else annotations[0]
+
+def _get_settings_class_name(
+    compiled: CompiledSchema  # Compiled schema the class is generated for
+) -> str:  # Class name derived from the schema name
+    """Build a CamelCase class name from the schema's name or title."""
+    name = compiled.schema.get("name") or compiled.schema.get("title") or ""
+    class_name = "".join(part[:1].upper() + part[1:] for part in re.findall(r"[A-Za-z0-9]+", str(name))) + "Settings"
+    return class_name if class_name.isidentifier() else "Settings"
+
+def _generate_settings_class_source(
+    compiled: CompiledSchema,  # Compiled schema to specialize for
+    class_name: str  # Name of the generated class
+) -> str:  # Python source of the class
+    """Generate the source of a read-only `__slots__` class with one attribute per property."""
+    properties = compiled.schema.get("properties", {})
+    names = [prop_name for prop_name, _ in compiled.fields]
+    invalid = [name for name in names
+               if not name.isidentifier() or keyword.iskeyword(name) or name.startswith("_") or name in _RESERVED_NAMES]
+    if invalid:
+        raise ValueError(f"Properties can't be used as settings attributes: {', '.join(map(repr, invalid))}")
+    
+    # Defaults are bound as `_default_<i>` names in the namespace the class is executed in
+    defaults = [f"_default_{i}" if name in compiled.defaults else "None" for i, name in enumerate(names)]
+    values = ", ".join(f"self.{name}" for name in names)
+    lines = [f"class {class_name}:",
+             f"    {compiled.schema.get('title', class_name)!r}",
+             f"    __slots__ = {tuple(names)!r}"]
+    lines += [f"    {name}: {_get_annotation_source(properties[name])}" for name in names]
+    lines += ["",
+              f"    def __init__(self{', *, ' if names else ''}{', '.join(f'{n}={d}' for n, d in zip(names, defaults))}):"]
+    # Instances are cached and shared, so arrays and objects are stored as read-only copies
+    lines += [f"        _set(self, {name!r}, {name if kind in _SCALAR_KINDS else f'_freeze({name})'})"
+              for name, kind in compiled.fields] or ["        pass"]
+    lines += ["",
+              "    @classmethod",
+              "    def from_config(cls, config):",
+              "        get = config.get",
+              f"        return cls({', '.join(f'{n}=get({n!r}, {d})' for n, d in zip(names, defaults))})",
+              "",
+              "    def to_dict(self):",
+              f"        return {{{', '.join(f'{n!r}: ' + (f'self.{n}' if k in _SCALAR_KINDS else f'_thaw(self.{n})') for n, k in compiled.fields)}}}",
+              "",
+              "    def __setattr__(self, name, value):",
+              "        raise AttributeError(f'{type(self).__name__} is read-only')",
+              "",
+              "    def __delattr__(self, name):",
+              "        raise AttributeError(f'{type(self).__name__} is read-only')",
+              "",
+              "    def __eq__(self, other):",
+              "        if other.__class__ is not self.__class__:",
+              "            return NotImplemented",
+              f"        return ({values}{',' if len(names) == 1 else ''}) == "
+              f"({', '.join(f'other.{n}' for n in names)}{',' if len(names) == 1 else ''})",
+              "",
+              "    def __repr__(self):",
+              f"        return f'{class_name}({', '.join(f'{n}={{self.{n}!r}}' for n in names)})'"]
+    return "\n".join(lines) + "\n"
+
+def _generate_settings_class(
+    compiled: CompiledSchema,  # Compiled schema to generate the class for
+    fingerprint: str  # The schema's fingerprint
+) -> type:  # Generated class (or the one another thread registered first)
+    """Generate the settings class for a schema and cache it by fingerprint."""
+    class_name = _get_settings_class_name(compiled)
+    source = _generate_settings_class_source(compiled, class_name)
+    namespace = {"__name__": __name__, "_set": object.__setattr__, "_freeze": freeze_value, "_thaw": thaw_value,
+                 "Any": Any, "Optional": Optional}
+    for i, (prop_name, _) in enumerate(compiled.fields):
+        if prop_name in compiled.defaults:
+            namespace[f"_default_{i}"] = compiled.defaults[prop_name]
+    exec(compile(source, f"<settings class {fingerprint}>", "exec"), namespace)
+    settings_class = namespace[class_name]
+    type.__setattr__(settings_class, "_source", source)
+    with _settings_classes_lock:
+        return _settings_classes.setdefault(fingerprint, settings_class)
+
+def get_settings_class(
+    schema: Dict[str, Any]  # JSON Schema (or CompiledSchema) to generate the class for
+) -> type:  # Read-only settings class with one typed attribute per property
+    """Get the settings class generated for a schema, generating it on first use."""
+    compiled = compile_schema(schema)
+    # The entry keeps the compiled schema alive, so a matching id is the same object
+    entry = _classes_by_compiled.get(id(compiled))
+    if entry is not None and entry[0] is compiled:
+        return entry[1]
+    
+    fingerprint = compiled.fingerprint
+    settings_class = _settings_classes.get(fingerprint)
+    if settings_class is None:
+        settings_class = _generate_settings_class(compiled, fingerprint)
+    with _settings_classes_lock:
+        _classes_by_compiled[id(compiled)] = (compiled, settings_class)
+        while len(_classes_by_compiled) > _CLASSES_BY_COMPILED_MAXSIZE:
+            _classes_by_compiled.popitem(last=False)
+    return settings_class
+
+# %% ../../nbs/core/accessors.ipynb 12
+# (config version, settings class, instance) by (config directory, config ID)
+_settings_instances: Dict[Tuple[str, str], Tuple[Optional[str], type, Any]] = {}
+_settings_instances_lock = threading.Lock()
+
+def get_settings(
+    schema_name: str,  # Name of the schema (or unique_id for grouped schemas)
+    schema: Dict[str, Any],  # JSON Schema dictionary
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> Any:  # Instance of the schema's settings class holding defaults merged with saved values
+    """Get a configuration as a read-only settings object, rebuilt only when the saved configuration changes."""
+    if config_dir is None:
+        from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
+        config_dir = DEFAULT_CONFIG_DIR
+    
+    # Use unique_id if present (for grouped schemas), otherwise use schema_name
+    config_id = schema.get("unique_id", schema_name)
+    settings_class = get_settings_class(schema)
+    key = (os.fspath(config_dir), config_id)
+    # Read the version before loading: a save in between leaves a stale version, so the next call rebuilds
+    version = get_config_version(config_id, config_dir)
+    entry = _settings_instances.get(key)
+    if entry is not None and entry[0] == version and entry[1] is settings_class:
+        return entry[2]
+    
+    settings = settings_class.from_config(load_config(config_id, config_dir))
+    with _settings_instances_lock:
+        _settings_instances[key] = (version, settings_class, settings)
+    return settings
@@ -0,0 +1,314 @@
+"""Stat-validated in-memory caches for configuration files and directories"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/cache.ipynb.
+
+# %% auto 0
+__all__ = ['config_cache', 'config_index', 'get_file_signature', 'get_dir_key', 'ConfigCache', 'ConfigDirIndex']
+
+# %% ../../nbs/core/cache.ipynb 3
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, Tuple, Union
+
+# %% ../../nbs/core/cache.ipynb 5
+def get_file_signature(
+    stat_result: os.stat_result  # Result of `os.stat` or `os.fstat`
+) -> Tuple[int, int, int]:  # (mtime_ns, size, inode)
+    """Build the cache validation signature for a configuration file."""
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+@lru_cache(maxsize=256)
+def get_dir_key(
+    config_dir: Union[str, Path]  # Directory where config files are stored
+) -> str:  # Normalized directory path used as a cache key
+    """Normalize a config directory once; parsing it with `Path` on every lookup dominates warm loads."""
+    return os.fspath(Path(config_dir))
+
+# %% ../../nbs/core/cache.ipynb 6
+class ConfigCache:
+    """Bounded LRU cache of parsed configuration files, validated against file signatures."""
+    
+    def __init__(
+        self,
+        maxsize: int = 256  # Maximum number of cached configurations
+    ):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._watched: set = set()  # Directories whose changes are pushed by a watcher
+        self._epoch = 0  # Incremented by every invalidation
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(
+        schema_name: str,  # Name of the schema/configuration
+        config_dir: Union[str, Path]  # Directory where config files are stored
+    ) -> Tuple[str, str]:  # Cache key
+        """Build the cache key for a configuration."""
+        return (get_dir_key(config_dir), schema_name)
+    
+    def get(
+        self,
+        schema_name: str,  # Name of the schema/configuration
+        config_dir: Union[str, Path],  # Directory where config files are stored
+        signature: Tuple[int, int, int]  # Current file signature from `get_file_signature`
+    ) -> Optional[Dict[str, Any]]:  # Cached configuration, or None on a miss
+        """Return the cached configuration if it matches the current file signature."""
+        key = self._key(schema_name, config_dir)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+    
+    def get_watched(
+        self,
+        schema_name: str,  # Name of the schema/configuration
+        config_dir: Union[str, Path]  # Directory where config files are stored
+    ) -> Optional[Tuple[Tuple[int, int, int], Dict[str, Any]]]:  # (signature, configuration), or None
+        """Return a cached entry without a file signature if a watcher pushes changes for its directory."""
+        key = self._key(schema_name, config_dir)
+        with self._lock:
+            if key[0] not in self._watched:
+                return None
+            entry = self._entries.get(key)
+            if entry is None or not entry[2]:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+    
+    def put(
+        self,
+        schema_name: str,  # Name of the schema/configuration
+        config_dir: Union[str, Path],  # Directory where config files are stored
+        signature: Tuple[int, int, int],  # File signature the configuration was read from
+        config: Dict[str, Any],  # Parsed configuration
+        epoch: Optional[int] = None  # `epoch` read before the file was read (lets `get_watched` serve the entry)
+    ):
+        """Store a parsed configuration, evicting the least recently used entries."""
+        key = self._key(schema_name, config_dir)
+        with self._lock:
+            # An invalidation since `epoch` may describe a change this read missed
+            self._entries[key] = (signature, config, epoch == self._epoch)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(
+        self,
+        schema_name: Optional[str] = None,  # Schema to drop (None for all schemas)
+        config_dir: Optional[Union[str, Path]] = None  # Directory to drop (None for all directories)
+    ) -> int:  # Number of entries removed
+        """Drop cached entries matching the given schema and/or directory."""
+        if schema_name is not None and config_dir is not None:
+            with self._lock:
+                self._epoch += 1
+                return 1 if self._entries.pop(self._key(schema_name, config_dir), None) else 0
+        
+        dir_key = get_dir_key(config_dir) if config_dir is not None else None
+        with self._lock:
+            self._epoch += 1
+            keys = [
+                key for key in self._entries
+                if (dir_key is None or key[0] == dir_key)
+                and (schema_name is None or key[1] == schema_name)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+    
+    @property
+    def epoch(self) -> int:  # Invalidation counter
+        """Read before loading a file and pass to `put`, so reads racing an invalidation aren't trusted."""
+        return self._epoch
+    
+    def watch(
+        self,
+        config_dir: Union[str, Path]  # Directory whose changes are now pushed by a watcher
+    ):
+        """Serve entries of a directory through `get_watched` without checking file signatures."""
+        with self._lock:
+            self._watched.add(get_dir_key(config_dir))
+    
+    def unwatch(
+        self,
+        config_dir: Union[str, Path]  # Directory no longer covered by a watcher
+    ):
+        """Go back to validating a directory's entries against file signatures."""
+        with self._lock:
+            self._watched.discard(get_dir_key(config_dir))
+        self.invalidate(config_dir=config_dir)
+    
+    def is_watched(
+        self,
+        config_dir: Union[str, Path]  # Directory where config files are stored
+    ) -> bool:  # True if a watcher pushes changes for the directory
+        """Check if a directory's entries are kept current by a watcher."""
+        return get_dir_key(config_dir) in self._watched
+    
+    def stats(
+        self
+    ) -> Dict[str, Any]:  # Hit/miss counters and current size
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+    
+    def reset_stats(self):
+        """Reset the hit/miss counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+# %% ../../nbs/core/cache.ipynb 9
+class ConfigDirIndex:
+    """Per-directory set of configured schema IDs, refreshed only when the directory changes."""
+    
+    # Listings taken within this window of the directory mtime are re-checked on the next access
+    racy_window_ns: int = 2_000_000_000
+    
+    def __init__(self):
+        self.generation = 0
+        self.scans = 0
+        self._entries: Dict[str, Tuple[Optional[int], frozenset, bool]] = {}
+        self._watched: set = set()  # Directories whose changes are pushed by a watcher
+        self._invalidations = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _scan(
+        dir_key: str  # Directory to list
+    ) -> frozenset:  # Schema IDs with a saved config file
+        """List a configuration directory once and collect the configured IDs."""
+        with os.scandir(dir_key) as entries:
+            return frozenset(
+                entry.name[:-5] for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith(".")
+            )
+    
+    def get_configured_ids(
+        self,
+        config_dir: Union[str, Path]  # Directory where config files are stored
+    ) -> frozenset:  # IDs of all schemas with a saved config file
+        """Get the set of configured schema IDs for a directory."""
+        dir_key = get_dir_key(config_dir)
+        with self._lock:
+            watched = dir_key in self._watched
+            invalidations = self._invalidations
+            entry = self._entries.get(dir_key)
+            # A watcher drops the entry on every change, so a trusted listing is current without a stat
+            if watched and entry is not None and entry[2]:
+                return entry[1]
+        
+        try:
+            mtime_ns = os.stat(dir_key).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            mtime_ns = None
+        
+        if entry is not None and entry[0] == mtime_ns and entry[2]:
+            return entry[1]
+        
+        scanned_at = time.time_ns()
+        ids = self._scan(dir_key) if mtime_ns is not None else frozenset()
+        trusted = mtime_ns is None or scanned_at - mtime_ns > self.racy_window_ns
+        
+        with self._lock:
+            if watched:
+                # Trust the listing unless a change was pushed while it was taken
+                trusted = invalidations == self._invalidations
+            self.scans += 1
+            previous = self._entries.get(dir_key)
+            if previous is None or previous[1] != ids:
+                self.generation += 1
+            self._entries[dir_key] = (mtime_ns, ids, trusted)
+        return ids
+    
+    def is_configured(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Union[str, Path]  # Directory where config files are stored
+    ) -> bool:  # True if a config file exists for the schema
+        """Check if a schema has a saved configuration."""
+        return schema_id in self.get_configured_ids(config_dir)
+    
+    def add(
+        self,
+        schema_id: str,  # Schema identifier that was just saved
+        config_dir: Union[str, Path]  # Directory where config files are stored
+    ):
+        """Record a newly saved configuration without waiting for a re-scan."""
+        self.add_many((schema_id,), config_dir)
+    
+    def add_many(
+        self,
+        schema_ids: Iterable[str],  # Schema identifiers that were just saved
+        config_dir: Union[str, Path]  # Directory where config files are stored
+    ):
+        """Record several newly saved configurations with a single index update."""
+        dir_key = get_dir_key(config_dir)
+        with self._lock:
+            # A listing taken concurrently may predate these files
+            self._invalidations += 1
+            entry = self._entries.get(dir_key)
+            if entry is not None:
+                added = frozenset(schema_ids) - entry[1]
+                if added:
+                    # Keep the old mtime so the next access still re-lists the directory
+                    self._entries[dir_key] = (entry[0], entry[1] | added, entry[2])
+                    self.generation += 1
+    
+    def watch(
+        self,
+        config_dir: Union[str, Path]  # Directory whose changes are now pushed by a watcher
+    ):
+        """Answer lookups for a directory without checking its mtime."""
+        with self._lock:
+            self._watched.add(get_dir_key(config_dir))
+    
+    def unwatch(
+        self,
+        config_dir: Union[str, Path]  # Directory no longer covered by a watcher
+    ):
+        """Go back to checking a directory's mtime on every lookup."""
+        with self._lock:
+            self._watched.discard(get_dir_key(config_dir))
+        self.invalidate(config_dir)
+    
+    def is_watched(
+        self,
+        config_dir: Union[str, Path]  # Directory where config files are stored
+    ) -> bool:  # True if a watcher pushes changes for the directory
+        """Check if a directory's listing is kept current by a watcher."""
+        return get_dir_key(config_dir) in self._watched
+    
+    def invalidate(
+        self,
+        config_dir: Optional[Union[str, Path]] = None  # Directory to drop (None for all directories)
+    ):
+        """Force the next lookup to re-list the directory."""
+        with self._lock:
+            self._invalidations += 1
+            if config_dir is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(get_dir_key(config_dir), None)
+
+# %% ../../nbs/core/cache.ipynb 15
+# Module-level instances shared by `load_config`, `save_config` and the sidebar
+config_cache = ConfigCache()
+config_index = ConfigDirIndex()
@@ -0,0 +1,230 @@
+"""Immutable, precomputed views of JSON schemas for request hot paths"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/compiled_schema.ipynb.
+
+# %% auto 0
+__all__ = ['CompiledSchema', 'FrozenSchema', 'freeze_value', 'freeze_schema', 'thaw_value', 'compile_schema']
+
+# %% ../../nbs/core/compiled_schema.ipynb 3
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Mapping, Optional, Tuple
+
+# %% ../../nbs/core/compiled_schema.ipynb 5
+@dataclass(frozen=True)
+class CompiledSchema:
+    """Immutable, precomputed view of a JSON schema."""
+    schema: Mapping[str, Any]  # Frozen copy of the source schema
+    defaults: Mapping[str, Any]  # Default values by property name (arrays and objects frozen)
+    fields: Tuple[Tuple[str, str], ...]  # (property name, field kind) pairs in schema order
+    boolean_fields: frozenset  # Properties converted from checkbox presence
+    integer_fields: frozenset  # Properties converted with `int()`
+    number_fields: frozenset  # Properties converted with `float()`
+    array_fields: frozenset  # Properties parsed into lists
+    required: Tuple[str, ...]  # Required property names
+    
+    @property
+    def numeric_fields(self) -> frozenset:  # Integer and number properties
+        """Get all properties with numeric conversion."""
+        return self.integer_fields | self.number_fields
+    
+    @cached_property
+    def field_kinds(self) -> Mapping[str, str]:  # Field kind by property name
+        """Look up field kinds without scanning `fields`."""
+        return MappingProxyType(dict(self.fields))
+    
+    @cached_property
+    def fingerprint(self) -> str:  # Hex digest identifying the schema content
+        """Content hash of the schema, stable across processes."""
+        content = json.dumps(self.schema, sort_keys=True, default=_fingerprint_default, separators=(",", ":"))
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @cached_property
+    def _mutable_defaults(self) -> Tuple[str, ...]:  # Properties whose default is an array or object
+        """Find the defaults that must be copied before they are handed out."""
+        return tuple(name for name, value in self.defaults.items() if isinstance(value, (list, MappingABC)))
+    
+    def default_values(
+        self
+    ) -> Dict[str, Any]:  # Default values by property name, safe to modify
+        """Get the defaults as a new dict with array and object values copied."""
+        values = dict(self.defaults)
+        for name in self._mutable_defaults:
+            values[name] = thaw_value(values[name])
+        return values
+
+# %% ../../nbs/core/compiled_schema.ipynb 6
+def _fingerprint_default(
+    value: Any  # Value json can't serialize natively
+) -> Any:  # JSON-serializable replacement
+    """Serialize read-only mappings and other values when fingerprinting."""
+    if isinstance(value, MappingABC):
+        return dict(value)
+    return str(value)
+
+def _get_field_kind(
+    prop_schema: Mapping[str, Any]  # Property schema
+) -> str:  # Field kind used for form data conversion
+    """Classify a property by how its form values are converted."""
+    prop_type = prop_schema.get("type")
+    if prop_type == "boolean":
+        return "boolean"
+    if prop_type == "integer" or (isinstance(prop_type, list) and "integer" in prop_type):
+        return "integer"
+    if prop_type == "number" or (isinstance(prop_type, list) and "number" in prop_type):
+        return "number"
+    if prop_type == "array":
+        return "array"
+    return "value"
+
+def _build_compiled_schema(
+    schema: Mapping[str, Any]  # Frozen JSON Schema (from `freeze_schema`)
+) -> CompiledSchema:  # Compiled view of the schema
+    """Compile a schema in a single pass over its properties."""
+    defaults = {}
+    fields = []
+    kinds: Dict[str, set] = {"boolean": set(), "integer": set(), "number": set(), "array": set()}
+    
+    for prop_name, prop_schema in schema.get("properties", {}).items():
+        if "default" in prop_schema:
+            defaults[prop_name] = prop_schema["default"]
+        kind = _get_field_kind(prop_schema)
+        fields.append((prop_name, kind))
+        if kind in kinds:
+            kinds[kind].add(prop_name)
+    
+    return CompiledSchema(
+        schema=schema,
+        defaults=MappingProxyType(defaults),
+        fields=tuple(fields),
+        boolean_fields=frozenset(kinds["boolean"]),
+        integer_fields=frozenset(kinds["integer"]),
+        number_fields=frozenset(kinds["number"]),
+        array_fields=frozenset(kinds["array"]),
+        required=tuple(schema.get("required", ()))
+    )
+
+# %% ../../nbs/core/compiled_schema.ipynb 8
+class _FrozenList(list):
+    """List that rejects changes, used for arrays inside frozen schemas."""
+    __slots__ = ()
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Frozen values are read-only; use thaw_value() for a mutable copy")
+    
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    
+    def __reduce__(self):
+        return (list, (list(self),))
+    
+    def __copy__(self):
+        return list(self)
+    
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+class FrozenSchema(MappingABC):
+    """Deep read-only copy of a JSON schema that caches its compiled form."""
+    __slots__ = ("_data", "_compiled")
+    
+    def __init__(
+        self,
+        data: Dict[str, Any]  # Already-frozen top-level properties (use `freeze_schema`)
+    ):
+        self._data = data
+        self._compiled: Optional[CompiledSchema] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __repr__(self) -> str:
+        return f"FrozenSchema({self._data!r})"
+    
+    def copy(
+        self
+    ) -> Dict[str, Any]:  # Mutable deep copy of the schema
+        """Get a mutable copy of the schema."""
+        return thaw_value(self)
+    
+    @property
+    def compiled(self) -> CompiledSchema:  # Compiled form of the schema
+        """Compile the schema on first use."""
+        compiled = self._compiled
+        if compiled is None:
+            # Compiling twice under a race yields equal results; either may be kept
+            compiled = self._compiled = _build_compiled_schema(self)
+        return compiled
+
+def freeze_value(
+    value: Any  # Value inside a schema or configuration
+) -> Any:  # Read-only copy of the value
+    """Recursively copy a value into read-only containers."""
+    if isinstance(value, MappingABC):
+        return MappingProxyType({key: freeze_value(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(freeze_value(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze_value(item) for item in value)
+    return value
+
+def freeze_schema(
+    schema: Mapping[str, Any]  # JSON Schema dictionary
+) -> FrozenSchema:  # Deep read-only copy (the schema itself if it is already frozen)
+    """Take a deep, read-only copy of a schema."""
+    if isinstance(schema, FrozenSchema):
+        return schema
+    return FrozenSchema({key: freeze_value(value) for key, value in schema.items()})
+
+def thaw_value(
+    value: Any  # Value from a frozen schema
+) -> Any:  # Mutable deep copy with plain dicts and lists
+    """Copy a frozen schema value into plain, mutable containers."""
+    if isinstance(value, MappingABC):
+        return {key: thaw_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw_value(item) for item in value]
+    return value
+
+# %% ../../nbs/core/compiled_schema.ipynb 9
+# Compiled plain-dict schemas by id, least recently used first: (source dict, compiled schema)
+_compiled_dicts: OrderedDict = OrderedDict()
+_compiled_dicts_lock = threading.Lock()
+_COMPILED_DICTS_MAXSIZE = 256
+
+def compile_schema(
+    schema: Mapping[str, Any]  # JSON Schema dictionary, `FrozenSchema` or `CompiledSchema`
+) -> CompiledSchema:  # Compiled view of the schema
+    """Get the compiled form of a schema (cached on frozen schemas, memoized while a plain dict is unchanged)."""
+    if isinstance(schema, CompiledSchema):
+        return schema
+    if isinstance(schema, FrozenSchema):
+        return schema.compiled
+    key = id(schema)
+    entry = _compiled_dicts.get(key)
+    # The entry keeps the dict alive, so its id can't be reused; comparing with the frozen copy catches in-place changes
+    if entry is not None and entry[0] is schema and entry[1].schema._data == schema:
+        with _compiled_dicts_lock:
+            if key in _compiled_dicts:
+                _compiled_dicts.move_to_end(key)
+        return entry[1]
+    compiled = _build_compiled_schema(freeze_schema(schema))
+    with _compiled_dicts_lock:
+        _compiled_dicts[key] = (schema, compiled)
+        _compiled_dicts.move_to_end(key)
+        while len(_compiled_dicts) > _COMPILED_DICTS_MAXSIZE:
+            _compiled_dicts.popitem(last=False)
+    return compiled
@@ -0,0 +1,284 @@
+"""Subscribe to configuration changes instead of re-loading configurations on every request"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/events.ipynb.
+
+# %% auto 0
+__all__ = ['config_subscriptions', 'ConfigUpdate', 'ConfigSubscription', 'ConfigSubscriptions', 'subscribe_config',
+           'unsubscribe_config']
+
+# %% ../../nbs/core/events.ipynb 3
+import collections
+import contextlib
+import copy
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from .compiled_schema import compile_schema
+
+# %% ../../nbs/core/events.ipynb 6
+@dataclass(frozen=True)
+class ConfigUpdate:
+    """Old and new values of a configuration that changed."""
+    schema_id: str  # Schema (or plugin) ID of the configuration
+    old: Dict[str, Any]  # Values before the change
+    new: Dict[str, Any]  # Values after the change
+    changed_fields: FrozenSet[str]  # Fields whose value differs between `old` and `new`
+    source: str  # "save", "plugin" or "external"
+    config_dir: str  # Directory the configuration is stored in
+
+_MISSING = object()
+
+def _changed_fields(
+    old: Dict[str, Any],  # Values before the change
+    new: Dict[str, Any]  # Values after the change
+) -> FrozenSet[str]:  # Fields that were added, removed or changed
+    """Compare two configurations field by field."""
+    return frozenset(
+        field for field in old.keys() | new.keys()
+        if old.get(field, _MISSING) != new.get(field, _MISSING)
+    )
+
+# %% ../../nbs/core/events.ipynb 9
+# Subscriber errors must not fail the save that published the update, so they are logged
+_logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True, eq=False)
+class ConfigSubscription:
+    """Handle of a registered callback, passed to `unsubscribe`."""
+    schema_id: str  # Schema (or plugin) ID the callback is registered for
+    callback: Callable[[ConfigUpdate], None]  # Function called with each matching `ConfigUpdate`
+    fields: Optional[FrozenSet[str]]  # Only call for changes to these fields (None for any field)
+    defaults: Optional[Dict[str, Any]]  # Schema defaults merged into the values (None for saved values only)
+    config_dir: str  # Directory the configuration is stored in
+
+class ConfigSubscriptions:
+    """Registry of configuration change callbacks keyed by schema ID."""
+    
+    def __init__(self):
+        self.published = 0
+        self.errors = 0
+        self.last_error: Optional[Exception] = None
+        # Guards the registry state; never held while a callback runs
+        self.lock = threading.RLock()
+        self._subscriptions: Dict[Tuple[str, str], Tuple[ConfigSubscription, ...]] = {}
+        self._values: Dict[Tuple[str, str], Dict[str, Any]] = {}  # Last published values per configuration
+        self._write_locks: Dict[Tuple[str, str], threading.RLock] = {}  # Held by `ordered` across a write
+        self._outbox: Dict[Tuple[str, str], collections.deque] = {}  # Updates waiting for delivery, in write order
+        self._delivering: set = set()  # Keys whose updates some thread is delivering
+        self._local = threading.local()  # Keys whose `ordered` block the current thread is in
+    
+    @staticmethod
+    def _key(
+        schema_id: str,  # Schema (or plugin) ID
+        config_dir: Optional[Union[str, Path]]  # Directory where config files are stored
+    ) -> Tuple[str, str]:  # Subscription key
+        """Build the subscription key for a configuration."""
+        if config_dir is None:
+            from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
+            config_dir = DEFAULT_CONFIG_DIR
+        return (os.fspath(Path(config_dir)), schema_id)
+    
+    def subscribe(
+        self,
+        schema_id: str,  # Schema (or plugin) ID to watch
+        callback: Callable[[ConfigUpdate], None],  # Function called with each matching `ConfigUpdate`
+        fields: Optional[Iterable[str]] = None,  # Only call for changes to these fields (None for any field)
+        schema: Optional[Dict[str, Any]] = None,  # Schema whose defaults are merged into the values
+        config_dir: Optional[Union[str, Path]] = None  # Directory where config files are stored
+    ) -> ConfigSubscription:  # Handle for `unsubscribe`
+        """Call a function whenever a configuration changes."""
+        key = self._key(schema_id, config_dir)
+        subscription = ConfigSubscription(
+            schema_id=schema_id,
+            callback=callback,
+            fields=frozenset(fields) if fields is not None else None,
+            defaults=compile_schema(schema).default_values() if schema is not None else None,
+            config_dir=key[0]
+        )
+        with self.lock:
+            if key not in self._values:
+                # Current values are the starting point of the first update
+                from cjm_fasthtml_settings.core.utils import load_config
+                self._values[key] = copy.deepcopy(load_config(schema_id, key[0]))
+            self._subscriptions[key] = self._subscriptions.get(key, ()) + (subscription,)
+        return subscription
+    
+    def unsubscribe(
+        self,
+        subscription: ConfigSubscription  # Handle returned by `subscribe`
+    ) -> bool:  # True if the subscription was registered
+        """Stop calling a subscribed function."""
+        key = (subscription.config_dir, subscription.schema_id)
+        with self.lock:
+            subscriptions = self._subscriptions.get(key, ())
+            if not any(s is subscription for s in subscriptions):
+                return False
+            remaining = tuple(s for s in subscriptions if s is not subscription)
+            if remaining:
+                self._subscriptions[key] = remaining
+            else:
+                del self._subscriptions[key]
+                self._values.pop(key, None)
+            return True
+    
+    def has_subscribers(
+        self,
+        schema_id: str,  # Schema (or plugin) ID
+        config_dir: Optional[Union[str, Path]] = None  # Directory where config files are stored
+    ) -> bool:  # True if any callback is registered for the configuration
+        """Check if a configuration has subscribers (lets savers skip publishing)."""
+        return self._key(schema_id, config_dir) in self._subscriptions
+    
+    def publish(
+        self,
+        schema_id: str,  # Schema (or plugin) ID that was saved
+        values: Dict[str, Any],  # Configuration values now stored
+        config_dir: Optional[Union[str, Path]] = None,  # Directory where config files are stored
+        source: str = "save",  # What changed the configuration ("save", "plugin" or "external")
+        old: Optional[Dict[str, Any]] = None  # Previous values (defaults to the last published values)
+    ) -> int:  # Number of callbacks called by this call
+        """Deliver a configuration's new values to the callbacks whose fields changed."""
+        key = self._key(schema_id, config_dir)
+        with self.lock:
+            subscriptions = self._subscriptions.get(key)
+            if not subscriptions:
+                return 0
+            previous = copy.deepcopy(old) if old is not None else self._values.get(key, {})
+            new = copy.deepcopy(values)
+            self._values[key] = new
+            if previous == new:
+                return 0
+            self.published += 1
+            
+            outbox = self._outbox.setdefault(key, collections.deque())
+            for subscription in subscriptions:
+                old_values, new_values = previous, new
+                if subscription.defaults is not None:
+                    old_values = {**subscription.defaults, **previous}
+                    new_values = {**subscription.defaults, **new}
+                changed = _changed_fields(old_values, new_values)
+                if not changed or (subscription.fields is not None and not changed & subscription.fields):
+                    continue
+                outbox.append((subscription, ConfigUpdate(schema_id, dict(old_values), dict(new_values), changed, source, key[0])))
+        # Inside `ordered`, delivery waits until the write lock is released
+        if key in getattr(self._local, "ordered", ()):
+            return 0
+        return self._deliver(key)
+    
+    def _deliver(
+        self,
+        key: Tuple[str, str]  # Subscription key whose queued updates should be delivered
+    ) -> int:  # Number of callbacks called
+        """Call the callbacks of a configuration's queued updates, without holding any lock."""
+        with self.lock:
+            # The thread already delivering this configuration's updates delivers the new ones too, in order
+            if key in self._delivering:
+                return 0
+            self._delivering.add(key)
+        called = 0
+        while True:
+            with self.lock:
+                outbox = self._outbox.get(key)
+                if not outbox:
+                    self._outbox.pop(key, None)
+                    self._delivering.discard(key)
+                    return called
+                subscription, update = outbox.popleft()
+            try:
+                subscription.callback(update)
+                called += 1
+            except Exception as e:
+                with self.lock:
+                    self.errors += 1
+                    self.last_error = e
+                _logger.exception("Error in config subscriber %r for %s", subscription.callback, update.schema_id)
+    
+    @contextlib.contextmanager
+    def ordered(
+        self,
+        schema_ids: Iterable[str],  # Schema (or plugin) IDs about to be written
+        config_dir: Optional[Union[str, Path]] = None  # Directory where config files are stored
+    ):
+        """Hold the write locks of some configurations so their updates are published in write order."""
+        keys = sorted({self._key(schema_id, config_dir) for schema_id in schema_ids})
+        with self.lock:
+            locks = [self._write_locks.setdefault(key, threading.RLock()) for key in keys]
+        ordered = getattr(self._local, "ordered", None)
+        if ordered is None:
+            ordered = self._local.ordered = set()
+        # Keys an enclosing block already holds are delivered when that block ends
+        entered = [key for key in keys if key not in ordered]
+        with contextlib.ExitStack() as stack:
+            # Acquire in sorted order so two multi-configuration saves can't deadlock
+            for lock in locks:
+                stack.enter_context(lock)
+            ordered.update(entered)
+            try:
+                yield
+            finally:
+                ordered.difference_update(entered)
+        # Write locks are released: deliver outside of them, so a slow callback never delays a save
+        for key in entered:
+            self._deliver(key)
+    
+    def handle_file_change(
+        self,
+        change: Any  # `ConfigChange` reported by a `ConfigWatcher`
+    ) -> int:  # Number of subscribed configurations re-loaded and published
+        """Re-load configurations changed outside this process and publish them as external updates."""
+        from cjm_fasthtml_settings.core.utils import load_config
+        with self.lock:
+            keys = [
+                key for key in self._subscriptions
+                if key[0] == change.config_dir and change.schema_id in (None, key[1])
+            ]
+        reloaded = 0
+        for dir_key, schema_id in keys:
+            # Load and publish in one ordered block, so a concurrent save can't be published out of order
+            with self.ordered((schema_id,), dir_key):
+                try:
+                    values = load_config(schema_id, dir_key)
+                except Exception as e:
+                    # A partially written file: the watcher reports it again once the write completes
+                    self.last_error = e
+                    continue
+                self.publish(schema_id, values, dir_key, source="external")
+                reloaded += 1
+        return reloaded
+    
+    def stats(
+        self
+    ) -> Dict[str, Any]:  # Subscription, publish and error counters
+        """Get subscription statistics."""
+        with self.lock:
+            return {
+                "configurations": len(self._subscriptions),
+                "subscriptions": sum(len(s) for s in self._subscriptions.values()),
+                "published": self.published,
+                "errors": self.errors,
+                "last_error": repr(self.last_error) if self.last_error is not None else None
+            }
+
+# %% ../../nbs/core/events.ipynb 10
+# Module-level registry used by the save functions, the routes and the config watcher
+config_subscriptions = ConfigSubscriptions()
+
+def subscribe_config(
+    schema_id: str,  # Schema (or plugin) ID to watch
+    callback: Callable[[ConfigUpdate], None],  # Function called with each matching `ConfigUpdate`
+    fields: Optional[Iterable[str]] = None,  # Only call for changes to these fields (None for any field)
+    schema: Optional[Dict[str, Any]] = None,  # Schema whose defaults are merged into the values
+    config_dir: Optional[Union[str, Path]] = None  # Directory where config files are stored
+) -> ConfigSubscription:  # Handle for `unsubscribe_config`
+    """Call a function whenever a saved configuration changes."""
+    return config_subscriptions.subscribe(schema_id, callback, fields, schema, config_dir)
+
+def unsubscribe_config(
+    subscription: ConfigSubscription  # Handle returned by `subscribe_config`
+) -> bool:  # True if the subscription was registered
+    """Stop calling a function subscribed with `subscribe_config`."""
+    return config_subscriptions.unsubscribe(subscription)
@@ -19,9 +19,22 @@ class SettingsHtmlIds(AppHtmlIds):
     # Navigation and menu
     SIDEBAR_MENU: Final[str] = "sidebar-menu"
 
+    # Search
+    SEARCH_RESULTS: Final[str] = "settings-search-results"
+
+    # Forms
+    CONFIG_REVISION: Final[str] = "settings-config-revision"
+
     @staticmethod
     def menu_item(
         name: str  # Settings name
     ) -> str:  # Menu item ID
         """Generate a menu item ID for a given settings name."""
         return f"menu-item-{name}"
+
+    @staticmethod
+    def field(
+        name: str  # Property name
+    ) -> str:  # Field input ID (matches the IDs generated by `cjm_fasthtml_jsonschema`)
+        """Generate the input ID for a given form field."""
+        return f"field-{name}"
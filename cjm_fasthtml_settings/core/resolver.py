@@ -0,0 +1,251 @@
+"""Layered configuration resolution: schema defaults, saved values, environment variables and runtime overrides merged into cached snapshots"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/resolver.ipynb.
+
+# %% auto 0
+__all__ = ['LAYERS', 'ENV_SEPARATOR', 'config_resolver', 'ConfigResolver', 'resolve_config', 'explain_config']
+
+# %% ../../nbs/core/resolver.ipynb 3
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from .compiled_schema import CompiledSchema, compile_schema
+from .utils import convert_config_data, get_config_version, load_config, validate_config_field
+
+# %% ../../nbs/core/resolver.ipynb 6
+# Layers from lowest to highest precedence
+LAYERS = ("default", "saved", "environment", "override")
+
+# Separator between the prefix, schema ID and property name of an environment variable
+ENV_SEPARATOR = "__"
+
+# Invalid environment variables are skipped on every resolve, so each one is only logged once
+_logger = logging.getLogger(__name__)
+
+def _get_environment_name(
+    name: str  # Schema ID or property name
+) -> str:  # Upper-case environment variable segment
+    """Turn a schema ID or property name into an environment variable segment."""
+    # Runs of other characters become one underscore, so a segment never contains the separator
+    return re.sub(r"[^A-Za-z0-9]+", "_", name).strip("_").upper()
+
+class ConfigResolver:
+    """Resolve configurations from schema defaults, saved values, environment variables and runtime overrides."""
+    
+    def __init__(
+        self,
+        env_prefix: Optional[str] = "SETTINGS",  # Prefix of environment variables (None disables the environment layer)
+        environ: Optional[Mapping[str, str]] = None,  # Environment to read (defaults to `os.environ`)
+        maxsize: int = 256  # Maximum number of cached snapshots
+    ):
+        self.env_prefix = env_prefix
+        self.maxsize = maxsize
+        self.builds = 0
+        self._environ = os.environ if environ is None else environ
+        self._lock = threading.Lock()
+        self._environment: Dict[str, str] = {}
+        self._environment_version = 0
+        self._overrides: Dict[str, Dict[str, Any]] = {}
+        self._overrides_version = 0
+        # (layer versions, merged values, layers) by (config directory, config ID), least recently used first
+        self._snapshots: OrderedDict = OrderedDict()
+        self._invalid_variables: Dict[str, Tuple[str, str]] = {}  # (value, error) by skipped environment variable
+        self.reload_environment()
+    
+    def environment_variable(
+        self,
+        schema_id: str,  # ID the configuration is saved under
+        field_name: str  # Property name
+    ) -> str:  # Name of the environment variable for the field
+        """Get the environment variable that overrides a field."""
+        return ENV_SEPARATOR.join((self.env_prefix, _get_environment_name(schema_id), _get_environment_name(field_name)))
+    
+    def reload_environment(self):
+        """Re-read the environment variables of the environment layer."""
+        prefix = f"{self.env_prefix}{ENV_SEPARATOR}" if self.env_prefix else None
+        environment = {name: value for name, value in self._environ.items()
+                       if prefix is not None and name.startswith(prefix)}
+        with self._lock:
+            self._environment = environment
+            self._environment_version += 1
+            # Variables that were removed or fixed are reported again if they turn invalid later
+            self._invalid_variables = {name: error for name, error in self._invalid_variables.items()
+                                       if name in environment}
+    
+    def set_overrides(
+        self,
+        schema_id: str,  # ID the configuration is saved under
+        values: Dict[str, Any]  # Field values taking precedence over every other layer
+    ):
+        """Override fields of a configuration at runtime."""
+        with self._lock:
+            self._overrides[schema_id] = {**self._overrides.get(schema_id, {}), **values}
+            self._overrides_version += 1
+    
+    def clear_overrides(
+        self,
+        schema_id: Optional[str] = None,  # Configuration to clear (None clears every configuration)
+        fields: Optional[Iterable[str]] = None  # Fields to clear (None clears all of the configuration's overrides)
+    ):
+        """Remove runtime overrides."""
+        with self._lock:
+            if schema_id is None:
+                self._overrides.clear()
+            elif fields is None:
+                self._overrides.pop(schema_id, None)
+            elif schema_id in self._overrides:
+                cleared = set(fields)
+                remaining = {k: v for k, v in self._overrides[schema_id].items() if k not in cleared}
+                if remaining:
+                    self._overrides[schema_id] = remaining
+                else:
+                    del self._overrides[schema_id]
+            self._overrides_version += 1
+    
+    def _report_invalid_variable(
+        self,
+        variable: str,  # Environment variable name
+        schema_id: str,  # ID the configuration is saved under
+        value: str,  # Raw value of the variable
+        error: str  # Validation error
+    ):
+        """Log an environment variable with an invalid value the first time it is skipped."""
+        with self._lock:
+            if self._invalid_variables.get(variable) == (value, error):
+                return
+            self._invalid_variables[variable] = (value, error)
+        _logger.warning("Ignoring environment variable %s for %s: %s", variable, schema_id, error)
+    
+    def _get_environment_layer(
+        self,
+        schema_id: str,  # ID the configuration is saved under
+        compiled: CompiledSchema,  # Compiled schema of the configuration
+        environment: Dict[str, str]  # Environment variables with the resolver's prefix
+    ) -> Dict[str, Any]:  # Converted values set by environment variables
+        """Convert the environment variables of one configuration into field values."""
+        variables = {name: self.environment_variable(schema_id, name) for name, _ in compiled.fields}
+        raw = {name: environment[variable] for name, variable in variables.items() if variable in environment}
+        if not raw:
+            return {}
+        
+        layer = {}
+        for name, value in convert_config_data(raw, compiled).items():
+            error = validate_config_field(compiled, name, value)
+            if error:
+                # Skip the variable: the saved value (or default) stays in effect
+                self._report_invalid_variable(variables[name], schema_id, raw[name], error)
+                continue
+            layer[name] = value
+        return layer
+    
+    def _get_snapshot(
+        self,
+        schema_name: str,  # Name of the schema (or unique_id for grouped schemas)
+        schema: Dict[str, Any],  # JSON Schema dictionary
+        config_dir: Optional[Path]  # Directory where config files are stored
+    ) -> Tuple[tuple, Mapping[str, Any], Tuple[Dict[str, Any], ...]]:  # (layer versions, merged values, layers)
+        """Get the snapshot of a configuration, rebuilding it if any layer changed."""
+        if config_dir is None:
+            from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
+            config_dir = DEFAULT_CONFIG_DIR
+        
+        # Use unique_id if present (for grouped schemas), otherwise use schema_name
+        config_id = schema.get("unique_id", schema_name)
+        compiled = compile_schema(schema)
+        key = (os.fspath(config_dir), config_id)
+        # Versions are read before the layers: a change in between leaves a stale version, so the next call rebuilds
+        # The compiled schema compares by identity first, so an unchanged schema is never hashed or walked
+        versions = (compiled, get_config_version(config_id, config_dir),
+                    self._environment_version, self._overrides_version)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot[0] == versions:
+                if snapshot[0][0] is not compiled:
+                    # Same content under a new schema object: keep the new one so later reads match by identity
+                    snapshot = self._snapshots[key] = (versions, *snapshot[1:])
+                self._snapshots.move_to_end(key)
+                return snapshot
+        
+        with self._lock:
+            environment = self._environment
+            overrides = dict(self._overrides.get(config_id, {}))
+        layers = (
+            compiled.default_values(),
+            load_config(config_id, config_dir),
+            self._get_environment_layer(config_id, compiled, environment),
+            overrides
+        )
+        merged = {}
+        for layer in layers:
+            merged.update(layer)
+        snapshot = (versions, MappingProxyType(merged), layers)
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.maxsize:
+                self._snapshots.popitem(last=False)
+            self.builds += 1
+        return snapshot
+    
+    def resolve(
+        self,
+        schema_name: str,  # Name of the schema (or unique_id for grouped schemas)
+        schema: Dict[str, Any],  # JSON Schema dictionary
+        config_dir: Optional[Path] = None  # Directory where config files are stored
+    ) -> Mapping[str, Any]:  # Read-only merged values of all layers
+        """Get a configuration with every layer applied."""
+        return self._get_snapshot(schema_name, schema, config_dir)[1]
+    
+    def explain(
+        self,
+        schema_name: str,  # Name of the schema (or unique_id for grouped schemas)
+        schema: Dict[str, Any],  # JSON Schema dictionary
+        config_dir: Optional[Path] = None  # Directory where config files are stored
+    ) -> Dict[str, str]:  # Layer name by property name
+        """Report which layer set each resolved value."""
+        _, merged, layers = self._get_snapshot(schema_name, schema, config_dir)
+        provenance = {}
+        for layer_name, layer in zip(LAYERS, layers):
+            for name in layer:
+                provenance[name] = layer_name
+        return {name: provenance[name] for name in merged}
+    
+    def stats(
+        self
+    ) -> Dict[str, Any]:  # Snapshot and rebuild counters, environment variables and overrides
+        """Get resolver statistics."""
+        with self._lock:
+            return {
+                "snapshots": len(self._snapshots),
+                "maxsize": self.maxsize,
+                "builds": self.builds,
+                "environment_variables": len(self._environment),
+                "invalid_environment_variables": sorted(self._invalid_variables),
+                "overridden_configs": len(self._overrides)
+            }
+
+# %% ../../nbs/core/resolver.ipynb 7
+# Module-level resolver reading `SETTINGS__*` environment variables
+config_resolver = ConfigResolver()
+
+def resolve_config(
+    schema_name: str,  # Name of the schema (or unique_id for grouped schemas)
+    schema: Dict[str, Any],  # JSON Schema dictionary
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> Mapping[str, Any]:  # Read-only merged values of all layers
+    """Get a configuration with defaults, saved values, environment variables and overrides applied."""
+    return config_resolver.resolve(schema_name, schema, config_dir)
+
+def explain_config(
+    schema_name: str,  # Name of the schema (or unique_id for grouped schemas)
+    schema: Dict[str, Any],  # JSON Schema dictionary
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> Dict[str, str]:  # Layer name by property name
+    """Report which layer set each value returned by `resolve_config`."""
+    return config_resolver.explain(schema_name, schema, config_dir)
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from .storage import get_storage_backend
+
 # %% ../../nbs/core/schema_group.ipynb 5
 @dataclass
 class SchemaGroup:
@@ -40,20 +42,13 @@ class SchemaGroup:
         config_dir: Path  # Directory where config files are stored
     ) -> bool:  # True if any schema in group has saved config
         """Check if any schemas in this group have saved configurations."""
-        for schema_name in self.schemas:
-            config_file = Path(config_dir) / f"{self.get_unique_id(schema_name)}.json"
-            if config_file.exists():
-                return True
-        return False
+        configured_ids = get_storage_backend().get_configured_ids(config_dir)
+        return any(self.get_unique_id(schema_name) in configured_ids for schema_name in self.schemas)
 
     def get_configured_schemas(
         self,
         config_dir: Path  # Directory where config files are stored
     ) -> list:  # List of schema names that have saved configs
         """Get list of configured schema names in this group."""
-        configured = []
-        for schema_name in self.schemas:
-            config_file = Path(config_dir) / f"{self.get_unique_id(schema_name)}.json"
-            if config_file.exists():
-                configured.append(schema_name)
-        return configured
+        configured_ids = get_storage_backend().get_configured_ids(config_dir)
+        return [schema_name for schema_name in self.schemas if self.get_unique_id(schema_name) in configured_ids]
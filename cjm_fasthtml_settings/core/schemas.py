@@ -7,7 +7,10 @@ __all__ = ['registry', 'SettingsRegistry']
 
 # %% ../../nbs/core/schemas.ipynb 3
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Mapping, Optional, Union
+
+from .compiled_schema import compile_schema, freeze_schema
+from .search import SettingsSearchIndex
 
 # %% ../../nbs/core/schemas.ipynb 6
 class SettingsRegistry:
@@ -15,6 +18,12 @@ class SettingsRegistry:
     
     def __init__(self):
         self._schemas: Dict[str, Union[Dict[str, Any], 'SchemaGroup']] = {}
+        self._index: Dict[str, tuple] = {}  # unique_id -> (source schema, read-only resolved schema, group title, owner name)
+        self._provided: Dict[str, Dict[str, tuple]] = {}  # item name -> {unique_id: (source schema, group title)} captured at registration
+        self._candidates: Dict[str, set] = {}  # unique_id -> names of the items that provide it
+        self._order: Dict[str, int] = {}  # item name -> registration position, so the first group providing an ID wins
+        self.search_index = SettingsSearchIndex()  # Kept in sync with the registered schemas
+        self.version = 0  # Incremented whenever the registered schemas change
     
     def register(
         self,
@@ -33,6 +42,76 @@ class SettingsRegistry:
                 raise ValueError("Schema must have a 'name' field or name must be provided")
         
         self._schemas[schema_name] = schema
+        self._order.setdefault(schema_name, len(self._order))
+        self._update_index(schema_name, schema)
+        self.version += 1
+    
+    def clear(self):
+        """Remove all registered schemas and groups."""
+        self._schemas = {}
+        self._index = {}
+        self._provided = {}
+        self._candidates = {}
+        self._order = {}
+        self.search_index.clear()
+        self.version += 1
+    
+    def _update_index(
+        self,
+        name: str,  # Name the item was registered under
+        item: Any  # Schema or SchemaGroup being (re-)registered
+    ):
+        """Update the flat `unique_id -> resolved schema` index for one registered item."""
+        from cjm_fasthtml_settings.core.schema_group import SchemaGroup
+        
+        # Snapshot the IDs this item provides; a group's `schemas` are read once, here
+        if isinstance(item, SchemaGroup):
+            provided = {item.get_unique_id(schema_key): (sub_schema, item.title)
+                        for schema_key, sub_schema in item.schemas.items()}
+        else:
+            provided = {name: (item, None)}
+        
+        previous = self._provided.pop(name, {})
+        for unique_id in previous.keys() - provided.keys():
+            self._candidates[unique_id].discard(name)
+        for unique_id in provided:
+            self._candidates.setdefault(unique_id, set()).add(name)
+        self._provided[name] = provided
+        
+        # Only IDs this item provided or provides can change owner
+        for unique_id in previous.keys() | provided.keys():
+            self._index_entry(unique_id, refresh=name)
+    
+    def _index_entry(
+        self,
+        unique_id: str,  # ID whose index entry should be recomputed
+        refresh: str  # Name of the item being registered, whose schemas are always frozen again
+    ):
+        """Recompute the index entry for one ID from the items that provide it."""
+        candidates = self._candidates.get(unique_id)
+        if not candidates:
+            self._candidates.pop(unique_id, None)
+            if self._index.pop(unique_id, None) is not None:
+                self.search_index.remove_schema(unique_id)
+            return
+        
+        # Plain schemas take precedence over grouped IDs with the same name, then the first registered group wins
+        if unique_id in candidates and self._provided[unique_id][unique_id][1] is None:
+            owner = unique_id
+        else:
+            owner = min(candidates, key=self._order.__getitem__)
+        source, group_title = self._provided[owner][unique_id]
+        
+        entry = self._index.get(unique_id)
+        if entry is not None and entry[3] == owner and entry[0] is source and entry[2] == group_title and owner != refresh:
+            return
+        grouped = group_title is not None
+        # A frozen copy: changing the source dict later doesn't affect the registry until it is re-registered
+        resolved = freeze_schema({**source, "unique_id": unique_id} if grouped else source)
+        # Compile once at registration so request paths reuse the precomputed tables
+        compile_schema(resolved).fingerprint
+        self.search_index.add_schema(unique_id, resolved, group_title=group_title)
+        self._index[unique_id] = (source, resolved, group_title, owner)
     
     def get(
         self,
@@ -47,6 +126,12 @@ class SettingsRegistry:
         """List all registered schema and group names."""
         return list(self._schemas.keys())
     
+    def list_schema_ids(
+        self
+    ) -> list:  # List of IDs accepted by `resolve_schema`
+        """List the IDs of all resolvable schemas, including grouped ones."""
+        return list(self._index.keys())
+    
     def get_all(
         self
     ) -> Dict[str, Union[Dict[str, Any], 'SchemaGroup']]:  # All schemas and groups
@@ -56,33 +141,44 @@ class SettingsRegistry:
     def resolve_schema(
         self,
         id: str  # Schema ID (can be 'name' or 'group_schema' format)
-    ) -> tuple:  # (schema_dict, error_message)
+    ) -> tuple:  # (read-only schema mapping, error_message)
         """Resolve a schema ID to a schema dictionary."""
+        entry = self._index.get(id)
+        if entry is not None:
+            return entry[1], None
+        return None, self._resolve_error(id)
+    
+    def get_registered_schema(
+        self,
+        id: str,  # Schema ID (can be 'name' or 'group_schema' format)
+        source: Dict[str, Any]  # Schema dict the caller holds for the ID
+    ) -> Optional[Mapping[str, Any]]:  # Frozen, compiled copy of `source`, or None if `source` isn't what the ID was registered from
+        """Get the registry's frozen copy of a schema dict it resolves `id` from."""
+        entry = self._index.get(id)
+        if entry is not None and entry[0] is source:
+            return entry[1]
+        return None
+    
+    def _resolve_error(
+        self,
+        id: str  # Schema ID that could not be resolved
+    ) -> str:  # Error message describing why
+        """Build the error message for an unresolvable schema ID."""
         from cjm_fasthtml_settings.core.schema_group import SchemaGroup
         
-        # Try direct lookup first
-        item = self._schemas.get(id)
-        if item:
-            if isinstance(item, SchemaGroup):
-                return None, f"'{id}' is a group, not a schema. Use 'group_schemaname' format."
-            return item, None
+        if isinstance(self._schemas.get(id), SchemaGroup):
+            return f"'{id}' is a group, not a schema. Use 'group_schemaname' format."
         
-        # Try grouped schema lookup (format: group_schema)
-        if "_" in id:
-            group_name, schema_key = id.split("_", 1)
-            group = self._schemas.get(group_name)
-            
-            if isinstance(group, SchemaGroup):
-                schema = group.get_schema(schema_key)
-                if schema:
-                    # Add the unique_id to the schema for proper saving
-                    return {**schema, "unique_id": id}, None
-                else:
-                    return None, f"Schema '{schema_key}' not found in group '{group_name}'"
+        # Report the missing schema against the longest matching group name
+        groups = [name for name, item in self._schemas.items()
+                  if isinstance(item, SchemaGroup) and id.startswith(f"{name}_")]
+        if groups:
+            group_name = max(groups, key=len)
+            return f"Schema '{id[len(group_name) + 1:]}' not found in group '{group_name}'"
         
-        return None, f"Settings '{id}' not found"
+        return f"Settings '{id}' not found"
 
-# %% ../../nbs/core/schemas.ipynb 13
+# %% ../../nbs/core/schemas.ipynb 21
 # Module-level registry instance
 # This is the single source of truth for all settings schemas
 # Routes and other modules will import and use this instance
@@ -0,0 +1,249 @@
+"""Inverted index for finding settings across schemas, groups and plugins"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/search.ipynb.
+
+# %% auto 0
+__all__ = ['tokenize', 'SearchHit', 'SettingsSearchIndex']
+
+# %% ../../nbs/core/search.ipynb 3
+import bisect
+import re
+import threading
+from dataclasses import dataclass, replace
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple
+
+# %% ../../nbs/core/search.ipynb 6
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+def tokenize(
+    text: Any  # Text to split into search terms (non-strings are ignored)
+) -> List[str]:  # Lowercase search terms in order of appearance
+    """Split text into lowercase search terms."""
+    if not isinstance(text, str):
+        return []
+    return [token for token in _NON_WORD.split(_CAMEL_BOUNDARY.sub(" ", text).lower()) if token]
+
+# %% ../../nbs/core/search.ipynb 10
+@dataclass(frozen=True)
+class SearchHit:
+    """A ranked settings search result."""
+    schema_id: str  # Schema (or plugin) unique ID
+    field: Optional[str]  # Property name, or None when the schema itself matched
+    score: float  # Relevance score (higher is better)
+    title: str  # Display title of the matched field or schema
+    schema_title: str  # Display title of the schema (including its group, if any)
+    source: str = "schema"  # "schema" or "plugin"
+
+# %% ../../nbs/core/search.ipynb 11
+class SettingsSearchIndex:
+    """Incrementally maintained inverted index over settings schemas."""
+    
+    # Weight of a term by where it appears
+    weights: Dict[str, float] = {
+        "name": 3.0,
+        "title": 3.0,
+        "enum": 1.5,
+        "description": 1.0,
+    }
+    
+    def __init__(self):
+        self.version = 0  # Incremented whenever the indexed documents change
+        self._postings: Dict[str, Dict[Tuple[str, Optional[str]], float]] = {}
+        self._documents: Dict[Tuple[str, Optional[str]], SearchHit] = {}
+        self._schema_terms: Dict[str, Dict[Tuple[str, Optional[str]], Dict[str, float]]] = {}
+        self._sources: Dict[str, Any] = {}  # schema_id -> indexed schema object
+        self._plugin_sync_key: Optional[tuple] = None
+        self._vocabulary: Optional[List[str]] = None
+        self._lock = threading.Lock()
+    
+    def _weigh_terms(
+        self,
+        parts: Iterable[Tuple[str, Any]]  # (weight name, text) pairs
+    ) -> Dict[str, float]:  # Summed weight per term
+        """Weigh the terms of a document."""
+        terms: Dict[str, float] = {}
+        for kind, text in parts:
+            for token in set(tokenize(text)):
+                terms[token] = terms.get(token, 0.0) + self.weights[kind]
+        return terms
+    
+    def _remove_locked(
+        self,
+        schema_id: str  # Schema to remove
+    ) -> bool:  # True if the schema was indexed
+        """Remove a schema's documents (caller holds the lock)."""
+        documents = self._schema_terms.pop(schema_id, None)
+        self._sources.pop(schema_id, None)
+        if documents is None:
+            return False
+        for key, terms in documents.items():
+            self._documents.pop(key, None)
+            for token in terms:
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.pop(key, None)
+                    if not postings:
+                        del self._postings[token]
+                        self._vocabulary = None
+        return True
+    
+    def add_schema(
+        self,
+        schema_id: str,  # Unique ID the schema is resolved and saved under
+        schema: Mapping[str, Any],  # JSON schema to index
+        group_title: Optional[str] = None,  # Title of the group the schema belongs to
+        source: str = "schema",  # "schema" or "plugin"
+        title: Optional[str] = None  # Display title (defaults to the schema's title)
+    ):
+        """Index (or re-index) a schema and its properties."""
+        schema_title = title or schema.get("title") or schema_id
+        if group_title:
+            schema_title = f"{group_title} / {schema_title}"
+        
+        documents = {
+            (schema_id, None): self._weigh_terms([
+                ("name", schema_id), ("title", title or schema.get("title")),
+                ("title", group_title), ("description", schema.get("description")),
+            ])
+        }
+        hits = {(schema_id, None): SearchHit(schema_id, None, 0.0, schema_title, schema_title, source)}
+        for prop_name, prop in (schema.get("properties") or {}).items():
+            if not isinstance(prop, Mapping):
+                continue
+            enum_labels = list(prop.get("enumNames") or ()) + [v for v in prop.get("enum") or () if isinstance(v, str)]
+            documents[(schema_id, prop_name)] = self._weigh_terms(
+                [("name", prop_name), ("title", prop.get("title")), ("description", prop.get("description"))]
+                + [("enum", label) for label in enum_labels]
+            )
+            hits[(schema_id, prop_name)] = SearchHit(
+                schema_id, prop_name, 0.0, prop.get("title") or prop_name, schema_title, source
+            )
+        
+        with self._lock:
+            self._remove_locked(schema_id)
+            for key, terms in documents.items():
+                for token, weight in terms.items():
+                    postings = self._postings.get(token)
+                    if postings is None:
+                        postings = self._postings[token] = {}
+                        self._vocabulary = None
+                    postings[key] = weight
+            self._documents.update(hits)
+            self._schema_terms[schema_id] = documents
+            self._sources[schema_id] = schema
+            self.version += 1
+    
+    def remove_schema(
+        self,
+        schema_id: str  # Schema to remove from the index
+    ) -> bool:  # True if the schema was indexed
+        """Remove a schema and its properties from the index."""
+        with self._lock:
+            removed = self._remove_locked(schema_id)
+            if removed:
+                self.version += 1
+            return removed
+    
+    def clear(self):
+        """Remove everything from the index."""
+        with self._lock:
+            self._postings.clear()
+            self._documents.clear()
+            self._schema_terms.clear()
+            self._sources.clear()
+            self._plugin_sync_key = None
+            self._vocabulary = None
+            self.version += 1
+    
+    def is_indexed(
+        self,
+        schema_id: str,  # Schema unique ID
+        schema: Optional[Mapping[str, Any]] = None  # If given, also require this exact schema object
+    ) -> bool:  # True if the schema is indexed
+        """Check whether a schema is indexed."""
+        indexed = self._sources.get(schema_id)
+        return indexed is not None and (schema is None or indexed is schema)
+    
+    def sync_plugins(
+        self,
+        plugin_registry: Any  # Plugin registry (must implement PluginRegistryProtocol)
+    ) -> int:  # Number of plugins added, updated or removed
+        """Bring the indexed plugin schemas in line with the plugin registry."""
+        version = getattr(plugin_registry, "version", None)
+        sync_key = (id(plugin_registry), version)
+        if version is not None and sync_key == self._plugin_sync_key:
+            return 0
+        
+        discovered = {}
+        for category in plugin_registry.get_categories_with_plugins():
+            display_name = None
+            if hasattr(plugin_registry, "get_category_display_name"):
+                display_name = plugin_registry.get_category_display_name(category)
+            for plugin in plugin_registry.get_plugins_by_category(category):
+                if plugin.config_schema:
+                    discovered[plugin.get_unique_id()] = (plugin, display_name or category)
+        
+        changes = 0
+        for plugin_id, (plugin, category_title) in discovered.items():
+            if not self.is_indexed(plugin_id, plugin.config_schema):
+                self.add_schema(
+                    plugin_id, plugin.config_schema,
+                    group_title=category_title, source="plugin", title=plugin.title
+                )
+                changes += 1
+        with self._lock:
+            stale = [
+                schema_id for (schema_id, field), hit in self._documents.items()
+                if field is None and hit.source == "plugin" and schema_id not in discovered
+            ]
+        for schema_id in stale:
+            changes += self.remove_schema(schema_id)
+        
+        self._plugin_sync_key = sync_key
+        return changes
+    
+    def _expand_prefix(
+        self,
+        prefix: str  # Term prefix
+    ) -> List[str]:  # Indexed terms starting with the prefix
+        """Find all indexed terms starting with a prefix (caller holds the lock)."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        start = bisect.bisect_left(vocabulary, prefix)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(prefix):
+            end += 1
+        return vocabulary[start:end]
+    
+    def search(
+        self,
+        query: str,  # Search text
+        limit: int = 20  # Maximum number of hits to return
+    ) -> List[SearchHit]:  # Hits ordered by descending score
+        """Find the settings matching every term of a query."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        
+        with self._lock:
+            scores: Optional[Dict[Tuple[str, Optional[str]], float]] = None
+            for i, token in enumerate(tokens):
+                # The last term is still being typed, so it also matches as a prefix
+                terms = self._expand_prefix(token) if i == len(tokens) - 1 else [token]
+                matches: Dict[Tuple[str, Optional[str]], float] = {}
+                for term in terms:
+                    # Exact matches rank above prefix matches
+                    factor = 1.0 if term == token else 0.5
+                    for key, weight in self._postings.get(term, {}).items():
+                        matches[key] = max(matches.get(key, 0.0), weight * factor)
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {key: score + matches[key] for key, score in scores.items() if key in matches}
+                if not scores:
+                    return []
+            
+            ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0][0], kv[0][1] or ""))[:limit]
+            return [replace(self._documents[key], score=score) for key, score in ranked]
@@ -0,0 +1,719 @@
+"""Pluggable storage backends for saved configurations"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/storage.ipynb.
+
+# %% auto 0
+__all__ = ['StorageBackendProtocol', 'FileStorageBackend', 'SQLiteStorageBackend', 'get_storage_backend', 'set_storage_backend']
+
+# %% ../../nbs/core/storage.ipynb 3
+import contextlib
+import copy
+import hashlib
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable, Protocol, Union, runtime_checkable
+
+try:
+    import fcntl
+except ImportError:  # Windows: conditional saves are only serialized within the process
+    fcntl = None
+
+from .cache import config_cache, config_index, get_dir_key, get_file_signature
+
+# %% ../../nbs/core/storage.ipynb 4
+# Optional: Import error handling library if available
+try:
+    from cjm_error_handling.core.base import ErrorContext, ErrorSeverity
+    from cjm_error_handling.core.errors import ConfigurationError, ValidationError
+    _has_error_handling = True
+except ImportError:
+    _has_error_handling = False
+
+# Without cjm-error-handling, failures are logged and reported through the return value
+_logger = logging.getLogger(__name__)
+
+# %% ../../nbs/core/storage.ipynb 6
+@runtime_checkable
+class StorageBackendProtocol(Protocol):
+    """Protocol that settings storage backends should implement."""
+    
+    def load(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ) -> Dict[str, Any]:  # Saved configuration (empty dict if none)
+        """Load the saved configuration for a schema."""
+        ...
+    
+    def save(
+        self,
+        schema_id: str,  # Schema identifier
+        config: Dict[str, Any],  # Configuration to save
+        config_dir: Path  # Directory where configs are stored
+    ) -> bool:  # True if save succeeded
+        """Save the configuration for a schema."""
+        ...
+    
+    def load_many(
+        self,
+        schema_ids: Iterable[str],  # Schema identifiers
+        config_dir: Path  # Directory where configs are stored
+    ) -> Dict[str, Dict[str, Any]]:  # Saved configurations by ID (missing IDs omitted)
+        """Load the saved configurations for several schemas at once."""
+        ...
+    
+    def get_configured_ids(
+        self,
+        config_dir: Path  # Directory where configs are stored
+    ) -> frozenset:  # IDs of all schemas with a saved configuration
+        """Get the IDs of all schemas that have a saved configuration."""
+        ...
+
+# %% ../../nbs/core/storage.ipynb 8
+# JSON array and object types; checked with `type() in` since it runs once per top-level value
+_CONTAINER_TYPES = frozenset((list, dict))
+
+def _copy_config(
+    config: Dict[str, Any]  # Cached configuration
+) -> Dict[str, Any]:  # Copy the caller may change without affecting the cache
+    """Copy a cached configuration, deep-copying only its array and object values."""
+    copied = dict(config)
+    for key, value in copied.items():
+        if type(value) in _CONTAINER_TYPES:
+            copied[key] = copy.deepcopy(value)
+    return copied
+
+class FileStorageBackend:
+    """Store each configuration as a JSON file named after its schema ID."""
+    
+    # Supported values for `durability`
+    durability_levels = ("none", "file", "directory")
+    
+    def __init__(
+        self,
+        durability: str = "none"  # "none", "file" (fsync each file) or "directory" (also fsync the directory)
+    ):
+        if durability not in self.durability_levels:
+            raise ValueError(f"durability must be one of {self.durability_levels}, got {durability!r}")
+        self.durability = durability
+        self._locks: Dict[tuple, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+    
+    def _config_file(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ) -> Path:  # Path of the schema's config file
+        """Get the config file path for a schema."""
+        return Path(config_dir) / f"{schema_id}.json"
+    
+    def _write_temp(
+        self,
+        config_file: Path,  # Destination config file
+        content: str  # Serialized configuration
+    ) -> tuple:  # (temporary file, file signature it will have once moved into place)
+        """Write a config file's content to a temporary file next to it, synced per the durability level."""
+        # Hidden name: the config directory index ignores dot-files
+        tmp_file = config_file.with_name(f".{config_file.name}.{secrets.token_hex(6)}.tmp")
+        try:
+            with open(tmp_file, "x") as f:
+                f.write(content)
+                f.flush()
+                if self.durability != "none":
+                    os.fsync(f.fileno())
+                signature = get_file_signature(os.fstat(f.fileno()))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_file)
+            raise
+        return tmp_file, signature
+    
+    def _write_file(
+        self,
+        config_file: Path,  # Destination config file
+        content: str  # Serialized configuration
+    ) -> tuple:  # File signature of the written file
+        """Write a config file atomically through a temporary file and `os.replace`."""
+        tmp_file, signature = self._write_temp(config_file, content)
+        try:
+            # Readers see either the old or the new file, never a partial one
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_file)
+            raise
+        return signature
+    
+    def _sync_directory(
+        self,
+        config_dir: Path  # Directory whose entries should be made durable
+    ):
+        """Flush directory entries (e.g. renames) to disk when the durability level asks for it."""
+        if self.durability != "directory" or os.name == "nt":
+            return
+        fd = os.open(config_dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def load(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ) -> Dict[str, Any]:  # Saved configuration (empty dict if file doesn't exist)
+        """Load the saved configuration for a schema, served from the cache when unchanged."""
+        # Normalized once: building `Path`s for the file and each cache lookup would cost more than the cache saves
+        dir_key = get_dir_key(config_dir)
+        config_file = os.path.join(dir_key, f"{schema_id}.json")
+        
+        # Watched directories are answered from memory until a change is pushed
+        epoch = config_cache.epoch
+        watched = config_cache.get_watched(schema_id, dir_key)
+        if watched is not None:
+            return _copy_config(watched[1])
+        if config_index.is_watched(dir_key) and schema_id not in config_index.get_configured_ids(dir_key):
+            return {}
+        
+        try:
+            signature = get_file_signature(os.stat(config_file))
+        except (FileNotFoundError, NotADirectoryError):
+            config_cache.invalidate(schema_id, dir_key)
+            return {}
+        
+        # Serve unchanged files from the cache without re-reading them
+        cached = config_cache.get(schema_id, dir_key, signature)
+        if cached is not None:
+            return _copy_config(cached)
+        
+        try:
+            with open(config_file, "r") as f:
+                config = json.load(f)
+                # Validate against what was actually read, not the earlier stat
+                signature = get_file_signature(os.fstat(f.fileno()))
+            if isinstance(config, dict):
+                config_cache.put(schema_id, dir_key, signature, config, epoch)
+                return _copy_config(config)
+            return config
+        except json.JSONDecodeError as e:
+            if _has_error_handling:
+                raise ConfigurationError(
+                    message=f"Failed to parse configuration file: {schema_id}",
+                    debug_info=f"JSON decode error at line {e.lineno}, column {e.colno}: {e.msg}",
+                    context=ErrorContext(
+                        operation="load_config",
+                        extra={"schema_name": schema_id}
+                    ),
+                    config_path=str(config_file),
+                    cause=e
+                )
+            else:
+                _logger.error("Error parsing config file %s: %s", config_file, e)
+                return {}
+        except Exception as e:
+            if _has_error_handling:
+                raise ConfigurationError(
+                    message=f"Failed to load configuration: {schema_id}",
+                    debug_info=f"Error reading config file: {str(e)}",
+                    context=ErrorContext(
+                        operation="load_config",
+                        extra={"schema_name": schema_id}
+                    ),
+                    config_path=str(config_file),
+                    cause=e
+                )
+            else:
+                _logger.error("Error loading config file %s: %s", config_file, e)
+                return {}
+    
+    def get_revision(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ) -> int:  # Revision of the saved configuration (0 if not saved)
+        """Get the revision of a schema's saved configuration without reading it."""
+        watched = config_cache.get_watched(schema_id, config_dir)
+        if watched is not None:
+            return self._signature_revision(watched[0])
+        try:
+            signature = get_file_signature(os.stat(self._config_file(schema_id, config_dir)))
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+        return self._signature_revision(signature)
+    
+    @staticmethod
+    def _signature_revision(
+        signature: tuple  # File signature from `get_file_signature`
+    ) -> int:  # Positive revision that fits a JSON number exactly
+        """Derive a revision from a config file's signature, so it never has to be stored in the file."""
+        digest = hashlib.blake2b(repr(signature).encode(), digest_size=8).digest()
+        # Every save replaces the file with a new inode, so its signature (and revision) changes
+        return (int.from_bytes(digest, "big") & (2**53 - 1)) or 1
+    
+    @contextlib.contextmanager
+    def _locked(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ):
+        """Serialize conditional saves of one config file across threads and processes."""
+        key = (os.fspath(config_dir), schema_id)
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if fcntl is None:
+                yield
+                return
+            # Lock the directory itself so no lock file is left next to the configs
+            fd = os.open(config_dir, os.O_RDONLY)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)
+    
+    def _write_config(
+        self,
+        schema_id: str,  # Schema identifier
+        config: Dict[str, Any],  # Configuration to save
+        config_dir: Path  # Directory where configs are stored
+    ) -> int:  # Revision of the written file
+        """Write a configuration file and cache what a fresh load would return."""
+        epoch = config_cache.epoch
+        content = json.dumps(config, indent=2)
+        signature = self._write_file(self._config_file(schema_id, config_dir), content)
+        config_cache.put(schema_id, config_dir, signature, json.loads(content), epoch)
+        return self._signature_revision(signature)
+    
+    def save(
+        self,
+        schema_id: str,  # Schema identifier
+        config: Dict[str, Any],  # Configuration to save
+        config_dir: Path  # Directory where configs are stored
+    ) -> bool:  # True if save succeeded, False otherwise
+        """Save the configuration for a schema."""
+        config_dir = Path(config_dir)
+        config_file = self._config_file(schema_id, config_dir)
+        try:
+            config_dir.mkdir(exist_ok=True, parents=True)
+            
+            self._write_config(schema_id, config, config_dir)
+            self._sync_directory(config_dir)
+            config_index.add(schema_id, config_dir)
+            return True
+        except PermissionError as e:
+            if _has_error_handling:
+                raise ConfigurationError(
+                    message="Permission denied saving configuration",
+                    debug_info=f"Cannot write to {config_dir}: {str(e)}",
+                    context=ErrorContext(
+                        operation="save_config",
+                        extra={"schema_name": schema_id}
+                    ),
+                    config_path=str(config_file),
+                    cause=e
+                )
+            else:
+                _logger.error("Permission error saving config: %s", e)
+                return False
+        except Exception as e:
+            config_cache.invalidate(schema_id, config_dir)
+            if _has_error_handling:
+                raise ConfigurationError(
+                    message=f"Failed to save configuration: {schema_id}",
+                    debug_info=f"Error writing config file: {str(e)}",
+                    context=ErrorContext(
+                        operation="save_config",
+                        extra={"schema_name": schema_id}
+                    ),
+                    config_path=str(config_file),
+                    cause=e
+                )
+            else:
+                _logger.error("Error saving config: %s", e)
+                return False
+    
+    def save_many(
+        self,
+        configs: Dict[str, Dict[str, Any]],  # Configurations to save by schema ID
+        config_dir: Path  # Directory where configs are stored
+    ) -> bool:  # True if every configuration was saved, False otherwise
+        """Save several configurations in one pass: write and sync every file, then move them all into place."""
+        config_dir = Path(config_dir)
+        schema_id = None
+        staged = []  # (schema_id, content, temporary file, signature) for every written file
+        renamed = 0  # Number of staged files already moved into place
+        try:
+            # Serialize everything first so an invalid entry fails before any file is written
+            contents = {key: json.dumps(config, indent=2) for key, config in configs.items()}
+            config_dir.mkdir(exist_ok=True, parents=True)
+            
+            epoch = config_cache.epoch
+            for schema_id, content in contents.items():
+                staged.append((schema_id, content, *self._write_temp(self._config_file(schema_id, config_dir), content)))
+            # Every file is written and synced; a failure up to here leaves all saved configurations untouched
+            for schema_id, content, tmp_file, signature in staged:
+                os.replace(tmp_file, self._config_file(schema_id, config_dir))
+                renamed += 1
+                config_cache.put(schema_id, config_dir, signature, json.loads(content), epoch)
+            self._sync_directory(config_dir)
+            
+            config_index.add_many(configs.keys(), config_dir)
+            return True
+        except Exception as e:
+            for _, _, tmp_file, _ in staged[renamed:]:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_file)
+            if schema_id is not None:
+                config_cache.invalidate(schema_id, config_dir)
+            # A failed rename may follow successful ones, which the index hasn't seen yet
+            config_index.invalidate(config_dir)
+            if _has_error_handling:
+                raise ConfigurationError(
+                    message="Failed to save configurations",
+                    debug_info=f"Error writing config file for {schema_id}: {str(e)}",
+                    context=ErrorContext(
+                        operation="save_configs",
+                        extra={"schema_name": schema_id}
+                    ),
+                    config_path=str(config_dir),
+                    cause=e
+                )
+            else:
+                _logger.error("Error saving configs: %s", e)
+                return False
+    
+    def save_if_revision(
+        self,
+        schema_id: str,  # Schema identifier
+        config: Dict[str, Any],  # Configuration to save
+        expected_revision: int,  # Revision the configuration was edited from (0 if it was never saved)
+        config_dir: Path  # Directory where configs are stored
+    ) -> Optional[int]:  # New revision, or None if the saved configuration changed in the meantime
+        """Save a configuration only if its file is still at the expected revision."""
+        config_dir = Path(config_dir)
+        try:
+            config_dir.mkdir(exist_ok=True, parents=True)
+            with self._locked(schema_id, config_dir):
+                # Stat the file itself: a watcher's view of the directory may lag behind other writers
+                try:
+                    current = self._signature_revision(get_file_signature(os.stat(self._config_file(schema_id, config_dir))))
+                except FileNotFoundError:
+                    current = 0
+                if current != expected_revision:
+                    return None
+                revision = self._write_config(schema_id, config, config_dir)
+            self._sync_directory(config_dir)
+            config_index.add(schema_id, config_dir)
+            return revision
+        except Exception as e:
+            config_cache.invalidate(schema_id, config_dir)
+            if _has_error_handling:
+                raise ConfigurationError(
+                    message=f"Failed to save configuration: {schema_id}",
+                    debug_info=f"Error writing config file: {str(e)}",
+                    context=ErrorContext(
+                        operation="save_config",
+                        extra={"schema_name": schema_id}
+                    ),
+                    config_path=str(self._config_file(schema_id, config_dir)),
+                    cause=e
+                )
+            else:
+                _logger.error("Error saving config: %s", e)
+                return None
+    
+    def load_many(
+        self,
+        schema_ids: Iterable[str],  # Schema identifiers
+        config_dir: Path  # Directory where configs are stored
+    ) -> Dict[str, Dict[str, Any]]:  # Saved configurations by ID (missing IDs omitted)
+        """Load the saved configurations for several schemas."""
+        configured_ids = self.get_configured_ids(config_dir)
+        return {
+            schema_id: self.load(schema_id, config_dir)
+            for schema_id in schema_ids if schema_id in configured_ids
+        }
+    
+    def get_configured_ids(
+        self,
+        config_dir: Path  # Directory where configs are stored
+    ) -> frozenset:  # IDs of all schemas with a config file
+        """Get the IDs of all schemas that have a config file."""
+        return config_index.get_configured_ids(config_dir)
+
+    
+    def get_version(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ) -> Optional[str]:  # Token that changes whenever the config file changes (None if not saved)
+        """Get a version token for a schema's saved configuration without reading it."""
+        watched = config_cache.get_watched(schema_id, config_dir)
+        if watched is not None:
+            mtime_ns, size, inode = watched[0]
+            return f"{mtime_ns}-{size}-{inode}"
+        try:
+            # Plain string paths: this runs on every versioned read, where Path construction dominates
+            mtime_ns, size, inode = get_file_signature(os.stat(os.path.join(config_dir, f"{schema_id}.json")))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return f"{mtime_ns}-{size}-{inode}"
+
+# %% ../../nbs/core/storage.ipynb 17
+class SQLiteStorageBackend:
+    """Store all configurations in a single SQLite database (WAL mode)."""
+    
+    # SQLite's default limit on host parameters in a single statement
+    max_query_params: int = 900
+    
+    # Insert a configuration, or replace it as the next revision
+    _UPSERT_SQL = (
+        "INSERT INTO settings (schema_id, config, updated_at, revision) VALUES (?, ?, ?, 1) "
+        "ON CONFLICT(schema_id) DO UPDATE SET config = excluded.config, updated_at = excluded.updated_at, "
+        "revision = settings.revision + 1"
+    )
+    
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,  # Database file (defaults to `{config_dir}/{filename}`)
+        filename: str = "settings.sqlite3",  # Database filename used when `db_path` is not set
+        timeout: float = 5.0  # Seconds to wait for a database lock
+    ):
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.filename = filename
+        self.timeout = timeout
+        self._local = threading.local()
+        self._initialized: set = set()
+        self._init_lock = threading.Lock()
+    
+    def _get_db_path(
+        self,
+        config_dir: Path  # Directory where configs are stored
+    ) -> Path:  # Database file for the directory
+        """Get the database file used for a config directory."""
+        return self.db_path if self.db_path is not None else Path(config_dir) / self.filename
+    
+    def _connect(
+        self,
+        config_dir: Path  # Directory where configs are stored
+    ) -> sqlite3.Connection:  # Connection owned by the current thread
+        """Get (creating if needed) this thread's connection to the database."""
+        db_path = os.fspath(self._get_db_path(config_dir))
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        conn = connections.get(db_path)
+        if conn is None:
+            Path(db_path).parent.mkdir(exist_ok=True, parents=True)
+            conn = sqlite3.connect(db_path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._init_lock:
+                if db_path not in self._initialized:
+                    with conn:
+                        conn.execute(
+                            "CREATE TABLE IF NOT EXISTS settings ("
+                            "schema_id TEXT PRIMARY KEY, "
+                            "config TEXT NOT NULL, "
+                            "updated_at REAL NOT NULL, "
+                            "revision INTEGER NOT NULL DEFAULT 1)"
+                        )
+                        # Databases created before revisions were tracked start every row at revision 1
+                        columns = {row[1] for row in conn.execute("PRAGMA table_info(settings)")}
+                        if "revision" not in columns:
+                            conn.execute("ALTER TABLE settings ADD COLUMN revision INTEGER NOT NULL DEFAULT 1")
+                    self._initialized.add(db_path)
+            connections[db_path] = conn
+        return conn
+    
+    def _raise_error(
+        self,
+        operation: str,  # Name of the failed operation
+        schema_id: Optional[str],  # Schema involved (if any)
+        config_dir: Path,  # Directory where configs are stored
+        error: Exception  # Underlying error
+    ):
+        """Raise a structured error for a failed database operation."""
+        if _has_error_handling:
+            raise ConfigurationError(
+                message=f"Settings database error during {operation}",
+                debug_info=f"SQLite error: {str(error)}",
+                context=ErrorContext(
+                    operation=operation,
+                    extra={"schema_name": schema_id}
+                ),
+                config_path=str(self._get_db_path(config_dir)),
+                cause=error
+            )
+        _logger.error("Settings database error during %s: %s", operation, error)
+    
+    def load(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ) -> Dict[str, Any]:  # Saved configuration (empty dict if none)
+        """Load the saved configuration for a schema."""
+        try:
+            row = self._connect(config_dir).execute(
+                "SELECT config FROM settings WHERE schema_id = ?", (schema_id,)
+            ).fetchone()
+            return json.loads(row[0]) if row else {}
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            self._raise_error("load_config", schema_id, config_dir, e)
+            return {}
+    
+    def save(
+        self,
+        schema_id: str,  # Schema identifier
+        config: Dict[str, Any],  # Configuration to save
+        config_dir: Path  # Directory where configs are stored
+    ) -> bool:  # True if save succeeded
+        """Save the configuration for a schema."""
+        try:
+            conn = self._connect(config_dir)
+            with conn:
+                conn.execute(
+                    self._UPSERT_SQL,
+                    (schema_id, json.dumps(config), time.time())
+                )
+            return True
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._raise_error("save_config", schema_id, config_dir, e)
+            return False
+    
+    def save_many(
+        self,
+        configs: Dict[str, Dict[str, Any]],  # Configurations to save by schema ID
+        config_dir: Path  # Directory where configs are stored
+    ) -> bool:  # True if every configuration was saved (all or nothing)
+        """Save several configurations in a single transaction."""
+        try:
+            updated_at = time.time()
+            rows = [(schema_id, json.dumps(config), updated_at) for schema_id, config in configs.items()]
+            conn = self._connect(config_dir)
+            with conn:
+                conn.executemany(
+                    self._UPSERT_SQL,
+                    rows
+                )
+            return True
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._raise_error("save_configs", None, config_dir, e)
+            return False
+    
+    def get_revision(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ) -> int:  # Revision number of the saved configuration (0 if not saved)
+        """Get the revision number of a schema's saved configuration."""
+        try:
+            row = self._connect(config_dir).execute(
+                "SELECT revision FROM settings WHERE schema_id = ?", (schema_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._raise_error("get_revision", schema_id, config_dir, e)
+            return 0
+        return row[0] if row else 0
+    
+    def save_if_revision(
+        self,
+        schema_id: str,  # Schema identifier
+        config: Dict[str, Any],  # Configuration to save
+        expected_revision: int,  # Revision the configuration was edited from (0 if it was never saved)
+        config_dir: Path  # Directory where configs are stored
+    ) -> Optional[int]:  # New revision, or None if the saved configuration changed in the meantime
+        """Save a configuration only if it is still at the expected revision (one atomic statement)."""
+        try:
+            conn = self._connect(config_dir)
+            with conn:
+                if expected_revision == 0:
+                    cursor = conn.execute(
+                        "INSERT INTO settings (schema_id, config, updated_at, revision) VALUES (?, ?, ?, 1) "
+                        "ON CONFLICT(schema_id) DO NOTHING",
+                        (schema_id, json.dumps(config), time.time())
+                    )
+                else:
+                    cursor = conn.execute(
+                        "UPDATE settings SET config = ?, updated_at = ?, revision = revision + 1 "
+                        "WHERE schema_id = ? AND revision = ?",
+                        (json.dumps(config), time.time(), schema_id, expected_revision)
+                    )
+            return expected_revision + 1 if cursor.rowcount == 1 else None
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._raise_error("save_config", schema_id, config_dir, e)
+            return None
+    
+    def load_many(
+        self,
+        schema_ids: Iterable[str],  # Schema identifiers
+        config_dir: Path  # Directory where configs are stored
+    ) -> Dict[str, Dict[str, Any]]:  # Saved configurations by ID (missing IDs omitted)
+        """Load the saved configurations for several schemas in one query per batch."""
+        schema_ids = list(dict.fromkeys(schema_ids))
+        configs = {}
+        try:
+            conn = self._connect(config_dir)
+            for start in range(0, len(schema_ids), self.max_query_params):
+                batch = schema_ids[start:start + self.max_query_params]
+                placeholders = ", ".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT schema_id, config FROM settings WHERE schema_id IN ({placeholders})", batch
+                )
+                configs.update((schema_id, json.loads(config)) for schema_id, config in rows)
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            self._raise_error("load_configs", None, config_dir, e)
+        return configs
+    
+    def get_configured_ids(
+        self,
+        config_dir: Path  # Directory where configs are stored
+    ) -> frozenset:  # IDs of all schemas with a saved configuration
+        """Get the IDs of all schemas that have a saved configuration."""
+        try:
+            rows = self._connect(config_dir).execute("SELECT schema_id FROM settings")
+            return frozenset(row[0] for row in rows)
+        except sqlite3.Error as e:
+            self._raise_error("get_configured_ids", None, config_dir, e)
+            return frozenset()
+
+    
+    def get_version(
+        self,
+        schema_id: str,  # Schema identifier
+        config_dir: Path  # Directory where configs are stored
+    ) -> Optional[str]:  # Token that changes whenever the saved configuration changes (None if not saved)
+        """Get a version token for a schema's saved configuration without loading it."""
+        try:
+            row = self._connect(config_dir).execute(
+                "SELECT revision FROM settings WHERE schema_id = ?", (schema_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._raise_error("get_version", schema_id, config_dir, e)
+            return None
+        # Every write bumps the row's revision, so it identifies the saved configuration exactly
+        return f"r{row[0]}" if row else None
+
+# %% ../../nbs/core/storage.ipynb 23
+# Backend used by `load_config`, `save_config` and the settings routes
+_storage_backend: StorageBackendProtocol = FileStorageBackend()
+
+def get_storage_backend() -> StorageBackendProtocol:  # Active storage backend
+    """Get the active storage backend."""
+    return _storage_backend
+
+def set_storage_backend(
+    backend: StorageBackendProtocol  # Backend implementing StorageBackendProtocol
+):
+    """Set the active storage backend."""
+    global _storage_backend
+    if not isinstance(backend, StorageBackendProtocol):
+        raise TypeError("Storage backend must implement StorageBackendProtocol")
+    _storage_backend = backend
@@ -3,13 +3,34 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/utils.ipynb.
 
 # %% auto 0
-__all__ = ['load_config', 'save_config', 'get_default_values_from_schema', 'get_config_with_defaults',
-           'convert_form_data_to_config']
+__all__ = ['load_config', 'save_config', 'load_configs', 'save_configs', 'WriteBehindQueue', 'configure_write_behind',
+           'get_write_behind_queue', 'flush_config_writes', 'configure_storage_executor', 'get_storage_executor',
+           'run_storage_io', 'aload_config', 'asave_config', 'asave_configs', 'get_default_values_from_schema',
+           'get_config_with_defaults', 'get_config_version', 'convert_form_data_to_config', 'get_form_converter',
+           'get_config_revision', 'save_config_if_revision', 'aget_config_revision', 'asave_config_if_revision',
+           'validate_config_data', 'validate_config_field', 'convert_form_field', 'merge_config_field',
+           'update_config_field', 'amerge_config_field', 'aupdate_config_field', 'convert_config_data',
+           'prepare_configs', 'bulk_save_configs']
 
 # %% ../../nbs/core/utils.ipynb 3
+import ast
+import atexit
+import asyncio
+import copy
+import hashlib
 import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Iterable, List, Mapping
+
+from .compiled_schema import CompiledSchema, compile_schema, thaw_value
+from .events import config_subscriptions
+from .storage import get_storage_backend
 
 # %% ../../nbs/core/utils.ipynb 4
 # Optional: Import error handling library if available
@@ -21,6 +42,9 @@ except ImportError:
     _has_error_handling = False
 
 # %% ../../nbs/core/utils.ipynb 7
+# Active `WriteBehindQueue` (see `configure_write_behind`), None while saves are written immediately
+_write_behind = None
+
 def load_config(
     schema_name: str,  # Name of the schema/configuration to load
     config_dir: Optional[Path] = None  # Directory where config files are stored
@@ -29,45 +53,15 @@ def load_config(
     if config_dir is None:
         from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
         config_dir = DEFAULT_CONFIG_DIR
-        
-    config_file = Path(config_dir) / f"{schema_name}.json"
-    
-    if not config_file.exists():
-        return {}
-    
-    try:
-        with open(config_file, "r") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
-        if _has_error_handling:
-            raise ConfigurationError(
-                message=f"Failed to parse configuration file: {schema_name}",
-                debug_info=f"JSON decode error at line {e.lineno}, column {e.colno}: {e.msg}",
-                context=ErrorContext(
-                    operation="load_config",
-                    extra={"schema_name": schema_name}
-                ),
-                config_path=str(config_file),
-                cause=e
-            )
-        else:
-            print(f"Error parsing config file {config_file}: {e}")
-            return {}
-    except Exception as e:
-        if _has_error_handling:
-            raise ConfigurationError(
-                message=f"Failed to load configuration: {schema_name}",
-                debug_info=f"Error reading config file: {str(e)}",
-                context=ErrorContext(
-                    operation="load_config",
-                    extra={"schema_name": schema_name}
-                ),
-                config_path=str(config_file),
-                cause=e
-            )
-        else:
-            print(f"Error loading config file {config_file}: {e}")
-            return {}
+    
+    # Saves still waiting for the write-behind queue are newer than storage
+    queue = _write_behind
+    if queue is not None:
+        pending = queue.get(schema_name, config_dir)
+        if pending is not None:
+            return pending
+    
+    return get_storage_backend().load(schema_name, config_dir)
 
 # %% ../../nbs/core/utils.ipynb 9
 def save_config(
@@ -79,61 +73,369 @@ def save_config(
     if config_dir is None:
         from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
         config_dir = DEFAULT_CONFIG_DIR
-        
-    try:
-        config_dir = Path(config_dir)
-        config_dir.mkdir(exist_ok=True, parents=True)
-        
-        config_file = config_dir / f"{schema_name}.json"
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=2)
+    
+    queue = _write_behind
+    write = queue.put if queue is not None else get_storage_backend().save
+    return _save_and_publish({schema_name: config}, config_dir, partial(write, schema_name, config, config_dir))
+
+def _save_and_publish(
+    configs: Dict[str, Dict[str, Any]],  # Configurations being saved by schema name
+    config_dir: Path,  # Directory where config files are stored
+    save: Callable[[], Any]  # Performs the write; a result of None or False means it failed
+) -> Any:  # Result of `save`
+    """Run a save and publish the saved configurations to their subscribers."""
+    subscribed = [name for name in configs if config_subscriptions.has_subscribers(name, config_dir)]
+    if not subscribed:
+        return save()
+    # The write locks of these configurations keep updates in the order the writes happened
+    with config_subscriptions.ordered(subscribed, config_dir):
+        result = save()
+        if result is not None and result is not False:
+            for schema_name in subscribed:
+                config_subscriptions.publish(schema_name, configs[schema_name], config_dir)
+    return result
+
+# %% ../../nbs/core/utils.ipynb 10
+def load_configs(
+    schema_names: Iterable[str],  # Names of the schemas/configurations to load
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> Dict[str, Dict[str, Any]]:  # Saved configurations by name (unsaved schemas omitted)
+    """Load saved configurations for several schemas in one backend call."""
+    if config_dir is None:
+        from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
+        config_dir = DEFAULT_CONFIG_DIR
+    
+    queue = _write_behind
+    if queue is None:
+        return get_storage_backend().load_many(schema_names, config_dir)
+    
+    schema_names = list(schema_names)
+    configs = get_storage_backend().load_many(schema_names, config_dir)
+    for schema_name in schema_names:
+        pending = queue.get(schema_name, config_dir)
+        if pending is not None:
+            configs[schema_name] = pending
+    return configs
+
+def save_configs(
+    configs: Dict[str, Dict[str, Any]],  # Configurations to save by schema name
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> bool:  # True if every configuration was saved, False otherwise
+    """Save configurations for several schemas in one backend call."""
+    if config_dir is None:
+        from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
+        config_dir = DEFAULT_CONFIG_DIR
+    
+    queue = _write_behind
+    write = _queue_configs if queue is not None else _write_configs
+    return _save_and_publish(configs, config_dir, partial(write, configs, config_dir))
+
+def _queue_configs(
+    configs: Dict[str, Dict[str, Any]],  # Configurations to save by schema name
+    config_dir: Path  # Directory where config files are stored
+) -> bool:  # True if every configuration was queued
+    """Hand configurations to the active write-behind queue."""
+    return all([_write_behind.put(schema_name, config, config_dir) for schema_name, config in configs.items()])
+
+def _write_configs(
+    configs: Dict[str, Dict[str, Any]],  # Configurations to save by schema name
+    config_dir: Path  # Directory where config files are stored
+) -> bool:  # True if every configuration was saved, False otherwise
+    """Write configurations to the storage backend, batched when the backend supports it."""
+    backend = get_storage_backend()
+    save_many = getattr(backend, "save_many", None)
+    if save_many is not None:
+        return save_many(configs, config_dir)
+    # Backends without batched writes save one configuration at a time
+    return all([backend.save(schema_name, config, config_dir) for schema_name, config in configs.items()])
+
+# %% ../../nbs/core/utils.ipynb 14
+# Background writes have no caller to raise to, so their errors are logged
+_logger = logging.getLogger(__name__)
+
+class WriteBehindQueue:
+    """Coalesce repeated saves in memory and write them from one background thread."""
+    
+    def __init__(
+        self,
+        delay: float = 0.5,  # Quiet period (seconds) after the last save before writing
+        max_delay: float = 5.0,  # Longest time (seconds) a save stays pending under continuous saves
+        writer: Optional[Callable] = None  # Function writing `{schema_name: config}` for one config_dir (defaults to the storage backend)
+    ):
+        self.delay = delay
+        self.max_delay = max_delay
+        self.saves = 0
+        self.writes = 0
+        self.errors = 0
+        self.last_error: Optional[Exception] = None
+        self._writer = writer or _write_configs
+        self._pending: Dict[tuple, Dict[str, Any]] = {}  # (config_dir, schema_name) -> latest config
+        self._inflight: Dict[tuple, Dict[str, Any]] = {}  # Configs taken by the writer but not yet written
+        self._versions: Dict[tuple, int] = {}  # Save sequence number of each pending config
+        self._dirs: Dict[str, Any] = {}  # Config directories as passed by callers
+        self._failed: set = set()  # Keys of pending configs whose last write failed
+        self._sequence = 0
+        self._first_save: Optional[float] = None
+        self._last_save: Optional[float] = None
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+    
+    def _key(
+        self,
+        schema_name: str,  # Name of the schema/configuration
+        config_dir: Path  # Directory where config files are stored
+    ) -> tuple:  # Queue key
+        """Build the queue key for a configuration."""
+        return (os.fspath(Path(config_dir)), schema_name)
+    
+    def put(
+        self,
+        schema_name: str,  # Name of the schema/configuration to save
+        config: Dict[str, Any],  # Configuration dictionary to save
+        config_dir: Path  # Directory where config files are stored
+    ) -> bool:  # True once the save is queued (or written, if the queue is closed)
+        """Queue a save, replacing any pending save of the same configuration."""
+        key = self._key(schema_name, config_dir)
+        snapshot = copy.deepcopy(config)
+        with self._cond:
+            if self._closed:
+                return self._writer({schema_name: snapshot}, config_dir)
+            self._pending[key] = snapshot
+            self._dirs[key[0]] = config_dir
+            self._sequence += 1
+            self._versions[key] = self._sequence
+            self.saves += 1
+            now = time.monotonic()
+            self._last_save = now
+            if self._first_save is None:
+                self._first_save = now
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="settings-write-behind", daemon=True)
+                self._thread.start()
+            self._cond.notify()
         return True
-    except PermissionError as e:
-        if _has_error_handling:
-            raise ConfigurationError(
-                message="Permission denied saving configuration",
-                debug_info=f"Cannot write to {config_dir}: {str(e)}",
-                context=ErrorContext(
-                    operation="save_config",
-                    extra={"schema_name": schema_name}
-                ),
-                config_path=str(config_dir / f"{schema_name}.json"),
-                cause=e
-            )
-        else:
-            print(f"Permission error saving config: {e}")
-            return False
-    except Exception as e:
-        if _has_error_handling:
-            raise ConfigurationError(
-                message=f"Failed to save configuration: {schema_name}",
-                debug_info=f"Error writing config file: {str(e)}",
-                context=ErrorContext(
-                    operation="save_config",
-                    extra={"schema_name": schema_name}
-                ),
-                config_path=str(config_dir / f"{schema_name}.json") if config_dir else None,
-                cause=e
+    
+    def get(
+        self,
+        schema_name: str,  # Name of the schema/configuration
+        config_dir: Path  # Directory where config files are stored
+    ) -> Optional[Dict[str, Any]]:  # Copy of the pending configuration, or None if nothing is pending
+        """Get a configuration that is saved but not yet written."""
+        key = self._key(schema_name, config_dir)
+        with self._cond:
+            config = self._pending.get(key)
+            if config is None:
+                config = self._inflight.get(key)
+            return copy.deepcopy(config) if config is not None else None
+    
+    def get_version(
+        self,
+        schema_name: str,  # Name of the schema/configuration
+        config_dir: Path  # Directory where config files are stored
+    ) -> Optional[int]:  # Sequence number of the pending save, or None if nothing is pending
+        """Get a token identifying the pending save of a configuration."""
+        with self._cond:
+            return self._versions.get(self._key(schema_name, config_dir))
+    
+    def _run(self):
+        """Write pending saves after each quiet period until the queue is closed."""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._pending:
+                        if self._closed:
+                            return
+                        self._cond.wait()
+                        continue
+                    deadline = min(self._last_save + self.delay, self._first_save + self.max_delay)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or self._closed:
+                        break
+                    self._cond.wait(remaining)
+            self.flush()
+    
+    def flush(self) -> bool:  # True if every pending save was written
+        """Write all pending saves now."""
+        with self._write_lock:
+            with self._cond:
+                if not self._pending:
+                    return True
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+                self._first_save = self._last_save = None
+            
+            by_dir: Dict[str, Dict[str, Any]] = {}
+            for (dir_key, schema_name), config in batch.items():
+                by_dir.setdefault(dir_key, {})[schema_name] = config
+            
+            failed = {}
+            for dir_key, configs in by_dir.items():
+                try:
+                    written = self._writer(configs, self._dirs[dir_key])
+                except Exception as e:
+                    self.errors += 1
+                    self.last_error = e
+                    _logger.exception("Error writing queued configurations to %s", dir_key)
+                    written = False
+                if written:
+                    self.writes += len(configs)
+                else:
+                    failed.update(((dir_key, schema_name), config) for schema_name, config in configs.items())
+            
+            with self._cond:
+                self._inflight = {}
+                self._failed.difference_update(batch.keys() - failed.keys())
+                self._failed.update(failed)
+                # Keep failed configs pending unless a newer save replaced them
+                for key, config in failed.items():
+                    self._pending.setdefault(key, config)
+                for key in batch:
+                    if key not in self._pending:
+                        self._versions.pop(key, None)
+                if self._pending and self._first_save is None:
+                    self._first_save = self._last_save = time.monotonic()
+            return not failed
+    
+    def close(self) -> bool:  # True if every pending save was written
+        """Stop the background writer after writing all pending saves."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return self.flush()
+    
+    def stats(
+        self
+    ) -> Dict[str, Any]:  # Save/write/error counters, pending count and configs waiting for a retry
+        """Get queue statistics."""
+        with self._cond:
+            return {
+                "saves": self.saves,
+                "writes": self.writes,
+                "errors": self.errors,
+                "pending": len(self._pending) + len(self._inflight),
+                "failed": sorted(self._failed),
+                "last_error": repr(self.last_error) if self.last_error is not None else None,
+                "delay": self.delay,
+                "max_delay": self.max_delay
+            }
+
+# %% ../../nbs/core/utils.ipynb 15
+def configure_write_behind(
+    delay: Optional[float] = 0.5,  # Quiet period in seconds before writing (None or 0 disables write-behind)
+    max_delay: float = 5.0  # Longest time in seconds a save stays pending under continuous saves
+) -> Optional[WriteBehindQueue]:  # The active queue, or None when disabled
+    """Enable, reconfigure or disable write-behind saves."""
+    global _write_behind
+    previous, _write_behind = _write_behind, None
+    # Write what the previous queue still holds before switching
+    if previous is not None:
+        previous.close()
+    _write_behind = WriteBehindQueue(delay, max_delay) if delay else None
+    return _write_behind
+
+def get_write_behind_queue() -> Optional[WriteBehindQueue]:  # The active queue, or None when disabled
+    """Get the write-behind queue, if enabled."""
+    return _write_behind
+
+def flush_config_writes() -> bool:  # True if every pending save was written
+    """Write all saves pending in the write-behind queue now."""
+    queue = _write_behind
+    return queue.flush() if queue is not None else True
+
+@atexit.register
+def _close_write_behind():
+    """Write pending saves at interpreter exit."""
+    if _write_behind is not None and not _write_behind.close():
+        # Nothing retries after exit: name the configurations that are lost
+        _logger.error("Queued configurations could not be written at exit: %s", _write_behind.stats()["failed"])
+
+# %% ../../nbs/core/utils.ipynb 21
+# Bounded executor shared by the async storage helpers
+_storage_executor: Optional[ThreadPoolExecutor] = None
+_storage_executor_workers: int = 4
+_storage_executor_lock = threading.Lock()
+
+def configure_storage_executor(
+    max_workers: int = 4  # Maximum number of concurrent storage operations
+):
+    """Set the size of the executor used for async storage operations."""
+    global _storage_executor, _storage_executor_workers
+    with _storage_executor_lock:
+        previous = _storage_executor
+        _storage_executor = None
+        _storage_executor_workers = max_workers
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+def get_storage_executor() -> ThreadPoolExecutor:  # Shared storage executor
+    """Get (creating it on first use) the executor used for blocking storage I/O."""
+    global _storage_executor
+    with _storage_executor_lock:
+        if _storage_executor is None:
+            _storage_executor = ThreadPoolExecutor(
+                max_workers=_storage_executor_workers,
+                thread_name_prefix="settings-storage"
             )
-        else:
-            print(f"Error saving config: {e}")
-            return False
+        return _storage_executor
+
+# %% ../../nbs/core/utils.ipynb 22
+async def run_storage_io(
+    func: Callable,  # Blocking storage function to run
+    *args,  # Positional arguments for `func`
+    **kwargs  # Keyword arguments for `func`
+) -> Any:  # Result of `func`
+    """Run a blocking storage call on the storage executor without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_storage_executor(), partial(func, *args, **kwargs))
+
+# %% ../../nbs/core/utils.ipynb 23
+async def aload_config(
+    schema_name: str,  # Name of the schema/configuration to load
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> Dict[str, Any]:  # Loaded configuration dictionary (empty dict if file doesn't exist)
+    """Async version of `load_config` that runs on the storage executor."""
+    return await run_storage_io(load_config, schema_name, config_dir)
+
+async def asave_config(
+    schema_name: str,  # Name of the schema/configuration to save
+    config: Dict[str, Any],  # Configuration dictionary to save
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> bool:  # True if save succeeded, False otherwise
+    """Async version of `save_config` that runs on the storage executor."""
+    return await run_storage_io(save_config, schema_name, config, config_dir)
+
+async def asave_configs(
+    configs: Dict[str, Dict[str, Any]],  # Configurations to save by schema name
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> bool:  # True if every configuration was saved, False otherwise
+    """Async version of `save_configs` that runs on the storage executor."""
+    return await run_storage_io(save_configs, configs, config_dir)
+
+# %% ../../nbs/core/utils.ipynb 27
+# JSON array and object types; checked with `type() in` since it runs once per property
+_CONTAINER_TYPES = frozenset((list, dict))
 
-# %% ../../nbs/core/utils.ipynb 12
 def get_default_values_from_schema(
     schema: Dict[str, Any]  # JSON Schema dictionary
 ) -> Dict[str, Any]:  # Dictionary of default values extracted from schema
     """Extract default values from a JSON schema."""
+    if not isinstance(schema, dict):
+        return compile_schema(schema).default_values()
+    # One pass over a plain dict is cheaper than checking it against a memoized compile
     values = {}
-    properties = schema.get("properties", {})
-
-    for prop_name, prop_schema in properties.items():
+    for prop_name, prop_schema in schema.get("properties", {}).items():
         if "default" in prop_schema:
-            values[prop_name] = prop_schema["default"]
-
+            value = prop_schema["default"]
+            # Copy array and object defaults so changing the result can't change the schema
+            values[prop_name] = thaw_value(value) if type(value) in _CONTAINER_TYPES else value
     return values
 
-# %% ../../nbs/core/utils.ipynb 15
+# %% ../../nbs/core/utils.ipynb 30
 def get_config_with_defaults(
     schema_name: str,  # Name of the schema (or unique_id for grouped schemas)
     schema: Dict[str, Any],  # JSON Schema dictionary
@@ -144,10 +446,88 @@ def get_config_with_defaults(
     config_id = schema.get("unique_id", schema_name)
     
     saved_config = load_config(config_id, config_dir)
-    default_values = get_default_values_from_schema(schema)
-    return {**default_values, **saved_config}
+    return {**get_default_values_from_schema(schema), **saved_config}
+
+def get_config_version(
+    schema_name: str,  # Name of the schema/configuration
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> Optional[str]:  # Token that changes whenever the saved configuration changes (None if not saved)
+    """Get a version token for a saved configuration, without loading it when the backend tracks versions."""
+    if config_dir is None:
+        from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
+        config_dir = DEFAULT_CONFIG_DIR
+    
+    # Saves queued by write-behind aren't visible to the backend yet
+    queue = _write_behind
+    if queue is not None:
+        pending_version = queue.get_version(schema_name, config_dir)
+        if pending_version is not None:
+            return f"pending-{pending_version}"
+    storage_backend = get_storage_backend()
+    get_version = getattr(storage_backend, "get_version", None)
+    if get_version is not None:
+        return get_version(schema_name, config_dir)
+    # Backends without version tokens: fall back to hashing the configuration itself
+    saved = storage_backend.load(schema_name, config_dir)
+    if not saved:
+        return None
+    return hashlib.blake2b(json.dumps(saved, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+
+# %% ../../nbs/core/utils.ipynb 33
+def _convert_array_value(
+    value: Any  # Submitted value of an array field
+) -> Any:  # Parsed list (or the value unchanged if it can't be parsed)
+    """Convert a submitted array field value to a list."""
+    # If it's already a proper list, leave it
+    if isinstance(value, list) and value and not isinstance(value[0], str):
+        return value
+
+    # If it's a string that looks like a Python list, parse it
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith('[') and value.endswith(']'):
+            try:
+                # Safely evaluate the list string
+                return ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                # Fall back to comma-separated parsing
+                return [item.strip() for item in value.split(',') if item.strip()]
+        # Treat as comma-separated values
+        return [item.strip() for item in value.split(',') if item.strip()]
+    elif isinstance(value, list):
+        # If it's a list but contains string representations of lists
+        if value and isinstance(value[0], str) and value[0].startswith('['):
+            # Join the parts and parse as a single list
+            try:
+                return ast.literal_eval(''.join(value))
+            except (ValueError, SyntaxError):
+                # Keep as is if parsing fails
+                pass
+        return value
+    return [value]
+
+def _coerce_field_value(
+    kind: str,  # Field kind from the compiled schema
+    value: Any  # Submitted value
+) -> Any:  # Converted value
+    """Convert one submitted non-boolean value according to its field kind."""
+    # Handle empty strings - convert to None for optional fields
+    if value == "" or value is None:
+        return [None] if kind == "array" else None
+    if kind == "integer":
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return None
+    if kind == "number":
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+    if kind == "array":
+        return _convert_array_value(value)
+    return value
 
-# %% ../../nbs/core/utils.ipynb 18
 def convert_form_data_to_config(
     form_data: dict,  # Raw form data from request
     schema: Dict[str, Any]  # JSON Schema for type conversion
@@ -155,68 +535,389 @@ def convert_form_data_to_config(
     """Convert form data to configuration dict based on schema."""
     config = dict(form_data)
 
-    # Handle boolean fields (checkboxes)
-    for prop_name, prop_schema in schema.get("properties", {}).items():
-        if prop_schema.get("type") == "boolean":
+    for prop_name, kind in compile_schema(schema).fields:
+        # Handle boolean fields (checkboxes)
+        if kind == "boolean":
             config[prop_name] = prop_name in config
+            continue
+        if prop_name not in config:
+            continue
 
-    # Convert numeric fields
-    for prop_name, prop_schema in schema.get("properties", {}).items():
-        if prop_name in config:
-            prop_type = prop_schema.get("type")
-            value = config[prop_name]
-
-            # Handle empty strings - convert to None for optional fields
-            if value == "" or value is None:
+        # Same rules as `_coerce_field_value`, inlined because this loop runs once per field
+        value = config[prop_name]
+        if value == "" or value is None:
+            config[prop_name] = [None] if kind == "array" else None
+        elif kind == "integer":
+            try:
+                config[prop_name] = int(value)
+            except (ValueError, TypeError):
+                config[prop_name] = None
+        elif kind == "number":
+            try:
+                config[prop_name] = float(value)
+            except (ValueError, TypeError):
                 config[prop_name] = None
-                continue
+        elif kind == "array":
+            config[prop_name] = _convert_array_value(value)
 
-            if prop_type == "integer" or (isinstance(prop_type, list) and "integer" in prop_type):
-                try:
-                    config[prop_name] = int(value)
-                except (ValueError, TypeError):
-                    config[prop_name] = None
-            elif prop_type == "number" or (isinstance(prop_type, list) and "number" in prop_type):
-                try:
-                    config[prop_name] = float(value)
-                except (ValueError, TypeError):
-                    config[prop_name] = None
+    return config
 
-    # Handle array fields
-    for prop_name, prop_schema in schema.get("properties", {}).items():
-        if prop_schema.get("type") == "array" and prop_name in config:
-            value = config[prop_name]
-
-            # If it's already a proper list, leave it
-            if isinstance(value, list) and value and not isinstance(value[0], str):
-                continue
-
-            # If it's a string that looks like a Python list, parse it
-            if isinstance(value, str):
-                value = value.strip()
-                if value.startswith('[') and value.endswith(']'):
-                    try:
-                        # Safely evaluate the list string
-                        import ast
-                        config[prop_name] = ast.literal_eval(value)
-                    except (ValueError, SyntaxError):
-                        # Fall back to comma-separated parsing
-                        config[prop_name] = [item.strip() for item in value.split(',') if item.strip()]
-                else:
-                    # Treat as comma-separated values
-                    config[prop_name] = [item.strip() for item in value.split(',') if item.strip()]
-            elif isinstance(value, list):
-                # If it's a list but contains string representations of lists
-                if value and isinstance(value[0], str) and value[0].startswith('['):
-                    # Join the parts and parse as a single list
-                    joined = ''.join(value)
-                    try:
-                        import ast
-                        config[prop_name] = ast.literal_eval(joined)
-                    except (ValueError, SyntaxError):
-                        # Keep as is if parsing fails
-                        pass
-            elif not isinstance(value, list):
-                config[prop_name] = [value]
+# %% ../../nbs/core/utils.ipynb 35
+# Generated converters by schema fingerprint
+_form_converters: Dict[str, Callable[[dict], dict]] = {}
+_form_converters_lock = threading.Lock()
 
-    return config
+def _generate_converter_source(
+    compiled: CompiledSchema  # Compiled schema to specialize for
+) -> str:  # Python source of a `convert(form_data)` function
+    """Generate the source of a converter specialized for one schema."""
+    lines = ["def convert(form_data):", "    config = dict(form_data)"]
+    for prop_name, kind in compiled.fields:
+        key = repr(prop_name)
+        if kind == "boolean":
+            lines.append(f"    config[{key}] = {key} in config")
+            continue
+        lines += [f"    if {key} in config:",
+                  f"        value = config[{key}]",
+                  "        if value == '' or value is None:"]
+        if kind == "array":
+            lines += [f"            config[{key}] = [None]",
+                      "        else:",
+                      f"            config[{key}] = _convert_array_value(value)"]
+        elif kind in ("integer", "number"):
+            cast = "int" if kind == "integer" else "float"
+            lines += [f"            config[{key}] = None",
+                      "        else:",
+                      "            try:",
+                      f"                config[{key}] = {cast}(value)",
+                      "            except (ValueError, TypeError):",
+                      f"                config[{key}] = None"]
+        else:
+            lines.append(f"            config[{key}] = None")
+    lines.append("    return config")
+    return "\n".join(lines) + "\n"
+
+def get_form_converter(
+    schema: Dict[str, Any]  # JSON Schema (or CompiledSchema) to convert form data for
+) -> Callable[[dict], dict]:  # Function mapping raw form data to a configuration dict
+    """Get a form-to-config converter specialized for a schema, generating it on first use."""
+    compiled = compile_schema(schema)
+    fingerprint = compiled.fingerprint
+    converter = _form_converters.get(fingerprint)
+    if converter is not None:
+        return converter
+
+    source = _generate_converter_source(compiled)
+    namespace = {"_convert_array_value": _convert_array_value}
+    exec(compile(source, f"<form converter {fingerprint}>", "exec"), namespace)
+    converter = namespace["convert"]
+    converter.source = source
+    with _form_converters_lock:
+        return _form_converters.setdefault(fingerprint, converter)
+
+# %% ../../nbs/core/utils.ipynb 39
+def _flush_pending_save(
+    schema_name: str,  # Name of the schema/configuration
+    config_dir: Path  # Directory where config files are stored
+):
+    """Write a queued save of a configuration so its stored revision is current."""
+    queue = _write_behind
+    if queue is not None and queue.get_version(schema_name, config_dir) is not None:
+        queue.flush()
+
+def get_config_revision(
+    schema_name: str,  # Name of the schema/configuration
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> Optional[int]:  # Revision of the saved configuration (0 if never saved, None if the backend doesn't track revisions)
+    """Get the revision number of a saved configuration."""
+    if config_dir is None:
+        from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
+        config_dir = DEFAULT_CONFIG_DIR
+    
+    get_revision = getattr(get_storage_backend(), "get_revision", None)
+    if get_revision is None:
+        return None
+    _flush_pending_save(schema_name, config_dir)
+    return get_revision(schema_name, config_dir)
+
+def save_config_if_revision(
+    schema_name: str,  # Name of the schema/configuration to save
+    config: Dict[str, Any],  # Configuration dictionary to save
+    expected_revision: Optional[int],  # Revision the configuration was edited from (None saves unchecked)
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> tuple:  # (saved, revision): the new revision on success, the current revision on a conflict
+    """Save a configuration only if it wasn't saved by someone else since `expected_revision`."""
+    if config_dir is None:
+        from cjm_fasthtml_settings.core.config import DEFAULT_CONFIG_DIR
+        config_dir = DEFAULT_CONFIG_DIR
+    
+    backend = get_storage_backend()
+    save_if_revision = getattr(backend, "save_if_revision", None)
+    if save_if_revision is None or expected_revision is None:
+        saved = save_config(schema_name, config, config_dir)
+        return saved, None
+    
+    _flush_pending_save(schema_name, config_dir)
+    revision = _save_and_publish(
+        {schema_name: config}, config_dir,
+        partial(save_if_revision, schema_name, config, expected_revision, config_dir)
+    )
+    if revision is None:
+        return False, backend.get_revision(schema_name, config_dir)
+    return True, revision
+
+async def aget_config_revision(
+    schema_name: str,  # Name of the schema/configuration
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> Optional[int]:  # Revision of the saved configuration (0 if never saved, None if not tracked)
+    """Async version of `get_config_revision` that runs on the storage executor."""
+    return await run_storage_io(get_config_revision, schema_name, config_dir)
+
+async def asave_config_if_revision(
+    schema_name: str,  # Name of the schema/configuration to save
+    config: Dict[str, Any],  # Configuration dictionary to save
+    expected_revision: Optional[int],  # Revision the configuration was edited from (None saves unchecked)
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> tuple:  # (saved, revision) as returned by `save_config_if_revision`
+    """Async version of `save_config_if_revision` that runs on the storage executor."""
+    return await run_storage_io(save_config_if_revision, schema_name, config, expected_revision, config_dir)
+
+# %% ../../nbs/core/utils.ipynb 43
+# Python types accepted for each field kind (bools are rejected for numeric kinds separately)
+_FIELD_KIND_TYPES = {
+    "boolean": (bool,),
+    "integer": (int,),
+    "number": (int, float),
+    "array": (list,),
+}
+
+# Python types accepted for the JSON Schema types of "value" fields
+_JSON_TYPES = {
+    "string": (str,),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+def _validate_field_value(
+    field_name: str,  # Property name
+    kind: str,  # Field kind from the compiled schema
+    prop_schema: Mapping[str, Any],  # Property schema
+    value: Any  # Submitted value
+) -> Optional[str]:  # Error message, or None if the value is valid
+    """Validate one submitted value against its property schema."""
+    expected = _FIELD_KIND_TYPES.get(kind)
+    if expected is None:
+        prop_types = prop_schema.get("type")
+        prop_types = prop_types if isinstance(prop_types, list) else [prop_types]
+        expected = sum((_JSON_TYPES.get(t, ()) for t in prop_types), ())
+    if expected and (not isinstance(value, expected) or (kind in ("integer", "number") and isinstance(value, bool))):
+        return f"'{field_name}' must be of type {prop_schema.get('type')}"
+    
+    if "enum" in prop_schema and value not in prop_schema["enum"]:
+        return f"'{field_name}' must be one of {list(prop_schema['enum'])}"
+    if kind in ("integer", "number"):
+        if "minimum" in prop_schema and value < prop_schema["minimum"]:
+            return f"'{field_name}' must be >= {prop_schema['minimum']}"
+        if "maximum" in prop_schema and value > prop_schema["maximum"]:
+            return f"'{field_name}' must be <= {prop_schema['maximum']}"
+    return None
+
+def validate_config_data(
+    config_data: Any,  # Submitted configuration (e.g. a decoded JSON body)
+    schema: Dict[str, Any]  # JSON Schema (or CompiledSchema) to validate against
+) -> List[str]:  # Error messages (empty if the configuration is valid)
+    """Validate typed configuration data against a schema."""
+    if not isinstance(config_data, dict):
+        return ["Configuration must be a JSON object"]
+    
+    compiled = compile_schema(schema)
+    properties = compiled.schema.get("properties", {})
+    errors = []
+    
+    for name in compiled.required:
+        if config_data.get(name) is None and name not in compiled.defaults:
+            errors.append(f"'{name}' is required")
+    
+    for name, value in config_data.items():
+        kind = compiled.field_kinds.get(name)
+        if kind is None:
+            if compiled.schema.get("additionalProperties") is False:
+                errors.append(f"Unknown property '{name}'")
+            continue
+        if value is None:
+            continue  # Empty optional fields are stored as None; missing required ones are reported above
+        error = _validate_field_value(name, kind, properties[name], value)
+        if error:
+            errors.append(error)
+    
+    return errors
+
+def validate_config_field(
+    schema: Dict[str, Any],  # JSON Schema (or CompiledSchema) the field belongs to
+    field_name: str,  # Property name
+    value: Any  # Typed value of the field
+) -> Optional[str]:  # Error message, or None if the value is valid
+    """Validate a single field value with the rules of `validate_config_data`."""
+    compiled = compile_schema(schema)
+    kind = compiled.field_kinds.get(field_name)
+    if kind is None:
+        return f"Unknown property '{field_name}'"
+    if value is None:
+        return None
+    return _validate_field_value(field_name, kind, compiled.schema["properties"][field_name], value)
+
+# %% ../../nbs/core/utils.ipynb 47
+def convert_form_field(
+    schema: Dict[str, Any],  # JSON Schema (or CompiledSchema) the field belongs to
+    field_name: str,  # Property name of the submitted field
+    form_data: dict  # Raw form data from request
+) -> Any:  # Converted value for the field
+    """Convert the submitted value of a single field based on its property schema."""
+    kind = compile_schema(schema).field_kinds[field_name]
+    # Unchecked checkboxes are not submitted at all
+    if kind == "boolean":
+        return field_name in form_data
+    return _coerce_field_value(kind, form_data.get(field_name))
+
+# %% ../../nbs/core/utils.ipynb 50
+# Per-configuration locks serializing read-modify-write field updates
+_field_update_locks: Dict[tuple, threading.Lock] = {}
+_field_update_locks_lock = threading.Lock()
+
+def _get_field_update_lock(
+    schema_name: str,  # Name of the schema/configuration being updated
+    config_dir: Optional[Path]  # Directory where config files are stored
+) -> threading.Lock:  # Lock guarding updates to this configuration
+    """Get the lock serializing field updates to one configuration."""
+    key = (str(config_dir), schema_name)
+    lock = _field_update_locks.get(key)
+    if lock is None:
+        with _field_update_locks_lock:
+            lock = _field_update_locks.setdefault(key, threading.Lock())
+    return lock
+
+# Attempts `merge_config_field` makes before giving up on a configuration that keeps changing
+_FIELD_UPDATE_ATTEMPTS = 5
+
+def merge_config_field(
+    schema_name: str,  # Name of the schema/configuration to update
+    field_name: str,  # Property name of the field to set
+    value: Any,  # Converted value for the field
+    config_dir: Optional[Path] = None,  # Directory where config files are stored
+    schema: Optional[Dict[str, Any]] = None  # Schema to validate the merged configuration against (None to skip)
+) -> tuple:  # (saved, errors, revision): validation errors, and the new revision when the backend tracks them
+    """Merge a single field value into the saved configuration, re-merging if it is saved concurrently."""
+    with _get_field_update_lock(schema_name, config_dir):
+        for _ in range(_FIELD_UPDATE_ATTEMPTS):
+            # Read the revision before the configuration, so a save in between makes the checked write fail
+            revision = get_config_revision(schema_name, config_dir)
+            config = load_config(schema_name, config_dir)
+            config[field_name] = value
+            if schema is not None:
+                errors = validate_config_data(config, schema)
+                if errors:
+                    return False, errors, revision
+            if revision is None:
+                # Without revisions only the per-process lock protects the merge
+                return save_config(schema_name, config, config_dir), [], None
+            saved, current = save_config_if_revision(schema_name, config, revision, config_dir)
+            if saved or current == revision:
+                # Saved, or the write itself failed rather than losing a race with another process
+                return saved, [], current
+    return False, [f"'{schema_name}' kept changing while '{field_name}' was being saved"], current
+
+def update_config_field(
+    schema_name: str,  # Name of the schema/configuration to update
+    field_name: str,  # Property name of the field to set
+    value: Any,  # Converted value for the field
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> bool:  # True if save succeeded, False otherwise
+    """Merge a single field value into the saved configuration for a schema."""
+    return merge_config_field(schema_name, field_name, value, config_dir)[0]
+
+async def amerge_config_field(
+    schema_name: str,  # Name of the schema/configuration to update
+    field_name: str,  # Property name of the field to set
+    value: Any,  # Converted value for the field
+    config_dir: Optional[Path] = None,  # Directory where config files are stored
+    schema: Optional[Dict[str, Any]] = None  # Schema to validate the merged configuration against (None to skip)
+) -> tuple:  # (saved, errors, revision) as returned by `merge_config_field`
+    """Async version of `merge_config_field` that runs on the storage executor."""
+    return await run_storage_io(merge_config_field, schema_name, field_name, value, config_dir, schema)
+
+async def aupdate_config_field(
+    schema_name: str,  # Name of the schema/configuration to update
+    field_name: str,  # Property name of the field to set
+    value: Any,  # Converted value for the field
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> bool:  # True if save succeeded, False otherwise
+    """Async version of `update_config_field` that runs on the storage executor."""
+    return await run_storage_io(update_config_field, schema_name, field_name, value, config_dir)
+
+# %% ../../nbs/core/utils.ipynb 56
+# Strings accepted for boolean fields
+_TRUE_STRINGS = frozenset({"true", "on", "yes", "1"})
+_FALSE_STRINGS = frozenset({"false", "off", "no", "0", ""})
+
+def convert_config_data(
+    config_data: Any,  # Submitted configuration (e.g. a decoded JSON body)
+    schema: Dict[str, Any]  # JSON Schema (or CompiledSchema) for type conversion
+) -> Any:  # Configuration with string values of typed fields converted
+    """Convert string values of typed fields using the form conversion rules."""
+    if not isinstance(config_data, dict):
+        return config_data
+    
+    field_kinds = compile_schema(schema).field_kinds
+    converted = dict(config_data)
+    for name, value in config_data.items():
+        kind = field_kinds.get(name)
+        if not isinstance(value, str) or kind in (None, "value"):
+            continue
+        if kind == "boolean":
+            lowered = value.strip().lower()
+            if lowered in _TRUE_STRINGS or lowered in _FALSE_STRINGS:
+                converted[name] = lowered in _TRUE_STRINGS
+        elif value == "":
+            converted[name] = None
+        else:
+            coerced = _coerce_field_value(kind, value)
+            if coerced is not None:
+                converted[name] = coerced
+    return converted
+
+def prepare_configs(
+    configs: Dict[str, Any],  # Submitted configurations by schema ID
+    schemas: Optional[Dict[str, Any]] = None  # Schemas by ID (defaults to resolving IDs with the settings registry)
+) -> tuple:  # (converted configurations by ID, error messages by ID)
+    """Convert and validate several configurations, each with its own schema."""
+    prepared, errors = {}, {}
+    for schema_id, config_data in configs.items():
+        if schemas is not None:
+            schema = schemas.get(schema_id)
+            error_msg = None if schema is not None else f"Settings '{schema_id}' not found"
+        else:
+            from cjm_fasthtml_settings.core.schemas import registry
+            schema, error_msg = registry.resolve_schema(schema_id)
+        if schema is None:
+            errors[schema_id] = [error_msg]
+            continue
+        
+        converted = convert_config_data(config_data, schema)
+        config_errors = validate_config_data(converted, schema)
+        if config_errors:
+            errors[schema_id] = config_errors
+        else:
+            prepared[schema_id] = converted
+    return prepared, errors
+
+def bulk_save_configs(
+    configs: Dict[str, Any],  # Submitted configurations by schema ID
+    schemas: Optional[Dict[str, Any]] = None,  # Schemas by ID (defaults to resolving IDs with the settings registry)
+    config_dir: Optional[Path] = None  # Directory where config files are stored
+) -> tuple:  # (True if everything was saved, error messages by ID)
+    """Convert, validate and save several configurations in one batched write."""
+    prepared, errors = prepare_configs(configs, schemas)
+    if errors:
+        # Nothing is written unless every entry is valid
+        return False, errors
+    return save_configs(prepared, config_dir), {}
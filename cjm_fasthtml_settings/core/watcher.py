@@ -0,0 +1,367 @@
+"""Push configuration directory changes to the config caches instead of polling with stat"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/core/watcher.ipynb.
+
+# %% auto 0
+__all__ = ['ConfigChange', 'ConfigWatcher', 'start_config_watcher', 'get_config_watcher', 'stop_config_watcher']
+
+# %% ../../nbs/core/watcher.ipynb 3
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .cache import config_cache, config_index, get_file_signature
+from .events import config_subscriptions
+
+# %% ../../nbs/core/watcher.ipynb 6
+@dataclass(frozen=True)
+class ConfigChange:
+    """A change to the configuration files of a watched directory."""
+    config_dir: str  # Watched directory
+    schema_id: Optional[str]  # Schema whose file changed (None when the whole directory must be re-read)
+    kind: str  # "changed" (created or rewritten), "deleted" or "rescan"
+
+# %% ../../nbs/core/watcher.ipynb 9
+# inotify event flags (see inotify(7))
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+_WATCH_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+_DELETED_MASK = _IN_DELETE | _IN_MOVED_FROM
+_DIRECTORY_GONE_MASK = _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED
+
+# struct inotify_event header: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct("iIII")
+
+_libc = None
+
+def _load_inotify() -> Optional[ctypes.CDLL]:  # libc with the inotify functions, or None if unavailable
+    """Load the inotify functions from libc (Linux only)."""
+    global _libc
+    if _libc is not None:
+        return _libc
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_add_watch.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        return None
+    _libc = libc
+    return libc
+
+def _inotify_open(
+    config_dir: Path  # Directory to watch
+) -> int:  # inotify file descriptor watching the directory
+    """Create a non-blocking inotify instance watching one directory."""
+    libc = _load_inotify()
+    if libc is None:
+        raise OSError("inotify is not available")
+    fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    if fd < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+    if libc.inotify_add_watch(fd, os.fsencode(config_dir), _WATCH_MASK) < 0:
+        errno = ctypes.get_errno()
+        os.close(fd)
+        raise OSError(errno, os.strerror(errno), os.fspath(config_dir))
+    return fd
+
+def _parse_inotify_events(
+    data: bytes  # Bytes read from an inotify file descriptor
+) -> List[Tuple[int, str]]:  # (mask, file name) of each event
+    """Split a buffer read from inotify into events."""
+    events = []
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(data):
+        _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+        offset += _EVENT_HEADER.size
+        name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+        offset += length
+        events.append((mask, name))
+    return events
+
+# %% ../../nbs/core/watcher.ipynb 12
+# The watcher thread has no caller to raise to, so its errors are logged
+_logger = logging.getLogger(__name__)
+
+class ConfigWatcher:
+    """Watch a configuration directory and push its changes to the config caches and subscribers."""
+    
+    def __init__(
+        self,
+        config_dir: Union[str, Path],  # Directory to watch
+        poll_interval: float = 1.0,  # Seconds between directory listings when polling
+        use_inotify: bool = True  # Use inotify when available (False always polls)
+    ):
+        self.config_dir = Path(config_dir)
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.mode: Optional[str] = None  # "inotify" or "polling" while running
+        self.events = 0
+        self.errors = 0
+        self.last_error: Optional[Exception] = None
+        self._dir_key = os.fspath(self.config_dir)
+        self._subscribers: List[Callable[[ConfigChange], None]] = []
+        self._snapshot: Dict[str, Tuple[int, int, int]] = {}
+        self._inotify_fd: Optional[int] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def subscribe(
+        self,
+        callback: Callable[[ConfigChange], None]  # Called with each `ConfigChange` (on the watcher thread)
+    ) -> Callable[[ConfigChange], None]:  # The callback, so this can be used as a decorator
+        """Register a function to call for every change."""
+        with self._lock:
+            self._subscribers = [*self._subscribers, callback]
+        return callback
+    
+    def unsubscribe(
+        self,
+        callback: Callable[[ConfigChange], None]  # Previously subscribed callback
+    ) -> bool:  # True if the callback was subscribed
+        """Stop calling a function for changes."""
+        with self._lock:
+            if callback not in self._subscribers:
+                return False
+            self._subscribers = [subscriber for subscriber in self._subscribers if subscriber is not callback]
+            return True
+    
+    @property
+    def running(self) -> bool:  # True while the watcher thread is alive
+        """Check if the watcher is running."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def _scan(self) -> Dict[str, Tuple[int, int, int]]:  # File signatures by schema ID
+        """List the configuration files of the directory with their signatures."""
+        snapshot = {}
+        try:
+            with os.scandir(self._dir_key) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and not entry.name.startswith("."):
+                        try:
+                            snapshot[entry.name[:-5]] = get_file_signature(entry.stat())
+                        except FileNotFoundError:
+                            continue
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return snapshot
+    
+    def _publish(
+        self,
+        change: ConfigChange  # Change to apply to the caches and pass on
+    ):
+        """Invalidate the caches for a change, publish it to config subscribers, then notify watcher subscribers."""
+        if change.schema_id is None:
+            config_cache.invalidate(config_dir=self._dir_key)
+            config_index.invalidate(self._dir_key)
+        elif change.kind == "deleted":
+            config_cache.invalidate(change.schema_id, self._dir_key)
+            config_index.invalidate(self._dir_key)
+        else:
+            config_cache.invalidate(change.schema_id, self._dir_key)
+            config_index.add(change.schema_id, self._dir_key)
+        self.events += 1
+        config_subscriptions.handle_file_change(change)
+        for callback in self._subscribers:
+            try:
+                callback(change)
+            except Exception as e:
+                self.errors += 1
+                self.last_error = e
+                _logger.exception("Error in config watcher subscriber %r", callback)
+    
+    def _handle_inotify_events(
+        self,
+        data: bytes  # Bytes read from the inotify file descriptor
+    ) -> bool:  # False if the watched directory is gone
+        """Publish the changes described by a batch of inotify events."""
+        changes = {}
+        for mask, name in _parse_inotify_events(data):
+            if mask & _DIRECTORY_GONE_MASK:
+                return False
+            if mask & _IN_Q_OVERFLOW:
+                self._publish(ConfigChange(self._dir_key, None, "rescan"))
+                changes.clear()
+                continue
+            if not name.endswith(".json") or name.startswith("."):
+                continue
+            # Several events for the same file in one batch collapse into its last state
+            changes[name[:-5]] = "deleted" if mask & _DELETED_MASK else "changed"
+        for schema_id, kind in changes.items():
+            self._publish(ConfigChange(self._dir_key, schema_id, kind))
+        return True
+    
+    def _run_inotify(self) -> bool:  # True if stopped, False if the directory went away
+        """Publish inotify events until stopped."""
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._inotify_fd, self._wake_r], [], [])
+            if self._inotify_fd not in readable:
+                continue
+            try:
+                data = os.read(self._inotify_fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            if not self._handle_inotify_events(data):
+                return False
+        return True
+    
+    def _poll_once(self):
+        """List the directory once and publish the differences from the previous listing."""
+        snapshot = self._scan()
+        previous, self._snapshot = self._snapshot, snapshot
+        for schema_id, signature in snapshot.items():
+            if previous.get(schema_id) != signature:
+                self._publish(ConfigChange(self._dir_key, schema_id, "changed"))
+        for schema_id in previous.keys() - snapshot.keys():
+            self._publish(ConfigChange(self._dir_key, schema_id, "deleted"))
+    
+    def _run(self):
+        """Watcher thread: use inotify while possible, then poll."""
+        try:
+            if self.mode == "inotify" and self._run_inotify():
+                return
+            if self.mode == "inotify":
+                # The directory was deleted or moved: keep watching its path by polling
+                self._close_inotify()
+                self.mode = "polling"
+                self._snapshot = self._scan()
+                self._publish(ConfigChange(self._dir_key, None, "rescan"))
+            while not self._stop.wait(self.poll_interval):
+                self._poll_once()
+        except Exception as e:
+            self.errors += 1
+            self.last_error = e
+            _logger.exception("Config watcher for %s stopped", self._dir_key)
+            config_cache.unwatch(self._dir_key)
+            config_index.unwatch(self._dir_key)
+    
+    def _close_inotify(self):
+        """Close the inotify file descriptor, if open."""
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+    
+    def start(self) -> "ConfigWatcher":  # The watcher, now running
+        """Start watching the directory."""
+        if self.running:
+            return self
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        self._stop.clear()
+        self.mode = "polling"
+        if self.use_inotify:
+            try:
+                self._inotify_fd = _inotify_open(self.config_dir)
+                self._wake_r, self._wake_w = os.pipe()
+                self.mode = "inotify"
+            except OSError as e:
+                self.last_error = e
+        # Take the polling baseline before the caches are cleared, so no change falls in between
+        self._snapshot = self._scan() if self.mode == "polling" else {}
+        # Only trust the caches once changes are being observed; drop what was cached before
+        config_cache.watch(self._dir_key)
+        config_index.watch(self._dir_key)
+        config_cache.invalidate(config_dir=self._dir_key)
+        config_index.invalidate(self._dir_key)
+        self._thread = threading.Thread(target=self._run, name=f"settings-watcher-{self.config_dir.name}", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop watching and go back to validating cache entries on every read."""
+        self._stop.set()
+        if self._wake_w is not None:
+            os.write(self._wake_w, b"\0")
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+        self._close_inotify()
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+        self.mode = None
+        config_cache.unwatch(self._dir_key)
+        config_index.unwatch(self._dir_key)
+    
+    def stats(
+        self
+    ) -> Dict[str, object]:  # Mode, event and error counts and subscriber count
+        """Get watcher statistics."""
+        return {
+            "config_dir": self._dir_key,
+            "mode": self.mode,
+            "running": self.running,
+            "events": self.events,
+            "errors": self.errors,
+            "last_error": repr(self.last_error) if self.last_error is not None else None,
+            "subscribers": len(self._subscribers)
+        }
+
+# %% ../../nbs/core/watcher.ipynb 15
+# Running watchers by directory
+_watchers: Dict[str, ConfigWatcher] = {}
+_watchers_lock = threading.Lock()
+
+def start_config_watcher(
+    config_dir: Union[str, Path],  # Directory to watch
+    poll_interval: float = 1.0,  # Seconds between directory listings when polling
+    use_inotify: bool = True  # Use inotify when available (False always polls)
+) -> ConfigWatcher:  # The running watcher for the directory
+    """Start watching a configuration directory, or return the watcher already running for it."""
+    dir_key = os.fspath(Path(config_dir))
+    with _watchers_lock:
+        watcher = _watchers.get(dir_key)
+        if watcher is None or not watcher.running:
+            watcher = _watchers[dir_key] = ConfigWatcher(config_dir, poll_interval, use_inotify).start()
+        return watcher
+
+def get_config_watcher(
+    config_dir: Union[str, Path]  # Watched directory
+) -> Optional[ConfigWatcher]:  # The running watcher, or None if the directory isn't watched
+    """Get the watcher running for a directory, if any."""
+    watcher = _watchers.get(os.fspath(Path(config_dir)))
+    return watcher if watcher is not None and watcher.running else None
+
+def stop_config_watcher(
+    config_dir: Optional[Union[str, Path]] = None  # Directory to stop watching (None stops all watchers)
+):
+    """Stop watching one or all configuration directories."""
+    with _watchers_lock:
+        if config_dir is None:
+            watchers = list(_watchers.values())
+            _watchers.clear()
+        else:
+            watcher = _watchers.pop(os.fspath(Path(config_dir)), None)
+            watchers = [watcher] if watcher is not None else []
+    for watcher in watchers:
+        watcher.stop()
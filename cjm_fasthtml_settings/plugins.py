@@ -3,12 +3,13 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/plugins.ipynb.
 
 # %% auto 0
-__all__ = ['PluginRegistryProtocol']
+__all__ = ['PluginRegistryProtocol', 'ConfiguredPluginsProtocol', 'CachedPluginRegistry']
 
 # %% ../nbs/plugins.ipynb 3
 import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, Protocol, runtime_checkable
+from typing import Dict, Any, Optional, Callable, Iterable, Protocol, runtime_checkable
 
 # Import from cjm-fasthtml-plugins
 from cjm_fasthtml_plugins.core.metadata import PluginMetadata
@@ -52,3 +53,185 @@ class PluginRegistryProtocol(Protocol):
     ) -> bool:  # True if save succeeded
         """Save configuration for a plugin."""
         ...
+
+# %% ../nbs/plugins.ipynb 12
+@runtime_checkable
+class ConfiguredPluginsProtocol(Protocol):
+    """Optional bulk probe that plugin registries can implement alongside `PluginRegistryProtocol`."""
+    
+    def get_configured_plugin_ids(
+        self
+    ) -> Iterable[str]:  # Unique IDs of all plugins with a saved configuration
+        """Get the unique IDs of all plugins that have a saved configuration."""
+        ...
+
+# %% ../nbs/plugins.ipynb 15
+class CachedPluginRegistry:
+    """Memoizing wrapper around any `PluginRegistryProtocol` implementation."""
+    
+    def __init__(
+        self,
+        registry: PluginRegistryProtocol  # Plugin registry to wrap
+    ):
+        self.registry = registry
+        self.version = 0  # Incremented whenever cached data is dropped
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._source_version = getattr(registry, "version", None)
+        self._clear()
+    
+    def _clear(self):
+        """Drop all cached data."""
+        self._plugins: Dict[str, Optional[PluginMetadata]] = {}
+        self._plugins_by_category: Dict[str, list] = {}
+        self._categories: Dict[None, list] = {}  # Single entry, so it shares the `_cached` path
+        self._display_names: Dict[str, Optional[str]] = {}
+        self._configs: Dict[str, Dict[str, Any]] = {}
+        self._configured_ids: Optional[frozenset] = None
+    
+    def _check_source_version(self):
+        """Drop the caches if the wrapped registry reports a new version."""
+        source_version = getattr(self.registry, "version", None)
+        if source_version != self._source_version:
+            self._source_version = source_version
+            self._clear()
+            self.version += 1
+    
+    def _cached(
+        self,
+        cache_name: str,  # Attribute holding the cache to look the key up in
+        key: Any,  # Cache key
+        load: Callable[[], Any]  # Function computing the value on a miss
+    ) -> Any:  # Cached or freshly loaded value
+        """Look up a value, loading and storing it on a miss."""
+        with self._lock:
+            self._check_source_version()
+            cache = getattr(self, cache_name)
+            if key in cache:
+                self.hits += 1
+                return cache[key]
+            self.misses += 1
+            version = self.version
+        
+        # Call the wrapped registry without holding the lock, so a slow lookup doesn't block the others
+        value = load()
+        with self._lock:
+            if self.version != version:
+                # The caches were dropped while loading, so the value may already be stale
+                return value
+            return getattr(self, cache_name).setdefault(key, value)
+    
+    def get_plugin(
+        self,
+        unique_id: str  # Plugin unique ID
+    ) -> Optional[PluginMetadata]:  # Plugin metadata or None
+        """Get plugin metadata by unique ID."""
+        return self._cached("_plugins", unique_id, lambda: self.registry.get_plugin(unique_id))
+    
+    def get_plugins_by_category(
+        self,
+        category: str  # Category name
+    ) -> list[PluginMetadata]:  # List of plugins in category
+        """Get all plugins in a category."""
+        plugins = self._cached(
+            "_plugins_by_category", category,
+            lambda: list(self.registry.get_plugins_by_category(category))
+        )
+        return list(plugins)
+    
+    def get_categories_with_plugins(
+        self
+    ) -> list[str]:  # List of category names
+        """Get all categories that have registered plugins."""
+        categories = self._cached("_categories", None, lambda: list(self.registry.get_categories_with_plugins()))
+        return list(categories)
+    
+    def get_category_display_name(
+        self,
+        category: str  # Category name
+    ) -> Optional[str]:  # Display name for the category
+        """Get the display name of a category."""
+        return self._cached(
+            "_display_names", category,
+            lambda: self.registry.get_category_display_name(category)
+        )
+    
+    def load_plugin_config(
+        self,
+        unique_id: str  # Plugin unique ID
+    ) -> Dict[str, Any]:  # Loaded configuration
+        """Load saved configuration for a plugin."""
+        config = self._cached("_configs", unique_id, lambda: self.registry.load_plugin_config(unique_id))
+        return dict(config) if isinstance(config, dict) else config
+    
+    def save_plugin_config(
+        self,
+        unique_id: str,  # Plugin unique ID
+        config: Dict[str, Any]  # Configuration to save
+    ) -> bool:  # True if save succeeded
+        """Save configuration for a plugin and invalidate its cached config."""
+        try:
+            return self.registry.save_plugin_config(unique_id, config)
+        finally:
+            with self._lock:
+                self._configs.pop(unique_id, None)
+                self._configured_ids = None
+                self.version += 1
+    
+    def get_configured_plugin_ids(
+        self
+    ) -> frozenset:  # Unique IDs of all plugins with a saved configuration
+        """Get the unique IDs of all plugins that have a saved configuration."""
+        with self._lock:
+            self._check_source_version()
+            if self._configured_ids is not None:
+                self.hits += 1
+                return self._configured_ids
+            self.misses += 1
+            version = self.version
+        
+        get_ids = getattr(self.registry, "get_configured_plugin_ids", None)
+        if get_ids is not None:
+            configured_ids = frozenset(get_ids())
+        else:
+            # Derive the set from the (cached) per-plugin configs
+            configured_ids = frozenset(
+                plugin.get_unique_id()
+                for category in self.get_categories_with_plugins()
+                for plugin in self.get_plugins_by_category(category)
+                if self.load_plugin_config(plugin.get_unique_id())
+            )
+        with self._lock:
+            if self.version == version:
+                self._configured_ids = configured_ids
+        return configured_ids
+    
+    def refresh(self):
+        """Drop all cached metadata and configurations."""
+        with self._lock:
+            self._source_version = getattr(self.registry, "version", None)
+            self._clear()
+            self.version += 1
+    
+    def stats(
+        self
+    ) -> Dict[str, Any]:  # Hit/miss counters and cache sizes
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "plugins": len(self._plugins),
+                "categories": len(self._plugins_by_category),
+                "configs": len(self._configs),
+                "version": self.version
+            }
+    
+    def __getattr__(self, name):
+        # Delegate anything else (e.g. `register_plugin_manager`) to the wrapped registry
+        if name == "registry":
+            raise AttributeError(name)
+        return getattr(self.registry, name)
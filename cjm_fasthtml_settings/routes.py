@@ -3,25 +3,54 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/routes.ipynb.
 
 # %% auto 0
-__all__ = ['config', 'settings_ar', 'RoutesConfig', 'configure_settings', 'index', 'save', 'reset', 'plugin_reset', 'plugin_save']
+__all__ = ['config', 'settings_ar', 'RoutesConfig', 'configure_settings', 'index', 'save', 'reset', 'save_field', 'group_items',
+           'search', 'plugin_reset', 'plugin_save', 'api_get_config', 'api_put_config', 'api_get_configs',
+           'api_save_configs']
 
 # %% ../nbs/routes.ipynb 3
+import hashlib
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 from fasthtml.common import *
 from fasthtml.common import FT
 
-from cjm_fasthtml_app_core.components.alerts import create_error_alert, create_success_alert
+from cjm_fasthtml_app_core.components.alerts import create_error_alert, create_success_alert, create_warning_alert
 from .core.html_ids import SettingsHtmlIds as HtmlIds
 from .core.config import DEFAULT_CONFIG_DIR
+from .core.compiled_schema import compile_schema
+from .core.cache import config_index
+from .core.storage import FileStorageBackend, get_storage_backend, set_storage_backend
 from .core.schemas import registry
+from .core.events import config_subscriptions
+from .core.watcher import start_config_watcher, stop_config_watcher
 from cjm_fasthtml_settings.core.utils import (
-    save_config,
+    load_configs,
+    aload_config,
+    asave_config,
+    asave_configs,
+    amerge_config_field,
+    get_config_revision,
+    get_config_version,
+    aget_config_revision,
+    asave_config_if_revision,
+    run_storage_io,
+    configure_storage_executor,
+    configure_write_behind,
     get_default_values_from_schema,
-    convert_form_data_to_config,
+    get_form_converter,
+    convert_form_field,
+    prepare_configs,
+    validate_config_data,
+)
+from cjm_fasthtml_settings.components.forms import (
+    create_settings_form_container,
+    create_settings_field,
+    configure_form_cache,
+    REVISION_FIELD,
 )
-from .components.forms import create_settings_form_container
 
 # %% ../nbs/routes.ipynb 4
 # Optional: Import error handling library if available
@@ -41,17 +70,45 @@ class RoutesConfig:
     menu_section_title: str = "Settings"
     wrap_with_layout: Optional[Callable] = None  # Optional function to wrap full page content
     plugin_registry: Optional[Any] = None  # Optional plugin registry (must implement PluginRegistryProtocol)
+    use_etags: bool = False  # Send ETags and answer matching conditional requests with 304 (opt-in)
+    lazy_groups: bool = False  # Load the items of collapsed sidebar groups on first expansion
+    field_saves: bool = False  # Save each schema field on change through `save_field`
+    watch_config_dir: bool = False  # Push external changes to `config_dir` to the config caches (see `core.watcher`)
 
 # Module-level config instance
 config = RoutesConfig()
 
 # %% ../nbs/routes.ipynb 9
+# Directory watched on behalf of `config.watch_config_dir`
+_watched_config_dir: Optional[str] = None
+
+def _sync_config_watcher():
+    """Start or move the config directory watcher to match the routes configuration."""
+    global _watched_config_dir
+    target = os.fspath(config.config_dir) if config.watch_config_dir else None
+    if target == _watched_config_dir:
+        return
+    if _watched_config_dir is not None:
+        stop_config_watcher(_watched_config_dir)
+    if target is not None:
+        start_config_watcher(config.config_dir)
+    _watched_config_dir = target
+
 def configure_settings(
     config_dir: Path = None,  # Directory for storing configuration files
     wrap_with_layout: Callable = None,  # Function to wrap full page content with app layout
     plugin_registry = None,  # Optional plugin registry (must implement PluginRegistryProtocol)
     default_schema: str = "general",  # Default schema to display
-    menu_section_title: str = "Settings"  # Title for the settings menu section
+    menu_section_title: str = "Settings",  # Title for the settings menu section
+    storage_workers: Optional[int] = None,  # Max concurrent storage operations for async routes
+    storage_backend = None,  # Optional storage backend (must implement StorageBackendProtocol)
+    form_cache_size: Optional[int] = None,  # Enable the rendered form cache with this many entries (0 disables)
+    use_etags: Optional[bool] = None,  # Send ETags and answer matching requests with 304
+    cache_plugin_registry: bool = False,  # Wrap the plugin registry in a `CachedPluginRegistry`
+    lazy_groups: Optional[bool] = None,  # Load the items of collapsed sidebar groups on first expansion
+    field_saves: Optional[bool] = None,  # Save each schema field on change through `save_field`
+    write_behind_delay: Optional[float] = None,  # Queue saves and write them after this many idle seconds (0 disables)
+    watch_config_dir: Optional[bool] = None  # Watch `config_dir` for external changes instead of stat-checking each read
 ) -> RoutesConfig:  # Configured RoutesConfig instance
     """Configure the settings system with a single function call."""
     if config_dir is not None:
@@ -60,10 +117,31 @@ def configure_settings(
         config.wrap_with_layout = wrap_with_layout
     if plugin_registry is not None:
         config.plugin_registry = plugin_registry
+    if cache_plugin_registry and config.plugin_registry is not None:
+        from cjm_fasthtml_settings.plugins import CachedPluginRegistry
+        if not isinstance(config.plugin_registry, CachedPluginRegistry):
+            config.plugin_registry = CachedPluginRegistry(config.plugin_registry)
     if default_schema is not None:
         config.default_schema = default_schema
     if menu_section_title is not None:
         config.menu_section_title = menu_section_title
+    if storage_workers is not None:
+        configure_storage_executor(storage_workers)
+    if storage_backend is not None:
+        set_storage_backend(storage_backend)
+    if form_cache_size is not None:
+        configure_form_cache(form_cache_size)
+    if use_etags is not None:
+        config.use_etags = use_etags
+    if lazy_groups is not None:
+        config.lazy_groups = lazy_groups
+    if field_saves is not None:
+        config.field_saves = field_saves
+    if write_behind_delay is not None:
+        configure_write_behind(write_behind_delay)
+    if watch_config_dir is not None:
+        config.watch_config_dir = watch_config_dir
+    _sync_config_watcher()
     
     return config
 
@@ -74,18 +152,145 @@ def _resolve_schema(
     """Resolve schema from ID using the registry."""
     return registry.resolve_schema(id)
 
-# %% ../nbs/routes.ipynb 16
+# %% ../nbs/routes.ipynb 15
+# Memoized MasterDetail instance and the state it was built from
+_master_detail_cache: Dict[str, Any] = {"key": None, "instance": None}
+_master_detail_lock = threading.Lock()
+_plugin_config_version = 0  # Incremented by `plugin_save` so plugin badges are refreshed
+
+def _get_master_detail_key() -> tuple:  # State the settings MasterDetail depends on
+    """Build the cache key for the settings MasterDetail instance."""
+    from cjm_fasthtml_settings.components.master_detail_adapter import get_plugin_registry_state
+    
+    storage_backend = get_storage_backend()
+    plugin_registry = config.plugin_registry
+    return (
+        registry.version,
+        id(storage_backend),
+        # The file backend returns the same frozenset object until the directory changes
+        storage_backend.get_configured_ids(config.config_dir),
+        os.fspath(config.config_dir),
+        config.default_schema,
+        config.menu_section_title,
+        config.lazy_groups,
+        config.field_saves,
+        id(plugin_registry) if plugin_registry is not None else None,
+        get_plugin_registry_state(plugin_registry),
+        _plugin_config_version
+    )
+
+def _get_master_detail():  # Cached or newly built MasterDetail instance
+    """Get the settings MasterDetail, rebuilding it only when its inputs changed."""
+    from cjm_fasthtml_settings.components.master_detail_adapter import create_settings_master_detail
+    
+    key = _get_master_detail_key()
+    with _master_detail_lock:
+        if _master_detail_cache["key"] != key:
+            _master_detail_cache["instance"] = create_settings_master_detail(
+                schemas=registry.get_all(),
+                config_dir=config.config_dir,
+                save_route_fn=lambda schema_id: save.to(id=schema_id),
+                reset_route_fn=lambda schema_id: reset.to(id=schema_id),
+                default_schema=config.default_schema,
+                menu_section_title=config.menu_section_title,
+                plugin_registry=config.plugin_registry,
+                plugin_save_route_fn=lambda plugin_id: plugin_save.to(id=plugin_id),
+                plugin_reset_route_fn=lambda plugin_id: plugin_reset.to(id=plugin_id),
+                group_items_route_fn=(lambda group_id: group_items.to(id=group_id)) if config.lazy_groups else None,
+                field_patch_route_fn=_get_field_patch_url if config.field_saves else None
+            )
+            _master_detail_cache["key"] = key
+        return _master_detail_cache["instance"]
+
+# %% ../nbs/routes.ipynb 17
+# Request headers that select between the full page and the detail fragment
+_ETAG_VARY = "HX-Request, HX-Target, HX-History-Restore-Request"
+
+def _make_etag(
+    *parts  # Values the response depends on
+) -> str:  # Weak ETag header value
+    """Build a weak ETag from the state a response was rendered from."""
+    return f'W/"{hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()}"'
+
+def _get_configured_ids_version() -> Any:  # Token that changes when the set of configured schemas changes
+    """Get a cheap version token for the sidebar's configured badges."""
+    storage_backend = get_storage_backend()
+    configured_ids = storage_backend.get_configured_ids(config.config_dir)
+    if isinstance(storage_backend, FileStorageBackend):
+        # The lookup above refreshed the directory index, so its generation is current
+        return config_index.generation
+    return hash(configured_ids)
+
+def _get_view_etag(
+    view: str,  # Kind of response ("page", "detail", "reset", ...)
+    id: str,  # Schema or plugin ID being shown
+    schema: Optional[Dict[str, Any]] = None,  # Resolved schema (None when not known)
+    include_config: bool = True  # Whether the response shows the saved configuration and sidebar
+) -> Optional[str]:  # ETag, or None if ETags are disabled
+    """Build the ETag for a settings view."""
+    if not config.use_etags:
+        return None
+    from cjm_fasthtml_settings.components.master_detail_adapter import get_plugin_registry_state
+    
+    plugin_registry = config.plugin_registry
+    parts = (
+        view,
+        id,
+        registry.version,
+        compile_schema(schema).fingerprint if schema is not None else None,
+        os.fspath(config.config_dir),
+        get_plugin_registry_state(plugin_registry),
+        config.field_saves,
+    )
+    if include_config:
+        parts += (
+            get_config_version(id, config.config_dir),
+            _get_configured_ids_version(),
+            config.default_schema,
+            config.menu_section_title,
+            config.lazy_groups,
+            _plugin_config_version,
+        )
+    return _make_etag(*parts)
+
+def _etag_matches(
+    request,  # FastHTML request object
+    etag: Optional[str]  # Current ETag of the requested view
+) -> bool:  # True if the client already has this version
+    """Check the request's `If-None-Match` header against an ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not etag or not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in header.split(","))
+
+def _etag_headers(
+    etag: Optional[str]  # ETag of the response (None to add no headers)
+) -> tuple:  # HttpHeader components to return alongside the content
+    """Build the caching headers for a response."""
+    if not etag:
+        return ()
+    return (HttpHeader("ETag", etag), HttpHeader("Cache-Control", "no-cache"), HttpHeader("vary", _ETAG_VARY))
+
+def _not_modified(
+    etag: str  # ETag the client already has
+) -> Response:  # Empty 304 response
+    """Build a `304 Not Modified` response."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache", "Vary": _ETAG_VARY})
+
+# %% ../nbs/routes.ipynb 20
 # Module-level API router
 settings_ar = APIRouter(prefix="/settings")
 
-# %% ../nbs/routes.ipynb 17
+# %% ../nbs/routes.ipynb 21
 @settings_ar
 def index(
     request,  # FastHTML request object
     id: str = None  # Schema ID to display (defaults to config.default_schema)
 ) -> FT:  # Settings page content
     """Main settings page."""
-    from cjm_fasthtml_settings.components.master_detail_adapter import create_settings_master_detail
     from cjm_fasthtml_app_core.core.htmx import is_htmx_request
     from cjm_fasthtml_interactions.core.html_ids import InteractionHtmlIds
     
@@ -94,23 +299,25 @@ def index(
         
     schema, _ = _resolve_schema(id)
     
-    # Create the master-detail instance
-    settings_md = create_settings_master_detail(
-        schemas=registry.get_all(),
-        config_dir=config.config_dir,
-        save_route_fn=lambda schema_id: save.to(id=schema_id),
-        reset_route_fn=lambda schema_id: reset.to(id=schema_id),
-        default_schema=config.default_schema,
-        menu_section_title=config.menu_section_title,
-        plugin_registry=config.plugin_registry,
-        plugin_save_route_fn=lambda plugin_id: plugin_save.to(id=plugin_id),
-        plugin_reset_route_fn=lambda plugin_id: plugin_reset.to(id=plugin_id)
-    )
+    hx_target = request.headers.get('HX-Target')
+    is_detail_request = is_htmx_request(request) and hx_target == InteractionHtmlIds.MASTER_DETAIL_DETAIL
+    
+    # Answer unchanged views with 304 before building anything (plugin views aren't versioned)
+    etag = None
+    # Layout-wrapped full pages may show per-request content, so they are never answered with 304
+    is_layout_page = config.wrap_with_layout is not None and not is_htmx_request(request)
+    if schema is not None and not is_layout_page:
+        view = "detail" if is_detail_request else ("page" if is_htmx_request(request) else "full")
+        etag = _get_view_etag(view, id, schema)
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+    
+    # Reuse the master-detail instance unless schemas, plugins or saved configs changed
+    settings_md = _get_master_detail()
     
     # For HTMX requests targeting the detail area specifically, return just the detail content
     # This happens when clicking between settings items within the interface
-    hx_target = request.headers.get('HX-Target')
-    if is_htmx_request(request) and hx_target == InteractionHtmlIds.MASTER_DETAIL_DETAIL:
+    if is_detail_request:
         item = settings_md.get_item(id)
         if item:
             ctx = settings_md.create_context(request, request.session, item)
@@ -122,7 +329,7 @@ def index(
                 item_route_func=lambda iid: index.to(id=iid)
             )
             
-            return Div(content, master_oob)
+            return Div(content, master_oob), *_etag_headers(etag)
     
     # For full page requests or HTMX requests from outside (e.g., navbar),
     # render the complete interface
@@ -135,10 +342,21 @@ def index(
     
     # Wrap with layout if provided and not an HTMX request
     if config.wrap_with_layout and not is_htmx_request(request):
-        return config.wrap_with_layout(full_interface)
-    return full_interface
+        return config.wrap_with_layout(full_interface), *_etag_headers(etag)
+    return full_interface, *_etag_headers(etag)
+
+# %% ../nbs/routes.ipynb 23
+def _parse_revision(
+    value: Any  # Submitted revision (form field or `If-Match` header)
+) -> Optional[int]:  # Revision number, or None if missing or malformed
+    """Parse a submitted revision number."""
+    if value is None:
+        return None
+    try:
+        return int(str(value).strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        return None
 
-# %% ../nbs/routes.ipynb 18
 @settings_ar
 async def save(
     request,  # FastHTML request object
@@ -152,25 +370,55 @@ async def save(
         return create_error_alert(error_msg)
     
     form_data = await request.form()
-    config_data = convert_form_data_to_config(form_data, schema)
+    config_data = get_form_converter(schema)(form_data)
+    # The hidden revision field isn't part of the configuration
+    expected_revision = _parse_revision(config_data.pop(REVISION_FIELD, None))
     
-    # Save configuration
-    if save_config(id, config_data, config.config_dir):
-        alert_msg = create_success_alert(f"Configuration saved for {schema.get('title')}")
+    # Same checks as single-field saves: nothing out of range reaches the file
+    errors = validate_config_data(config_data, schema)
+    if errors:
         return create_settings_form_container(
             schema=schema,
             values=config_data,
             post_url=save.to(id=id),
             reset_url=reset.to(id=id),
-            alert_message=alert_msg,
-            target_id=InteractionHtmlIds.MASTER_DETAIL_DETAIL
+            alert_message=create_error_alert(f"Invalid {schema.get('title')} configuration: {'; '.join(errors)}"),
+            target_id=InteractionHtmlIds.MASTER_DETAIL_DETAIL,
+            field_patch_url=_get_field_patch_url(id) if config.field_saves else None,
+            revision=expected_revision
+        )
+    
+    # Save configuration on the storage executor to keep the event loop free
+    saved, revision = await asave_config_if_revision(id, config_data, expected_revision, config.config_dir)
+    if saved:
+        alert_msg = create_success_alert(f"Configuration saved for {schema.get('title')}")
+        values = config_data
+    elif revision is not None:
+        # Saved by someone else since this form was rendered: show their values instead of overwriting them
+        alert_msg = create_warning_alert(
+            f"{schema.get('title')} was changed by someone else. Your changes were not saved.",
+            "The form now shows the latest saved values. Review them and save again."
         )
+        saved_config = await aload_config(id, config.config_dir)
+        values = {**get_default_values_from_schema(schema), **saved_config}
     else:
         return create_error_alert(f"Failed to save {schema.get('title')} configuration")
+    
+    return create_settings_form_container(
+        schema=schema,
+        values=values,
+        post_url=save.to(id=id),
+        reset_url=reset.to(id=id),
+        alert_message=alert_msg,
+        target_id=InteractionHtmlIds.MASTER_DETAIL_DETAIL,
+        field_patch_url=_get_field_patch_url(id) if config.field_saves else None,
+        revision=revision
+    )
 
-# %% ../nbs/routes.ipynb 19
+# %% ../nbs/routes.ipynb 24
 @settings_ar
 def reset(
+    request,  # FastHTML request object
     id: str  # Schema ID to reset
 ) -> FT:  # Response with form or error
     """Reset configuration to defaults handler."""
@@ -180,8 +428,14 @@ def reset(
     if error_msg:
         return create_error_alert(error_msg)
     
-    # Use only default values
+    # The form carries the saved revision, so the ETag depends on the saved configuration too
+    etag = _get_view_etag("reset", id, schema)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    # Use only default values; saving them still replaces the current revision
     values = get_default_values_from_schema(schema)
+    revision = get_config_revision(id, config.config_dir)
     alert_msg = create_success_alert("Configuration reset to defaults")
     
     return create_settings_form_container(
@@ -190,12 +444,117 @@ def reset(
         post_url=save.to(id=id),
         reset_url=reset.to(id=id),
         alert_message=alert_msg,
-        target_id=InteractionHtmlIds.MASTER_DETAIL_DETAIL
-    )
+        target_id=InteractionHtmlIds.MASTER_DETAIL_DETAIL,
+        field_patch_url=_get_field_patch_url(id) if config.field_saves else None,
+        revision=revision
+    ), *_etag_headers(etag)
+
+# %% ../nbs/routes.ipynb 25
+def _get_field_patch_url(
+    id: str  # Schema ID whose fields are saved
+) -> str:  # URL of the single-field save route
+    """Build the single-field save URL for a schema."""
+    return save_field.to(id=id)
+
+def _field_alert_oob(
+    alert: FT  # Success or error alert
+) -> FT:  # Out-of-band wrapper inserting the alert at the top of the detail area
+    """Wrap an alert so it is swapped into the detail area alongside a field fragment."""
+    from cjm_fasthtml_interactions.core.html_ids import InteractionHtmlIds
+    return Div(alert, hx_swap_oob=f"afterbegin:{HtmlIds.as_selector(InteractionHtmlIds.MASTER_DETAIL_DETAIL)}")
+
+@settings_ar("/save_field", methods=["patch"])
+async def save_field(
+    request,  # FastHTML request object
+    id: str  # Schema ID the field belongs to
+):  # Updated field input with an out-of-band alert
+    """Save a single field handler."""
+    schema, error_msg = _resolve_schema(id)
+    if error_msg:
+        return _field_alert_oob(create_error_alert(error_msg)), HtmxResponseHeaders(reswap="none")
+    
+    form_data = await request.form()
+    field_name = form_data.get("field")
+    if field_name not in compile_schema(schema).field_kinds:
+        return (_field_alert_oob(create_error_alert(f"Unknown field '{field_name}' for {schema.get('title')}")),
+                HtmxResponseHeaders(reswap="none"))
+    
+    # Coerce only this field, merge it into the saved configuration and validate the result
+    value = convert_form_field(schema, field_name, form_data)
+    saved, errors, revision = await amerge_config_field(id, field_name, value, config.config_dir, schema=schema)
+    if errors:
+        return (_field_alert_oob(create_error_alert(f"Invalid {schema.get('title')} configuration: {'; '.join(errors)}")),
+                HtmxResponseHeaders(reswap="none"))
+    if not saved:
+        return (_field_alert_oob(create_error_alert(f"Failed to save {schema.get('title')} configuration")),
+                HtmxResponseHeaders(reswap="none"))
+    
+    title = schema["properties"][field_name].get("title", field_name)
+    response = [create_settings_field(schema, field_name, value, _get_field_patch_url(id)),
+                _field_alert_oob(create_success_alert(f"{title} saved"))]
+    # The field save created a new revision; keep the form's full save from conflicting with it
+    if revision is not None:
+        response.append(Input(type="hidden", name=REVISION_FIELD, value=str(revision),
+                              id=HtmlIds.CONFIG_REVISION, hx_swap_oob="true"))
+    return tuple(response)
+
+# %% ../nbs/routes.ipynb 26
+@settings_ar
+def group_items(
+    id: str  # Sidebar group ID
+) -> FT:  # Expanded group contents or error
+    """Load the items of a lazily rendered sidebar group."""
+    settings_md = _get_master_detail()
+    render_group_items = getattr(settings_md, "render_group_items", None)
+    group = render_group_items(id, None, lambda iid: index.to(id=iid)) if render_group_items else None
+    if group is None:
+        return create_error_alert(f"Settings group '{id}' not found")
+    return group
+
+# %% ../nbs/routes.ipynb 27
+def _render_search_results(
+    hits: list  # SearchHit results from the registry's search index
+) -> FT:  # List of links to the matching settings
+    """Render search hits as links that open the matching settings in the detail area."""
+    from cjm_fasthtml_interactions.core.html_ids import InteractionHtmlIds
+    from cjm_fasthtml_daisyui.components.navigation.menu import menu
+    from cjm_fasthtml_tailwind.utilities.effects import opacity
+    from cjm_fasthtml_tailwind.utilities.flexbox_and_grid import flex_display, flex_direction, items, gap
+    from cjm_fasthtml_tailwind.utilities.sizing import w
+    from cjm_fasthtml_tailwind.utilities.typography import font_size
+    from cjm_fasthtml_tailwind.core.base import combine_classes
+    
+    results = []
+    for hit in hits:
+        url = index.to(id=hit.schema_id)
+        results.append(Li(A(
+            Span(hit.title),
+            Span(hit.schema_title if hit.field else hit.source, cls=combine_classes(font_size.xs, opacity(60))),
+            href=url,
+            hx_get=url,
+            hx_target=HtmlIds.as_selector(InteractionHtmlIds.MASTER_DETAIL_DETAIL),
+            hx_swap="innerHTML",
+            hx_push_url="true",
+            cls=combine_classes(flex_display, flex_direction.col, items.start, gap(0))
+        )))
+    if not results:
+        results.append(Li(Span("No matching settings", cls=str(opacity(60)))))
+    return Ul(*results, id=HtmlIds.SEARCH_RESULTS, cls=combine_classes(menu, w.full))
 
-# %% ../nbs/routes.ipynb 21
+@settings_ar
+def search(
+    q: str = "",  # Search text
+    limit: int = 20  # Maximum number of results
+) -> FT:  # List of matching settings
+    """Search settings by property names, titles, descriptions and enum labels."""
+    if config.plugin_registry is not None:
+        registry.search_index.sync_plugins(config.plugin_registry)
+    return _render_search_results(registry.search_index.search(q, limit=max(1, min(limit, 100))))
+
+# %% ../nbs/routes.ipynb 29
 @settings_ar
 def plugin_reset(
+    request,  # FastHTML request object
     id: str  # Plugin unique ID
 ) -> FT:  # Response with form or error
     """Reset plugin configuration to defaults handler."""
@@ -209,6 +568,10 @@ def plugin_reset(
         return create_error_alert("Plugin not found")
     
     schema = plugin_metadata.config_schema
+    etag = _get_view_etag("plugin_reset", id, schema, include_config=False)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
     values = get_default_values_from_schema(schema)
     alert_msg = create_success_alert("Configuration reset to defaults")
     
@@ -219,9 +582,24 @@ def plugin_reset(
         reset_url=plugin_reset.to(id=id),
         alert_message=alert_msg,
         target_id=InteractionHtmlIds.MASTER_DETAIL_DETAIL
-    )
+    ), *_etag_headers(etag)
+
+# %% ../nbs/routes.ipynb 30
+def _save_plugin_config(
+    plugin_id: str,  # Plugin unique ID
+    config_data: Dict[str, Any]  # Configuration to save
+) -> bool:  # True if the plugin registry saved the configuration
+    """Save a plugin configuration and publish it to the plugin's config subscribers."""
+    plugin_registry = config.plugin_registry
+    if not config_subscriptions.has_subscribers(plugin_id, config.config_dir):
+        return plugin_registry.save_plugin_config(plugin_id, config_data)
+    with config_subscriptions.ordered((plugin_id,), config.config_dir):
+        old = plugin_registry.load_plugin_config(plugin_id) or {}
+        saved = plugin_registry.save_plugin_config(plugin_id, config_data)
+        if saved:
+            config_subscriptions.publish(plugin_id, config_data, config.config_dir, source="plugin", old=old)
+    return saved
 
-# %% ../nbs/routes.ipynb 22
 @settings_ar
 async def plugin_save(
     request,  # FastHTML request object
@@ -229,6 +607,7 @@ async def plugin_save(
 ) -> FT:  # Response with form or error
     """Save plugin configuration handler."""
     from cjm_fasthtml_interactions.core.html_ids import InteractionHtmlIds
+    global _plugin_config_version
     
     if not config.plugin_registry:
         return create_error_alert("Plugin system not configured")
@@ -239,10 +618,11 @@ async def plugin_save(
     
     form_data = await request.form()
     schema = plugin_metadata.config_schema
-    config_data = convert_form_data_to_config(form_data, schema)
+    config_data = get_form_converter(schema)(form_data)
     
     # Save configuration
-    if config.plugin_registry.save_plugin_config(id, config_data):
+    if await run_storage_io(_save_plugin_config, id, config_data):
+        _plugin_config_version += 1
         alert_msg = create_success_alert(f"Configuration saved for {plugin_metadata.title}")
         return create_settings_form_container(
             schema=schema,
@@ -254,3 +634,178 @@ async def plugin_save(
         )
     else:
         return create_error_alert("Failed to save configuration")
+
+# %% ../nbs/routes.ipynb 33
+def _resolve_api_target(
+    id: str  # Schema or plugin ID
+) -> tuple:  # (schema, plugin_metadata, error_message)
+    """Resolve a JSON API ID to a registered schema or, failing that, a plugin."""
+    schema, error_msg = _resolve_schema(id)
+    if schema is not None:
+        return schema, None, None
+    if config.plugin_registry:
+        plugin_metadata = config.plugin_registry.get_plugin(id)
+        if plugin_metadata:
+            return plugin_metadata.config_schema, plugin_metadata, None
+    return None, None, error_msg
+
+def _api_error(
+    status_code: int,  # HTTP status code
+    message: str,  # Error message
+    **extra  # Additional fields for the error body
+) -> JSONResponse:  # JSON error response
+    """Build a JSON error response."""
+    return JSONResponse({"error": message, **extra}, status_code=status_code)
+
+def _revision_headers(
+    revision: Optional[int]  # Revision of the configuration (None if not tracked)
+) -> Optional[Dict[str, str]]:  # ETag header clients can send back in `If-Match`
+    """Build the headers exposing a configuration's revision."""
+    return {"ETag": f'"{revision}"'} if revision is not None else None
+
+def _load_saved_configs(
+    schema_ids: list,  # IDs of registered schemas
+    plugin_ids: list  # IDs of plugins
+) -> Dict[str, Dict[str, Any]]:  # Saved configurations by ID (unsaved schemas omitted)
+    """Load saved schema configurations in one backend call, plus any plugin configurations."""
+    saved = load_configs(schema_ids, config.config_dir) if schema_ids else {}
+    for plugin_id in plugin_ids:
+        saved[plugin_id] = config.plugin_registry.load_plugin_config(plugin_id)
+    return saved
+
+@settings_ar("/api/config", methods=["get"])
+async def api_get_config(
+    id: str  # Schema or plugin ID
+) -> JSONResponse:  # Configuration values with defaults merged in
+    """Get one configuration as JSON."""
+    schema, plugin_metadata, error_msg = _resolve_api_target(id)
+    if schema is None:
+        return _api_error(404, error_msg)
+    
+    schema_ids, plugin_ids = ([], [id]) if plugin_metadata else ([id], [])
+    # Plugin registries don't track revisions
+    revision = None if plugin_metadata else await aget_config_revision(id, config.config_dir)
+    saved = (await run_storage_io(_load_saved_configs, schema_ids, plugin_ids)).get(id) or {}
+    return JSONResponse({
+        "id": id,
+        "values": {**compile_schema(schema).default_values(), **saved},
+        "configured": bool(saved),
+        "revision": revision
+    }, headers=_revision_headers(revision))
+
+@settings_ar("/api/config", methods=["put"])
+async def api_put_config(
+    request,  # Request with a JSON object body
+    id: str  # Schema or plugin ID
+) -> JSONResponse:  # Saved configuration values with defaults merged in
+    """Validate and save one configuration from JSON."""
+    global _plugin_config_version
+    
+    schema, plugin_metadata, error_msg = _resolve_api_target(id)
+    if schema is None:
+        return _api_error(404, error_msg)
+    
+    try:
+        config_data = await request.json()
+    except ValueError:
+        return _api_error(400, "Request body must be valid JSON")
+    
+    # Same conversion and validation as the bulk endpoint, so both accept exactly the same bodies
+    prepared, errors = prepare_configs({id: config_data}, {id: schema})
+    if errors:
+        return _api_error(422, "Invalid configuration", details=errors[id])
+    config_data = prepared[id]
+    
+    revision = None
+    if plugin_metadata:
+        saved = await run_storage_io(_save_plugin_config, id, config_data)
+        if saved:
+            _plugin_config_version += 1
+    else:
+        # `If-Match` carries the revision the client edited; a stale one is rejected instead of overwriting
+        if_match = request.headers.get("if-match")
+        expected_revision = None if if_match in (None, "*") else _parse_revision(if_match)
+        if if_match not in (None, "*") and expected_revision is None:
+            return _api_error(412, "If-Match must be a configuration revision",
+                              revision=await aget_config_revision(id, config.config_dir))
+        saved, revision = await asave_config_if_revision(id, config_data, expected_revision, config.config_dir)
+        if not saved and revision is not None:
+            return _api_error(412, f"'{id}' configuration was changed since revision {expected_revision}",
+                              revision=revision)
+        if saved and revision is None:
+            revision = await aget_config_revision(id, config.config_dir)
+    if not saved:
+        return _api_error(500, f"Failed to save '{id}' configuration")
+    
+    return JSONResponse({
+        "id": id,
+        "values": {**compile_schema(schema).default_values(), **config_data},
+        "revision": revision
+    }, headers=_revision_headers(revision))
+
+@settings_ar("/api/configs", methods=["get"])
+async def api_get_configs(
+    ids: str = None  # Comma-separated schema or plugin IDs (defaults to all registered schemas)
+) -> JSONResponse:  # Configurations by ID, plus errors for IDs that could not be resolved
+    """Get several configurations as JSON."""
+    requested = [i.strip() for i in ids.split(",") if i.strip()] if ids else registry.list_schema_ids()
+    
+    schemas, schema_ids, plugin_ids, errors = {}, [], [], {}
+    for config_id in requested:
+        schema, plugin_metadata, error_msg = _resolve_api_target(config_id)
+        if schema is None:
+            errors[config_id] = error_msg
+            continue
+        schemas[config_id] = schema
+        (plugin_ids if plugin_metadata else schema_ids).append(config_id)
+    
+    saved = await run_storage_io(_load_saved_configs, schema_ids, plugin_ids)
+    configs = {
+        config_id: {**compile_schema(schema).default_values(), **(saved.get(config_id) or {})}
+        for config_id, schema in schemas.items()
+    }
+    return JSONResponse({"configs": configs, "errors": errors})
+
+@settings_ar("/api/configs", methods=["post"])
+async def api_save_configs(
+    request  # Request with a JSON object body mapping IDs to configurations
+) -> JSONResponse:  # IDs that were saved
+    """Validate and save several configurations from JSON in one batched write."""
+    global _plugin_config_version
+    
+    try:
+        configs = await request.json()
+    except ValueError:
+        return _api_error(400, "Request body must be valid JSON")
+    if not isinstance(configs, dict):
+        return _api_error(400, "Request body must be a JSON object mapping IDs to configurations")
+    
+    schemas, plugin_ids, errors = {}, [], {}
+    for config_id in configs:
+        schema, plugin_metadata, error_msg = _resolve_api_target(config_id)
+        if schema is None:
+            errors[config_id] = [error_msg]
+            continue
+        schemas[config_id] = schema
+        if plugin_metadata:
+            plugin_ids.append(config_id)
+    
+    # Every entry is converted and validated before anything is written
+    prepared, invalid = prepare_configs({config_id: configs[config_id] for config_id in schemas}, schemas)
+    errors.update(invalid)
+    if errors:
+        return _api_error(422, "Invalid configurations", details=errors)
+    
+    schema_configs = {config_id: prepared[config_id] for config_id in prepared if config_id not in plugin_ids}
+    if schema_configs and not await asave_configs(schema_configs, config.config_dir):
+        return _api_error(500, "Failed to save configurations")
+    
+    # Plugin registries only save one configuration at a time
+    failed = [plugin_id for plugin_id in plugin_ids
+              if not await run_storage_io(_save_plugin_config, plugin_id, prepared[plugin_id])]
+    if plugin_ids:
+        _plugin_config_version += 1
+    if failed:
+        return _api_error(500, "Failed to save plugin configurations", failed=failed)
+    
+    return JSONResponse({"saved": list(prepared)})